@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
+import base64
+import bisect
+import hashlib
+import json
+import os
+import threading
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import IO, AsyncIterator, Dict, Iterable, List, Mapping, Optional, Set, Tuple
 
 import sys
 
@@ -13,16 +20,69 @@ REPO_ROOT = CURRENT_DIR.parent
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-from fastapi import FastAPI, HTTPException, Query
-
-from glossary_utils import safe_load_path
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+
+from glossary_utils import (
+    SNAPSHOT_FILENAME,
+    BM25Index,
+    EncodedTerms,
+    FacetIndex,
+    PrefixIndex,
+    RefreshResult,
+    SharedTermMap,
+    SharedTermReader,
+    StoreSnapshot,
+    SubstringIndex,
+    TermStore,
+    cached_load_path,
+    encode_json,
+    load_snapshot,
+    publish_terms,
+    try_acquire_publisher,
+)
 
 DATA_DIR = Path(__file__).resolve().parent.parent / "data" / "terms"
+# Written by scripts/build_index.py; used for cold starts while it matches DATA_DIR.
+SNAPSHOT_PATH = Path(os.environ.get("GLOSSARY_API_SNAPSHOT", REPO_ROOT / "build" / SNAPSHOT_FILENAME))
+# Seconds between directory polls when watchfiles is unavailable; 0 disables the watcher.
+WATCH_INTERVAL_ENV = "GLOSSARY_API_WATCH_INTERVAL"
+# Directory (ideally on tmpfs such as /dev/shm) where one worker publishes
+# memory-mapped term generations that every other worker maps read-only.
+# Unset, each process keeps a private copy of the corpus.
+SHARED_DIR = os.environ.get("GLOSSARY_API_SHARED_DIR")
+# How long a reader worker waits at startup for the publisher's first generation.
+SHARED_WAIT_SECONDS = 30.0
+MAX_PAGE_SIZE = 1000
+# BM25F field weights for GET /search: names outrank matches inside definitions.
+SEARCH_BOOSTS = {"term": 3.0, "aliases": 2.5, "categories": 1.5, "short_def": 1.5, "long_def": 1.0}
+
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    interval = float(os.environ.get(WATCH_INTERVAL_ENV, "2"))
+    if _shared_reader is None or _is_publisher():
+        _store.current()
+    elif _shared_reader.current(wait=SHARED_WAIT_SECONDS) is None:
+        # HTTPException means nothing outside a request; fail startup plainly instead.
+        raise RuntimeError(
+            f"No term generation was published to {SHARED_DIR} within {SHARED_WAIT_SECONDS:g}s; "
+            "check that the publishing worker started"
+        )
+    if interval > 0 and _is_publisher():
+        _store.start_watching(interval)
+    try:
+        yield
+    finally:
+        _store.stop_watching()
+
 
 app = FastAPI(
     title="AI Glossary API",
     description="Lightweight API that exposes glossary entries maintained in YAML files.",
     version="0.1.0",
+    lifespan=_lifespan,
 )
 
 
@@ -33,61 +93,379 @@ def normalize_term(term: str) -> str:
     return slug
 
 
-@lru_cache(maxsize=1)
-def _load_terms() -> Dict[str, dict]:
+def _prepare_term(path: Path, data: Optional[dict]) -> dict:
+    data = data or {}
+    slug = normalize_term(data.get("term", path.stem))
+    data["slug"] = slug
+    data.setdefault("aliases", [])
+    data.setdefault("categories", [])
+    data.setdefault("roles", [])
+    data["_source_file"] = str(path)
+    return data
+
+
+def _load_term_file(path: Path) -> dict:
+    return _prepare_term(path, cached_load_path(path))
+
+
+def _load_from_snapshot() -> Optional[Tuple[Dict[Path, Tuple[int, int]], Dict[Path, dict]]]:
+    loaded = load_snapshot(SNAPSHOT_PATH, DATA_DIR)
+    if loaded is None:
+        return None
+    stamps, entries = loaded
+    return stamps, {path: _prepare_term(path, data) for path, data in entries.items()}
+
+
+@dataclass(frozen=True)
+class _TermCatalog:
+    terms: Mapping[str, dict]
+    query: SubstringIndex
+    ranked: BM25Index
+    facets: Dict[str, FacetIndex]
+    order: Dict[str, int]
+    # normalize_term(slug, term or alias) -> slug, for batch lookups.
+    names: Dict[str, str]
+    # slug -> the normalised names it claims, kept so reloads skip unchanged terms.
+    name_keys: Dict[str, Tuple[str, ...]]
+    suggest: PrefixIndex
+    # Response bodies are encoded once per load and served as raw bytes.
+    encoded: EncodedTerms
+    etags: Dict[str, str]
+    list_etag: str
+
+
+def _etag(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _list_etag(slugs: Iterable[str], etags: Mapping[str, str]) -> str:
+    # Derived from the per-term tags in order, so it changes with any body
+    # or with the order without hashing the whole array again.
+    return _etag("".join(etags[slug] for slug in slugs).encode("ascii"))
+
+
+def _facet_values(term: dict) -> Dict[str, List[str]]:
+    return {
+        "category": term.get("categories", []),
+        "role": term.get("roles", []),
+        "status": [str(term.get("status", ""))],
+        "alias": term.get("aliases", []),
+    }
+
+
+def _suggest_rows(slug: str, term: Mapping[str, object]) -> List[Tuple[str, str]]:
+    names = [str(term.get("term") or slug), *term.get("aliases", [])]
+    return [(name, slug) for name in names]
+
+
+def _name_keys(term: Mapping[str, object]) -> Tuple[str, ...]:
+    return tuple(normalize_term(str(value)) for value in [term.get("term") or "", *term.get("aliases", [])])
+
+
+def _name_table(terms: Mapping[str, dict], name_keys: Mapping[str, Tuple[str, ...]]) -> Dict[str, str]:
+    alias_names: Dict[str, str] = {}
+    for slug in terms:
+        for name in name_keys[slug]:
+            alias_names.setdefault(name, slug)
+    # Canonical slugs win over aliases that normalise to the same name.
+    return {**alias_names, **{slug: slug for slug in terms}}
+
+
+def _catalog_from_terms(terms: Mapping[str, dict], encoded: Optional[EncodedTerms] = None) -> _TermCatalog:
+    if encoded is None:
+        encoded = EncodedTerms.pack(terms)
+    suggest_rows: List[Tuple[str, str]] = []
+    facets = {name: FacetIndex() for name in ("category", "role", "status", "alias")}
+    query_fields: Dict[str, List[str]] = {}
+    ranked_fields: Dict[str, Dict[str, str]] = {}
+    name_keys: Dict[str, Tuple[str, ...]] = {}
+    for slug, term in terms.items():
+        for name, values in _facet_values(term).items():
+            facets[name].add(slug, values)
+        query_fields[slug] = _query_fields(term)
+        ranked_fields[slug] = _ranked_fields(term)
+        suggest_rows.extend(_suggest_rows(slug, term))
+        name_keys[slug] = _name_keys(term)
+    etags = {slug: _etag(encoded[slug]) for slug in terms}
+    return _TermCatalog(
+        terms=terms,
+        query=SubstringIndex(query_fields),
+        ranked=BM25Index(ranked_fields, SEARCH_BOOSTS),
+        facets=facets,
+        order={slug: position for position, slug in enumerate(terms)},
+        names=_name_table(terms, name_keys),
+        name_keys=name_keys,
+        suggest=PrefixIndex(suggest_rows),
+        encoded=encoded,
+        etags=etags,
+        list_etag=_list_etag(terms, etags),
+    )
+
+
+def _patch_catalog(previous: _TermCatalog, terms: Mapping[str, dict], stale: Set[str]) -> _TermCatalog:
+    """Return ``previous`` with the ``stale`` slugs dropped and re-added from ``terms``.
+
+    Only the stale terms are encoded, hashed and indexed again; every index
+    shares its untouched postings with ``previous``.
+    """
+    fresh = {slug: terms[slug] for slug in stale if slug in terms}
+    encoded = EncodedTerms.pack(terms, previous.encoded, stale)
+    etags = {slug: etag for slug, etag in previous.etags.items() if slug not in stale}
+    etags.update((slug, _etag(encoded[slug])) for slug in fresh)
+    name_keys = {slug: names for slug, names in previous.name_keys.items() if slug not in stale}
+    name_keys.update((slug, _name_keys(term)) for slug, term in fresh.items())
+    facets = {
+        name: index.replace(stale, {slug: _facet_values(term)[name] for slug, term in fresh.items()})
+        for name, index in previous.facets.items()
+    }
+    return _TermCatalog(
+        terms=terms,
+        query=previous.query.replace(stale, {slug: _query_fields(term) for slug, term in fresh.items()}),
+        ranked=previous.ranked.replace(stale, {slug: _ranked_fields(term) for slug, term in fresh.items()}),
+        facets=facets,
+        order={slug: position for position, slug in enumerate(terms)},
+        names=_name_table(terms, name_keys),
+        name_keys=name_keys,
+        suggest=previous.suggest.replace(
+            stale, [row for slug, term in fresh.items() for row in _suggest_rows(slug, term)]
+        ),
+        encoded=encoded,
+        etags=etags,
+        list_etag=_list_etag(terms, etags),
+    )
+
+
+def _catalog_sections(catalog: _TermCatalog) -> Dict[str, bytes]:
+    """Pack the indexes of ``catalog`` so reader workers can map them (see :func:`_catalog_from_mapping`)."""
+    tables = {"names": catalog.names, "etags": catalog.etags, "list_etag": catalog.list_etag}
+    return {
+        "catalog": json.dumps(tables, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+        "query": catalog.query.pack(),
+        "ranked": catalog.ranked.pack(),
+        "suggest": catalog.suggest.pack(),
+        **{f"facet:{name}": index.pack() for name, index in catalog.facets.items()},
+    }
+
+
+def _catalog_from_mapping(mapping: SharedTermMap) -> _TermCatalog:
+    """Serve a published generation; the substring and BM25 postings stay in the mapping."""
+    sections = mapping.sections
+    tables = json.loads(bytes(sections["catalog"]))
+    return _TermCatalog(
+        terms=mapping,
+        query=SubstringIndex.from_packed(sections["query"]),
+        ranked=BM25Index.from_packed(sections["ranked"]),
+        facets={
+            name[len("facet:") :]: FacetIndex.from_packed(blob)
+            for name, blob in sections.items()
+            if name.startswith("facet:")
+        },
+        order={slug: position for position, slug in enumerate(mapping)},
+        names=tables["names"],
+        # Readers never patch a catalog; they map the next generation instead.
+        name_keys={},
+        suggest=PrefixIndex.from_packed(sections["suggest"]),
+        encoded=mapping.encoded,
+        etags=tables["etags"],
+        list_etag=tables["list_etag"],
+    )
+
+
+def _publish(catalog: _TermCatalog) -> _TermCatalog:
+    """In shared mode, publish ``catalog`` as a new generation and serve it from the mapping.
+
+    The publisher keeps its own dict-backed indexes, which reloads patch in
+    place of a rebuild; only the term bodies are served from the mapping.
+    """
+    if not SHARED_DIR:
+        return catalog
+    generation = publish_terms(Path(SHARED_DIR), catalog.terms, catalog.encoded, _catalog_sections(catalog))
+    mapping = SharedTermMap.open(Path(SHARED_DIR), generation)
+    return replace(catalog, terms=mapping, encoded=mapping.encoded)
+
+
+def _terms_by_slug(entries: Mapping[Path, dict]) -> Dict[str, dict]:
     terms: Dict[str, dict] = {}
-    for path in sorted(DATA_DIR.glob("*.yml")):
-        data = safe_load_path(path) or {}
-        slug = normalize_term(data.get("term", path.stem))
-        data["slug"] = slug
-        data.setdefault("aliases", [])
-        data.setdefault("categories", [])
-        data.setdefault("roles", [])
-        data["_source_file"] = str(path)
-        terms[slug] = data
+    for data in entries.values():
+        terms[data["slug"]] = data
     return terms
 
 
-def _terms_list() -> List[dict]:
-    return list(_load_terms().values())
+def _build_catalog(entries: Mapping[Path, dict]) -> _TermCatalog:
+    return _publish(_catalog_from_terms(_terms_by_slug(entries)))
+
+
+def _update_catalog(
+    previous: StoreSnapshot[_TermCatalog], entries: Mapping[Path, dict], changes: RefreshResult
+) -> _TermCatalog:
+    stale = {previous.entries[path]["slug"] for path in changes.modified + changes.removed}
+    stale.update(entries[path]["slug"] for path in changes.added + changes.modified)
+    return _publish(_patch_catalog(previous.view, _terms_by_slug(entries), stale))
+
+
+_store: TermStore[_TermCatalog] = TermStore(
+    DATA_DIR,
+    _build_catalog,
+    loader=_load_term_file,
+    bootstrap=_load_from_snapshot,
+    update=_update_catalog,
+)
+_shared_reader: Optional[SharedTermReader[_TermCatalog]] = (
+    SharedTermReader(Path(SHARED_DIR), _catalog_from_mapping)
+    if SHARED_DIR
+    else None
+)
+_publisher_handle: Optional[IO[str]] = None
+_publisher_elected: Optional[bool] = None
+_election_lock = threading.Lock()
+
+
+def _is_publisher() -> bool:
+    """Whether this process parses YAML itself (always true without shared mode)."""
+    global _publisher_elected, _publisher_handle
+    if not SHARED_DIR:
+        return True
+    with _election_lock:
+        if _publisher_elected is None:
+            _publisher_handle = try_acquire_publisher(Path(SHARED_DIR))
+            _publisher_elected = _publisher_handle is not None
+    return _publisher_elected
+
+
+def _catalog() -> _TermCatalog:
+    # Handlers read one catalog per request so a concurrent refresh can never
+    # mix terms from one snapshot with indexes from another.
+    if _shared_reader is None or _is_publisher():
+        return _store.current()
+    catalog = _shared_reader.current(wait=SHARED_WAIT_SECONDS)
+    if catalog is None:
+        raise HTTPException(status_code=503, detail="Term snapshot has not been published yet")
+    return catalog
+
+
+def _load_terms() -> Mapping[str, dict]:
+    return _catalog().terms
 
 
 @app.get("/", tags=["metadata"])
 def read_root() -> dict:
-    terms = _terms_list()
+    catalog = _catalog()
+    facets = catalog.facets
     return {
         "name": "AI Glossary",
         "description": "Structured, citation-backed AI glossary",
-        "count": len(terms),
-        "categories": sorted({cat for term in terms for cat in term.get("categories", [])}),
-        "roles": sorted({role for term in terms for role in term.get("roles", [])}),
+        "count": len(catalog.terms),
+        "categories": list(facets["category"].values()),
+        "roles": list(facets["role"].values()),
     }
 
 
-def _matches_query(term: dict, query: str) -> bool:
+def _query_fields(term: dict) -> List[str]:
     haystack = []
     haystack.append(term.get("term", ""))
     haystack.extend(term.get("aliases", []))
     haystack.append(term.get("short_def", ""))
     haystack.extend(term.get("categories", []))
+    return haystack
+
+
+def _ranked_fields(term: Mapping[str, object]) -> Dict[str, str]:
+    return {
+        "term": str(term.get("term") or ""),
+        "aliases": " ".join(term.get("aliases") or []),
+        "categories": " ".join(term.get("categories") or []),
+        "short_def": str(term.get("short_def") or ""),
+        "long_def": str(term.get("long_def") or ""),
+    }
+
+
+def _matches_query(term: dict, query: str) -> bool:
     q = query.lower()
-    return any(q in (value or "").lower() for value in haystack)
+    return any(q in (value or "").lower() for value in _query_fields(term))
+
+
+def _split_filter(value: str) -> List[str]:
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+def _intersect(matches: Optional[Set[str]], candidates: Iterable[str]) -> Set[str]:
+    if matches is None:
+        return set(candidates)
+    return matches.intersection(candidates)
+
+
+def _matching_slugs(
+    catalog: _TermCatalog,
+    q: Optional[str],
+    category: Optional[str],
+    status: Optional[str],
+    alias: Optional[str],
+    role: Optional[str],
+) -> Optional[List[str]]:
+    """Return matching slugs in corpus order, or ``None`` when nothing filters."""
+    facets = catalog.facets
+    matches: Optional[Set[str]] = None
+
+    if q:
+        matches = _intersect(matches, catalog.query.search_set(q))
+
+    if category:
+        matches = _intersect(matches, facets["category"].lookup(_split_filter(category)))
+
+    if status:
+        matches = _intersect(matches, facets["status"].lookup([status]))
+
+    if role:
+        matches = _intersect(matches, facets["role"].lookup(_split_filter(role)))
+
+    if alias:
+        matches = _intersect(matches, facets["alias"].lookup([alias]))
+
+    if matches is None:
+        return None
+    return sorted(matches, key=catalog.order.__getitem__)
+
+
+def _encode_cursor(catalog: _TermCatalog, slug: str) -> str:
+    token = f"{catalog.order[slug]}:{slug}".encode("utf-8")
+    return base64.urlsafe_b64encode(token).decode("ascii").rstrip("=")
+
+
+def _cursor_position(catalog: _TermCatalog, cursor: str) -> int:
+    """Return the corpus position of the last term a cursor pointed at.
 
+    The slug wins when it still exists, so pages stay aligned across reloads;
+    the recorded position covers terms deleted in between.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        position, slug = base64.urlsafe_b64decode(padded).decode("utf-8").split(":", 1)
+        return catalog.order.get(slug, int(position))
+    except (ValueError, UnicodeDecodeError) as error:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from error
 
-def _matches_category(term: dict, category: str) -> bool:
-    term_categories = {value.lower() for value in term.get("categories", [])}
-    targets = {value.strip().lower() for value in category.split(",") if value.strip()}
-    return bool(term_categories & targets)
 
+def _project(term: Mapping[str, object], fields: List[str]) -> dict:
+    return {field: term[field] for field in fields if field in term}
 
-def _matches_role(term: dict, role: str) -> bool:
-    term_roles = {value.lower() for value in term.get("roles", [])}
-    targets = {value.strip().lower() for value in role.split(",") if value.strip()}
-    return bool(term_roles & targets)
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+    candidates = [value.strip() for value in header.split(",")]
+    return "*" in candidates or any(value.removeprefix("W/") == etag for value in candidates)
+
+
+def _json_bytes(request: Request, body: bytes, etag: str) -> Response:
+    headers = {"ETag": etag}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @app.get("/terms", tags=["terms"])
-def list_terms(
+def serve_terms(
+    request: Request,
     q: Optional[str] = Query(None, description="Free-text search across term names, aliases, and definitions."),
     category: Optional[str] = Query(
         None,
@@ -99,55 +477,157 @@ def list_terms(
         None,
         description="Filter by role slug (product, engineering, data_science, policy, legal, security, communications).",
     ),
-) -> List[dict]:
-    results = _terms_list()
-
-    if q:
-        results = [term for term in results if _matches_query(term, q)]
-
-    if category:
-        results = [term for term in results if _matches_category(term, category)]
-
-    if status:
-        expected = status.lower()
-        results = [term for term in results if str(term.get("status", "")).lower() == expected]
-
-    if role:
-        results = [term for term in results if _matches_role(term, role)]
-
-    if alias:
-        alias_norm = alias.lower()
-        results = [
-            term
-            for term in results
-            if any(alias_norm == value.lower() for value in term.get("aliases", []))
-        ]
-
-    return results
+    limit: Optional[int] = Query(
+        None,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Maximum number of terms to return. The next page's cursor is sent in the X-Next-Cursor header.",
+    ),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's X-Next-Cursor header."),
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated top-level fields to return for each term, e.g. slug,short_def.",
+    ),
+    output: str = Query(
+        "json",
+        alias="format",
+        pattern="^(json|ndjson)$",
+        description="Response format: a JSON array, or newline-delimited JSON streamed one term per line.",
+    ),
+) -> Response:
+    catalog = _catalog()
+    slugs = _matching_slugs(catalog, q, category, status, alias, role)
+    projection = _split_filter(fields) if fields else None
+    if slugs is None and limit is None and cursor is None and projection is None and output == "json":
+        return _json_bytes(request, catalog.encoded.array(), catalog.list_etag)
+    if slugs is None:
+        slugs = list(catalog.encoded)
+
+    headers: Dict[str, str] = {}
+    if cursor is not None:
+        start = bisect.bisect_right(slugs, _cursor_position(catalog, cursor), key=catalog.order.__getitem__)
+        slugs = slugs[start:]
+    if limit is not None and len(slugs) > limit:
+        slugs = slugs[:limit]
+        next_cursor = _encode_cursor(catalog, slugs[-1])
+        headers["X-Next-Cursor"] = next_cursor
+        headers["Link"] = f'<{request.url.include_query_params(cursor=next_cursor)}>; rel="next"'
+
+    if projection is None:
+        encode = catalog.encoded.__getitem__
+    else:
+        terms = catalog.terms
+        encode = lambda slug: encode_json(_project(terms[slug], projection))  # noqa: E731
+
+    if output == "ndjson":
+        lines = (encode(slug) + b"\n" for slug in slugs)
+        return StreamingResponse(lines, media_type="application/x-ndjson", headers=headers)
+    body = b"[" + b",".join(encode(slug) for slug in slugs) + b"]"
+    response = _json_bytes(request, body, _etag(body))
+    response.headers.update(headers)
+    return response
 
 
 @app.get("/terms/{slug}", tags=["terms"])
-def get_term(slug: str) -> dict:
-    term = _load_terms().get(slug)
-    if not term:
+def get_term(slug: str, request: Request) -> Response:
+    catalog = _catalog()
+    etag = catalog.etags.get(slug)
+    if etag is None:
         raise HTTPException(status_code=404, detail="Term not found")
-    return term
+    return _json_bytes(request, catalog.encoded[slug], etag)
+
+
+@app.get("/search", tags=["terms"])
+def search_terms(
+    q: str = Query(..., min_length=1, description="Free-text query; small typos are tolerated."),
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE, description="Maximum number of ranked results."),
+) -> dict:
+    """Rank terms by BM25 relevance over names, aliases, categories and definitions."""
+    catalog = _catalog()
+    ranked = catalog.ranked.search(q, limit=limit)
+    terms = catalog.terms
+    results = []
+    for slug, score in ranked.hits:
+        term = terms[slug]
+        results.append(
+            {"slug": slug, "term": term.get("term"), "short_def": term.get("short_def"), "score": round(score, 4)}
+        )
+    return {"query": q, "corrections": ranked.corrections, "results": results}
+
+
+@app.get("/suggest", tags=["terms"])
+def suggest_terms(
+    prefix: str = Query(..., min_length=1, description="Beginning of a term name or alias."),
+    limit: int = Query(10, ge=1, le=50, description="Maximum number of suggestions."),
+) -> dict:
+    """Complete term names and aliases as the user types."""
+    catalog = _catalog()
+    terms = catalog.terms
+    suggestions = [
+        {"slug": slug, "term": terms[slug].get("term"), "match": name}
+        for slug, name in catalog.suggest.complete(prefix, limit)
+    ]
+    return {"prefix": prefix, "suggestions": suggestions}
+
+
+class BatchGetRequest(BaseModel):
+    names: List[str] = Field(
+        ...,
+        description="Slugs, term names or aliases; each is normalised the same way as term slugs.",
+    )
+
+
+@app.post("/terms:batchGet", tags=["terms"])
+def batch_get_terms(payload: BatchGetRequest) -> Response:
+    """Resolve many slugs or aliases at once, reporting misses per item."""
+    if len(payload.names) > MAX_PAGE_SIZE:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_PAGE_SIZE} names per request")
+    catalog = _catalog()
+    items: List[bytes] = []
+    found = 0
+    for name in payload.names:
+        slug = catalog.names.get(normalize_term(name))
+        prefix = b'{"query":' + encode_json(name)
+        if slug is None:
+            items.append(prefix + b',"found":false,"slug":null,"term":null}')
+            continue
+        found += 1
+        items.append(
+            prefix + b',"found":true,"slug":' + encode_json(slug) + b',"term":' + catalog.encoded[slug] + b"}"
+        )
+    body = b'{"found":%d,"missing":%d,"results":[' % (found, len(items) - found) + b",".join(items) + b"]}"
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/categories", tags=["metadata"])
 def list_categories() -> dict:
-    categories = sorted({cat for term in _terms_list() for cat in term.get("categories", [])})
-    return {"categories": categories}
+    return {"categories": list(_catalog().facets["category"].values())}
 
 
 @app.get("/roles", tags=["metadata"])
 def list_roles() -> dict:
-    roles = sorted({role for term in _terms_list() for role in term.get("roles", [])})
-    return {"roles": roles}
+    return {"roles": list(_catalog().facets["role"].values())}
 
 
 @app.post("/refresh", tags=["metadata"], response_model=dict)
-def refresh_terms() -> dict:
-    _load_terms.cache_clear()  # type: ignore[attr-defined]
-    refreshed = len(_load_terms())
-    return {"refreshed": refreshed}
+def refresh_terms(
+    full: bool = Query(False, description="Reparse every file instead of only the ones that changed."),
+) -> dict:
+    if not _is_publisher():
+        # Reader workers cannot reparse YAML; they follow the publisher instead.
+        catalog = _shared_reader.current(force=True)
+        return {
+            "refreshed": len(catalog.terms) if catalog else 0,
+            "generation": _shared_reader.generation,
+            "added": 0,
+            "modified": 0,
+            "removed": 0,
+        }
+    result = _store.refresh(force=full)
+    return {
+        "refreshed": len(_load_terms()),
+        "generation": result.generation,
+        "added": len(result.added),
+        "modified": len(result.modified),
+        "removed": len(result.removed),
+    }
@@ -0,0 +1,106 @@
+"""Simulate the search page's per-keystroke cost: linear scan vs. prebuilt index."""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import random
+import sys
+import time
+from pathlib import Path
+
+CURRENT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = CURRENT_DIR.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from glossary_utils import tokenize
+from glossary_utils.search_assets import ClientIndexReader, build_client_index, encode_compact
+from synthetic import WORDS, make_terms
+
+SEARCH_FIELDS = ("term", "aliases", "categories", "roles", "short_def", "status", "last_reviewed", "slug")
+
+
+def scan(records, query):
+    """The page's original filter: rebuild and lowercase every haystack per keystroke."""
+    needle = query.lower()
+    matches = []
+    for doc_id, record in enumerate(records):
+        haystack = " \n ".join(
+            [record["term"], *record["aliases"], record["short_def"] or "", *record["categories"]]
+        ).lower()
+        if needle in haystack:
+            matches.append(doc_id)
+    return matches
+
+
+def prefix_scan(records, query):
+    """Brute-force reference for the index semantics (every token prefixes some word)."""
+    tokens = set(tokenize(query))
+    matches = []
+    for doc_id, record in enumerate(records):
+        text = " ".join([record["term"], *record["aliases"], record["short_def"], *record["categories"]])
+        words = set(tokenize(text))
+        if all(any(word.startswith(token) for word in words) for token in tokens):
+            matches.append(doc_id)
+    return matches
+
+
+def lookup(reader, records, query):
+    """What the page does per keystroke: the index, or the scan when it finds no prefix hits."""
+    hits = reader.search(query)
+    return scan(records, query) if hits is None else hits
+
+
+def keystrokes(query):
+    return [query[:end] for end in range(1, len(query) + 1) if query[:end].strip()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--terms", type=int, default=20_000, help="Synthetic corpus size")
+    parser.add_argument("--queries", type=int, default=40, help="Typed queries to replay, one lookup per keystroke")
+    args = parser.parse_args()
+
+    records = [{field: term[field] for field in SEARCH_FIELDS} for term in make_terms(args.terms)]
+    rng = random.Random(2)
+    queries = [f"{rng.choice(WORDS)} {rng.choice(WORDS)[:4]}" for _ in range(args.queries // 2)]
+    queries += [rng.choice(records)["aliases"][0] for _ in range(args.queries - len(queries))]
+    typed = [prefix for query in queries for prefix in keystrokes(query)]
+
+    started = time.perf_counter()
+    payload = build_client_index(records)
+    build_seconds = time.perf_counter() - started
+    encoded = encode_compact(payload)
+
+    started = time.perf_counter()
+    reader = ClientIndexReader(payload)
+    decode_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for prefix in typed:
+        scan(records, prefix)
+    scan_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    indexed = [lookup(reader, records, prefix) for prefix in typed]
+    index_seconds = time.perf_counter() - started
+    fallbacks = sum(reader.search(prefix) is None for prefix in typed)
+
+    for query in queries[:5]:
+        if (reader.search(query) or []) != prefix_scan(records, query):
+            raise SystemExit(f"Index results differ from a brute-force prefix scan for {query!r}")
+
+    per_key = lambda seconds: seconds / len(typed) * 1000  # noqa: E731
+    print(f"corpus: {len(records)} terms, {len(queries)} queries, {len(typed)} keystrokes")
+    print(f"index: {len(payload['tokens'])} tokens, {len(encoded):,} B raw, {len(gzip.compress(encoded)):,} B gzip")
+    print(f"index build (build_index): {build_seconds * 1000:.1f} ms")
+    print(f"index decode (page load):  {decode_seconds * 1000:.1f} ms")
+    print(f"linear scan:    {per_key(scan_seconds):.3f} ms/keystroke")
+    print(f"index lookup:   {per_key(index_seconds):.3f} ms/keystroke ({fallbacks} fell back to the scan)")
+    print(f"speedup:        {scan_seconds / index_seconds:.1f}x")
+    print(f"mean matches:   {sum(map(len, indexed)) / len(indexed):.0f} per keystroke")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Measure how parallel YAML loading scales with the number of worker processes."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+CURRENT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = CURRENT_DIR.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from glossary_utils import load_paths, safe_load_path
+from synthetic import make_terms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--terms", type=int, default=4_000, help="Synthetic corpus size")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1, help="Largest pool to try")
+    args = parser.parse_args()
+
+    counts = [1]
+    while counts[-1] * 2 <= args.max_workers:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != args.max_workers:
+        counts.append(args.max_workers)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        for term in make_terms(args.terms):
+            slug = term.pop("slug")
+            (data_dir / f"{slug}.yml").write_text(yaml.safe_dump(term, sort_keys=False), encoding="utf-8")
+        paths = sorted(data_dir.glob("*.yml"))
+
+        # Parse directly rather than through the parse cache so every run does the full work.
+        print(f"corpus: {len(paths)} files, {os.cpu_count()} CPUs")
+        expected = None
+        baseline = None
+        for workers in counts:
+            started = time.perf_counter()
+            loaded = load_paths(paths, loader=safe_load_path, workers=workers, serial_below=0)
+            seconds = time.perf_counter() - started
+            if expected is None:
+                expected = loaded
+            elif list(loaded.items()) != list(expected.items()):
+                raise SystemExit(f"{workers} workers returned different results")
+            baseline = baseline or seconds
+            print(
+                f"{workers:3d} worker(s): {seconds * 1000:8.1f} ms "
+                f"{len(paths) / seconds:8.0f} files/s ({baseline / seconds:.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Report BM25 ranked-search latency percentiles on a synthetic corpus."""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+CURRENT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = CURRENT_DIR.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from api.main import SEARCH_BOOSTS, _ranked_fields
+from glossary_utils import BM25Index
+from synthetic import WORDS, make_terms
+
+
+def _typo(rng: random.Random, word: str) -> str:
+    position = rng.randrange(len(word))
+    edit = rng.choice(("drop", "swap", "replace"))
+    if edit == "drop":
+        return word[:position] + word[position + 1 :]
+    if edit == "swap" and position < len(word) - 1:
+        return word[:position] + word[position + 1] + word[position] + word[position + 2 :]
+    return word[:position] + rng.choice("abcdefghijklmnopqrstuvwxyz") + word[position + 1 :]
+
+
+def _percentile(samples: list, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--terms", type=int, default=10_000, help="Synthetic corpus size")
+    parser.add_argument("--queries", type=int, default=500, help="Number of queries to time")
+    parser.add_argument("--limit", type=int, default=20, help="Results per query")
+    args = parser.parse_args()
+
+    terms = make_terms(args.terms)
+    started = time.perf_counter()
+    index = BM25Index({term["slug"]: _ranked_fields(term) for term in terms}, SEARCH_BOOSTS)
+    build_seconds = time.perf_counter() - started
+
+    rng = random.Random(2)
+    queries = []
+    for _ in range(args.queries):
+        words = [rng.choice(WORDS) for _ in range(rng.randint(1, 3))]
+        if rng.random() < 0.3:
+            words[0] = _typo(rng, words[0])
+        queries.append(" ".join(words))
+
+    latencies = []
+    for query in queries:
+        started = time.perf_counter()
+        index.search(query, limit=args.limit)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    print(f"corpus: {len(terms)} terms, {len(queries)} queries (30% with a typo), top {args.limit}")
+    print(f"index build: {build_seconds * 1000:.1f} ms")
+    print(f"p50: {_percentile(latencies, 0.50):.3f} ms")
+    print(f"p99: {_percentile(latencies, 0.99):.3f} ms")
+    print(f"mean: {statistics.fmean(latencies):.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
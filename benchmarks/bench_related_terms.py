@@ -0,0 +1,85 @@
+"""Time the blocked NumPy related-term search against the pure-Python fallback.
+
+The fallback is quadratic, so it is timed on the first few hundred terms and
+extrapolated to the whole corpus. Dense runs also time the
+approximate ``ivf`` backend and report its recall against the exact result.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+CURRENT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = CURRENT_DIR.parent
+for path in (REPO_ROOT, REPO_ROOT / "scripts"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from enrich_related_terms import (
+    TOP_K,
+    _pairwise_top_k,
+    _tfidf_embeddings,
+    ivf_neighbours,
+    nearest_neighbours,
+    recall_at_k,
+)
+from synthetic import make_terms
+
+
+def dense_embeddings(count: int, dim: int, noise: float) -> list:
+    """Unit vectors scattered around one random topic per 50 terms."""
+    rng = np.random.default_rng(0)
+    topics = rng.standard_normal((max(1, count // 50), dim))
+    matrix = topics[rng.integers(0, len(topics), count)] + noise * rng.standard_normal((count, dim))
+    matrix = matrix.astype(np.float32)
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+    return list(matrix)
+
+
+def sparse_embeddings(count: int) -> list:
+    texts = [f"{term['term']}\n{term['short_def']}\n{term['long_def']}" for term in make_terms(count)]
+    return _tfidf_embeddings(texts)
+
+
+def loop_seconds(embeddings, flavour: str, sample: int) -> float:
+    """Time the pure loop on the first ``sample`` rows and scale it quadratically."""
+    subset = embeddings[:sample]
+    started = time.perf_counter()
+    _pairwise_top_k(subset, flavour, TOP_K)
+    return (time.perf_counter() - started) * (len(embeddings) / len(subset)) ** 2
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 50_000], help="Corpus sizes to try")
+    parser.add_argument("--dim", type=int, default=384, help="Dense embedding width (all-MiniLM-L6-v2 uses 384)")
+    parser.add_argument("--noise", type=float, default=1.25, help="Spread of dense vectors around their topic")
+    parser.add_argument("--sample", type=int, default=300, help="Terms used to extrapolate the pure loop")
+    args = parser.parse_args()
+
+    print(f"{'flavour':>7} {'terms':>7} {'loop (est.)':>12} {'vectorized':>11} {'speed-up':>9} {'ivf':>8} {'recall':>7}")
+    for size in args.sizes:
+        dense = dense_embeddings(size, args.dim, args.noise)
+        for flavour, embeddings in (("dense", dense), ("sparse", sparse_embeddings(size))):
+            started = time.perf_counter()
+            exact = nearest_neighbours(embeddings, flavour)
+            vectorized = time.perf_counter() - started
+            loop = loop_seconds(embeddings, flavour, args.sample)
+            row = f"{flavour:>7} {size:7d} {loop:11.1f}s {vectorized:10.2f}s {loop / vectorized:8.0f}x"
+            if flavour == "dense":
+                started = time.perf_counter()
+                approximate = ivf_neighbours(embeddings, flavour)
+                ivf = time.perf_counter() - started
+                recall = recall_at_k(embeddings, flavour, approximate, len(embeddings))
+                assert recall is not None and len(exact) == len(approximate)
+                row += f" {ivf:7.2f}s {recall:7.3f}"
+            print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Compare term-page throughput of the list-building and Jinja2 template renderers."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+CURRENT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = CURRENT_DIR.parent
+for path in (REPO_ROOT, REPO_ROOT / "scripts"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from render_docs import TERM_RENDERERS
+from synthetic import make_terms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--terms", type=int, default=5_000, help="Synthetic corpus size")
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of runs per renderer")
+    args = parser.parse_args()
+
+    terms = make_terms(args.terms)
+    for term in terms:
+        term["_source_file"] = f"data/terms/{term['slug']}.yml"
+
+    expected = None
+    baseline = None
+    print(f"corpus: {len(terms)} terms")
+    for name, render in TERM_RENDERERS.items():
+        render(terms[0])  # load and compile the template outside the timed runs
+        best = float("inf")
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            pages = [render(term) for term in terms]
+            best = min(best, time.perf_counter() - started)
+        if expected is None:
+            expected = pages
+        elif pages != expected:
+            raise SystemExit(f"{name} renderer output differs")
+        baseline = baseline or best
+        print(f"{name:>8}: {len(terms) / best:9.0f} pages/s ({baseline / best:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Compare the ``q`` substring index with the original linear scan."""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+CURRENT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = CURRENT_DIR.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from api.main import _matches_query, _query_fields
+from glossary_utils import SubstringIndex
+from synthetic import WORDS, make_terms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--terms", type=int, default=10_000, help="Synthetic corpus size")
+    parser.add_argument("--queries", type=int, default=200, help="Number of queries to time")
+    args = parser.parse_args()
+
+    terms = make_terms(args.terms)
+    rng = random.Random(1)
+    # Mix broad fragments with the selective lookups (names, aliases) most clients send.
+    queries = [rng.choice(WORDS)[: rng.randint(2, 8)] for _ in range(args.queries // 4)]
+    queries += [f"{rng.choice(WORDS)} {rng.choice(WORDS)}" for _ in range(args.queries // 4)]
+    queries += [rng.choice(terms)["aliases"][0] for _ in range(args.queries // 2)]
+
+    started = time.perf_counter()
+    index = SubstringIndex({term["slug"]: _query_fields(term) for term in terms})
+    build_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    scanned = [[term["slug"] for term in terms if _matches_query(term, q)] for q in queries]
+    scan_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    indexed = [index.search(q) for q in queries]
+    index_seconds = time.perf_counter() - started
+
+    if scanned != indexed:
+        raise SystemExit("Index results differ from the linear scan")
+
+    per_query = lambda seconds: seconds / len(queries) * 1000  # noqa: E731
+    print(f"corpus: {len(terms)} terms, {len(queries)} queries")
+    print(f"index build:  {build_seconds * 1000:.1f} ms")
+    print(f"linear scan:  {per_query(scan_seconds):.3f} ms/query")
+    print(f"n-gram index: {per_query(index_seconds):.3f} ms/query")
+    print(f"speedup:      {scan_seconds / index_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
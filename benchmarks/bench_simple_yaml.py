@@ -0,0 +1,60 @@
+"""Check that the fallback SimpleYAMLParser scales linearly with document size."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+CURRENT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = CURRENT_DIR.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from glossary_utils.simple_yaml import SimpleYAMLParser
+
+
+def wide_document(items: int) -> str:
+    """A term with ``items`` citations, each a mapping inside a sequence."""
+    lines = ["term: synthetic", "long_def: >", "  A long definition", "  spread over lines.", "citations:"]
+    for index in range(items):
+        lines += [f"  - title: Source {index}", f"    url: https://example.com/{index}", "    year: 2024"]
+    return "\n".join(lines) + "\n"
+
+
+def deep_document(depth: int) -> str:
+    """Sequence items nested ``depth`` levels deep, each holding a mapping."""
+    lines = ["root:"]
+    for level in range(depth):
+        pad = "    " * level + "  "
+        lines += [f"{pad}- name: level {level}", f"{pad}  note: value {level}", f"{pad}  children:"]
+    return "\n".join(lines) + "\n"
+
+
+def _seconds(text: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        SimpleYAMLParser.from_text(text).parse()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per size; the fastest is reported")
+    args = parser.parse_args()
+
+    cases = [("wide", wide_document, (1_000, 4_000, 16_000, 64_000)), ("deep", deep_document, (20, 40, 80, 160))]
+    for label, make, sizes in cases:
+        print(f"{label} documents:")
+        for size in sizes:
+            text = make(size)
+            lines = text.count("\n")
+            seconds = _seconds(text, args.repeat)
+            print(f"  {size:6d} -> {lines:7d} lines {seconds * 1000:9.1f} ms {seconds / lines * 1e6:6.2f} us/line")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Compare API cold-start time from YAML, the parse cache and the prebuilt binary snapshot."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+CURRENT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = CURRENT_DIR.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from api.main import _build_catalog, _load_term_file, _prepare_term
+from glossary_utils import TermStore, load_snapshot, safe_load_path, write_snapshot
+from glossary_utils.parse_cache import CACHE_DIR_ENV
+from synthetic import make_terms
+
+
+def _cold_start(data_dir: Path, snapshot_path: Path | None) -> float:
+    def bootstrap():
+        loaded = load_snapshot(snapshot_path, data_dir)
+        if loaded is None:
+            raise SystemExit("Snapshot unexpectedly stale")
+        stamps, entries = loaded
+        return stamps, {path: _prepare_term(path, data) for path, data in entries.items()}
+
+    store = TermStore(
+        data_dir,
+        _build_catalog,
+        loader=_load_term_file,
+        bootstrap=bootstrap if snapshot_path is not None else None,
+    )
+    started = time.perf_counter()
+    store.snapshot()
+    return time.perf_counter() - started
+
+
+def _report(label: str, data_dir: Path, snapshot_dir: Path) -> None:
+    snapshot_path = snapshot_dir / "terms.snapshot"
+    sources = {path: safe_load_path(path) for path in sorted(data_dir.glob("*.yml"))}
+    size = write_snapshot(snapshot_path, data_dir, sources)
+    os.environ[CACHE_DIR_ENV] = ""
+    yaml_seconds = min(_cold_start(data_dir, None) for _ in range(3))
+    os.environ[CACHE_DIR_ENV] = str(snapshot_dir / f"cache-{label.replace('/', '-')}")
+    _cold_start(data_dir, None)  # populate the parse cache
+    cache_seconds = min(_cold_start(data_dir, None) for _ in range(3))
+    snapshot_seconds = min(_cold_start(data_dir, snapshot_path) for _ in range(3))
+    print(f"{label}: {len(sources)} files, snapshot {size / 1024:.0f} KiB")
+    print(f"  YAML cold start:        {yaml_seconds * 1000:8.1f} ms")
+    print(f"  parse cache cold start: {cache_seconds * 1000:8.1f} ms ({yaml_seconds / cache_seconds:.1f}x faster)")
+    print(f"  snapshot cold start:    {snapshot_seconds * 1000:8.1f} ms ({yaml_seconds / snapshot_seconds:.1f}x faster)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--terms", type=int, default=2_000, help="Synthetic corpus size")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _report("data/terms", REPO_ROOT / "data" / "terms", Path(tmp))
+
+        data_dir = Path(tmp) / "terms"
+        data_dir.mkdir()
+        for term in make_terms(args.terms):
+            slug = term.pop("slug")
+            (data_dir / f"{slug}.yml").write_text(yaml.safe_dump(term, sort_keys=False), encoding="utf-8")
+        _report("synthetic", data_dir, Path(tmp))
+
+
+if __name__ == "__main__":
+    main()
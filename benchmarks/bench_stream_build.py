@@ -0,0 +1,83 @@
+"""Compare peak memory of a full build_index.py run with and without --stream.
+
+Both runs go through ``build_index.main()``, site search payload included, so
+the numbers are what the command line actually costs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from unittest import mock
+
+import yaml
+
+CURRENT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = CURRENT_DIR.parent
+for path in (REPO_ROOT, REPO_ROOT / "scripts"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+import build_index
+from glossary_utils.parse_cache import CACHE_DIR_ENV
+from synthetic import make_terms
+
+
+def run_build(data_dir: Path, out_dir: Path, site_dir: Path, *flags: str):
+    """Run ``build_index.main()`` with the site assets redirected to ``site_dir``; return ``(seconds, peak)``."""
+    argv = ["build_index.py", "--data-dir", str(data_dir), "--output-dir", str(out_dir), "--workers", "1", *flags]
+    site_paths = {
+        "SITE_SEARCH_PATH": site_dir / "glossary-search.json",
+        "SITE_SHARD_DIR": site_dir / "glossary-search",
+        "SITE_CLIENT_INDEX_PATH": site_dir / "glossary-search-index.json",
+    }
+    with mock.patch.object(sys, "argv", argv), mock.patch.multiple(build_index, **site_paths):
+        with contextlib.redirect_stdout(io.StringIO()):
+            tracemalloc.start()
+            started = time.perf_counter()
+            build_index.main()
+            seconds = time.perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+    return seconds, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 2_000, 4_000], help="Corpus sizes to try")
+    args = parser.parse_args()
+
+    # Parse every file for real; tracemalloc only sees this process, so stay serial.
+    os.environ[CACHE_DIR_ENV] = ""
+    print(f"{'terms':>7} {'full peak':>12} {'--stream peak':>14} {'full':>8} {'--stream':>9}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            data_dir = root / "terms"
+            data_dir.mkdir()
+            for term in make_terms(size):
+                slug = term.pop("slug")
+                (data_dir / f"{slug}.yml").write_text(yaml.safe_dump(term, sort_keys=False), encoding="utf-8")
+
+            full_seconds, full_peak = run_build(data_dir, root / "full", root / "site-full", "--no-snapshot")
+            stream_seconds, stream_peak = run_build(data_dir, root / "stream", root / "site-stream", "--stream")
+            pairs = [(root / "full" / name, root / "stream" / name) for name in build_index.OUTPUT_FILENAMES]
+            pairs.append((root / "site-full" / "glossary-search.json", root / "site-stream" / "glossary-search.json"))
+            for full, streamed in pairs:
+                if full.read_bytes() != streamed.read_bytes():
+                    raise SystemExit(f"--stream wrote a different {full.name}")
+            print(
+                f"{size:7d} {full_peak / 2**20:9.1f} MB {stream_peak / 2**20:11.1f} MB "
+                f"{full_seconds:7.2f}s {stream_seconds:8.2f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Compare the pure-Python TF-IDF related-term fallback with the string-dict loop it replaced.
+
+This is the path taken when neither sentence-transformers nor NumPy is installed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+
+CURRENT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = CURRENT_DIR.parent
+for path in (REPO_ROOT, REPO_ROOT / "scripts"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from enrich_related_terms import TOP_K, _sparse_top_k, _tfidf_embeddings, _tokenize
+from synthetic import make_terms
+
+
+def legacy_embeddings(texts):
+    tokenised = [Counter(_tokenize(text)) for text in texts]
+    doc_freq: Counter = Counter()
+    for bucket in tokenised:
+        doc_freq.update(bucket.keys())
+    vectors = []
+    for bucket in tokenised:
+        total_terms = sum(bucket.values()) or 1
+        normalised = {}
+        norm = 0.0
+        for term, count in bucket.items():
+            weight = count / total_terms * (math.log((len(texts) + 1) / (doc_freq[term] + 1)) + 1)
+            normalised[term] = weight
+            norm += weight * weight
+        norm = math.sqrt(norm) or 1.0
+        vectors.append({term: weight / norm for term, weight in normalised.items()})
+    return vectors
+
+
+def legacy_top_k(vectors, k):
+    neighbours = []
+    for i, a in enumerate(vectors):
+        scores = []
+        for j, b in enumerate(vectors):
+            if i == j:
+                continue
+            small, large = (a, b) if len(a) <= len(b) else (b, a)
+            scores.append((sum(weight * large.get(term, 0.0) for term, weight in small.items()), j))
+        scores.sort(reverse=True)
+        neighbours.append(scores[:k])
+    return neighbours
+
+
+def measure(embed, top_k, texts):
+    tracemalloc.start()
+    started = time.perf_counter()
+    vectors = embed(texts)
+    _, vectors_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    neighbours = top_k(vectors, TOP_K)
+    return time.perf_counter() - started, vectors_peak, neighbours
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 1_000, 2_000], help="Corpus sizes to try")
+    args = parser.parse_args()
+
+    print(f"{'terms':>7} {'legacy':>9} {'interned':>9} {'legacy vectors':>15} {'interned vectors':>17}")
+    for size in args.sizes:
+        texts = [f"{term['term']}\n{term['short_def']}\n{term['long_def']}" for term in make_terms(size)]
+        legacy_seconds, legacy_peak, legacy = measure(legacy_embeddings, legacy_top_k, texts)
+        seconds, peak, neighbours = measure(_tfidf_embeddings, _sparse_top_k, texts)
+        if neighbours != legacy:
+            raise SystemExit("Interned TF-IDF neighbours differ from the legacy loop")
+        print(
+            f"{size:7d} {legacy_seconds:8.2f}s {seconds:8.2f}s "
+            f"{legacy_peak / 2**20:12.1f} MB {peak / 2**20:14.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Compare YAML parse throughput over ``data/terms`` for each available loader."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, List
+
+import yaml
+
+CURRENT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = CURRENT_DIR.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from glossary_utils.simple_yaml import SimpleYAMLParser
+
+
+def _pure(text: str) -> Any:
+    return yaml.load(text, Loader=yaml.SafeLoader)
+
+
+def _libyaml(text: str) -> Any:
+    return yaml.load(text, Loader=yaml.CSafeLoader)
+
+
+def _simple(text: str) -> Any:
+    return SimpleYAMLParser.from_text(text).parse()
+
+
+def _files_per_second(load: Callable[[str], Any], texts: List[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for text in texts:
+            load(text)
+        best = min(best, time.perf_counter() - started)
+    return len(texts) / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--data-dir", type=Path, default=REPO_ROOT / "data" / "terms", help="Directory of term YAML")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per loader; the fastest is reported")
+    args = parser.parse_args()
+
+    # Read everything up front so the numbers measure parsing, not disk I/O.
+    texts = [path.read_text(encoding="utf-8") for path in sorted(args.data_dir.glob("*.yml"))]
+    loaders = [("PyYAML SafeLoader", _pure)]
+    if getattr(yaml, "__with_libyaml__", False):
+        loaders.append(("PyYAML CSafeLoader", _libyaml))
+        if [_libyaml(text) for text in texts] != [_pure(text) for text in texts]:
+            raise SystemExit("CSafeLoader output differs from SafeLoader")
+    else:
+        print("PyYAML was built without libyaml; skipping CSafeLoader")
+    loaders.append(("SimpleYAMLParser", _simple))
+
+    print(f"corpus: {len(texts)} files from {args.data_dir}")
+    baseline = None
+    for label, load in loaders:
+        rate = _files_per_second(load, texts, args.repeat)
+        baseline = baseline or rate
+        print(f"{label:<20} {rate:10.0f} files/s ({rate / baseline:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
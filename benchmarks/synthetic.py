@@ -0,0 +1,59 @@
+"""Synthetic glossary entries for benchmarks."""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Dict, List
+
+WORDS = (
+    "model agent retrieval embedding token prompt policy risk audit bias drift latency "
+    "cache vector index guardrail alignment evaluation dataset privacy inference gradient "
+    "attention decoder encoder transformer sampling fairness monitoring governance lineage "
+    "consent redaction threshold classifier regression cluster feature pipeline runtime "
+    "context window memory planner tool function schema citation review incident control"
+).split()
+CATEGORIES = [
+    "Foundations",
+    "LLM Core",
+    "Retrieval & RAG",
+    "Agents & Tooling",
+    "Optimization & Efficiency",
+    "Operations & Monitoring",
+    "Governance & Risk",
+]
+ROLES = ["product", "engineering", "data_science", "policy", "legal", "security", "communications"]
+STATUSES = ["draft", "reviewed", "approved", "deprecated"]
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def make_terms(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Return ``count`` term mappings shaped like the files in ``data/terms``."""
+    rng = random.Random(seed)
+    terms: List[Dict[str, Any]] = []
+    for idx in range(count):
+        name = f"{rng.choice(WORDS)} {rng.choice(WORDS)} {idx}"
+        terms.append(
+            {
+                "term": name,
+                "slug": name.replace(" ", "-"),
+                "aliases": [f"{rng.choice(WORDS)}-{idx}", f"{rng.choice(WORDS).upper()}{idx}"],
+                "categories": rng.sample(CATEGORIES, rng.randint(1, 2)),
+                "roles": rng.sample(ROLES, rng.randint(1, 3)),
+                "part_of_speech": "noun",
+                "short_def": _sentence(rng, rng.randint(12, 30)),
+                "long_def": " ".join(_sentence(rng, rng.randint(10, 20)) for _ in range(8)),
+                "audiences": {"exec": _sentence(rng, 15), "engineer": _sentence(rng, 15)},
+                "examples": {"do": [_sentence(rng, 10)], "dont": [_sentence(rng, 10)]},
+                "governance": {"nist_rmf_tags": ["measure"], "risk_notes": _sentence(rng, 12)},
+                "relationships": {"broader": [], "narrower": [], "related": []},
+                "citations": [{"source": _sentence(rng, 4), "url": f"https://example.com/{idx}"}],
+                "license": "CC BY-SA 4.0",
+                "status": rng.choice(STATUSES),
+                "last_reviewed": "2024-01-01",
+            }
+        )
+    return terms
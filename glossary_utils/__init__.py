@@ -1,5 +1,51 @@
 """Utility helpers shared across the AI Glossary project."""
 
+from .parallel import iter_paths, load_paths, map_ordered, thread_safe_context
+from .parse_cache import ParseCache, cached_load_path
+from .search import BM25Index, FacetIndex, PrefixIndex, RankedResults, SubstringIndex, tokenize
+from .search_assets import build_client_index, compact_search_index, expand_search_index, shard_search_index
+from .shared_store import (
+    EncodedTerms,
+    SharedTermMap,
+    SharedTermReader,
+    encode_json,
+    publish_terms,
+    try_acquire_publisher,
+)
 from .simple_yaml import safe_load, safe_load_path
+from .snapshot import SNAPSHOT_FILENAME, load_snapshot, read_snapshot_entries, write_snapshot
+from .term_store import RefreshResult, StoreSnapshot, TermStore
 
-__all__ = ["safe_load", "safe_load_path"]
+__all__ = [
+    "SNAPSHOT_FILENAME",
+    "BM25Index",
+    "EncodedTerms",
+    "FacetIndex",
+    "ParseCache",
+    "PrefixIndex",
+    "RankedResults",
+    "RefreshResult",
+    "SharedTermMap",
+    "SharedTermReader",
+    "StoreSnapshot",
+    "SubstringIndex",
+    "TermStore",
+    "build_client_index",
+    "cached_load_path",
+    "compact_search_index",
+    "encode_json",
+    "expand_search_index",
+    "iter_paths",
+    "load_paths",
+    "load_snapshot",
+    "map_ordered",
+    "publish_terms",
+    "read_snapshot_entries",
+    "safe_load",
+    "safe_load_path",
+    "shard_search_index",
+    "thread_safe_context",
+    "tokenize",
+    "try_acquire_publisher",
+    "write_snapshot",
+]
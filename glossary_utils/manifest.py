@@ -0,0 +1,95 @@
+"""Source manifests and change-aware writes for incremental builds.
+
+A manifest records the size, modification time and SHA-256 digest of every
+source file a build consumed.  :func:`scan_sources` produces the same records
+for the directory as it is now, hashing only files whose size or mtime moved,
+and :func:`diff_sources` compares the two so a build can reprocess just the
+files whose content changed.  :func:`write_if_changed` leaves outputs whose
+bytes are already current untouched, so their mtimes keep downstream caches
+(MkDocs, rsync, CDN uploads) from seeing spurious changes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+MANIFEST_VERSION = 1
+
+SourceRecord = Dict[str, Any]
+
+
+def scan_sources(
+    data_dir: Path, previous: Optional[Mapping[str, SourceRecord]] = None, pattern: str = "*.yml"
+) -> Dict[Path, SourceRecord]:
+    """Return ``{path: {size, mtime_ns, sha256}}`` for ``data_dir`` in sorted order.
+
+    Digests are copied from ``previous`` (keyed by file name) when a file's
+    size and mtime still match, so an unchanged tree is scanned with stats only.
+    """
+    previous = previous or {}
+    records: Dict[Path, SourceRecord] = {}
+    for path in sorted(data_dir.glob(pattern)):
+        stat = path.stat()
+        known = previous.get(path.name)
+        if known is not None and (known["size"], known["mtime_ns"]) == (stat.st_size, stat.st_mtime_ns):
+            digest = known["sha256"]
+        else:
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        records[path] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest}
+    return records
+
+
+def diff_sources(
+    current: Mapping[Path, SourceRecord], previous: Mapping[str, SourceRecord]
+) -> Tuple[List[Path], List[str]]:
+    """Return the paths whose content is new or changed and the names that disappeared."""
+    changed = [
+        path
+        for path, record in current.items()
+        if previous.get(path.name, {}).get("sha256") != record["sha256"]
+    ]
+    names = {path.name for path in current}
+    removed = sorted(name for name in previous if name not in names)
+    return changed, removed
+
+
+def load_manifest(path: Path) -> Optional[Dict[str, Any]]:
+    """Return a previously written manifest, or ``None`` if it is missing or outdated."""
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def encode_manifest(
+    data_dir: Path, sources: Mapping[Path, SourceRecord], outputs: Optional[Mapping[str, str]] = None
+) -> bytes:
+    """Serialise the source records plus the digests of the outputs built from them."""
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "data_dir": str(data_dir),
+        "sources": {path.name: record for path, record in sources.items()},
+        "outputs": dict(outputs or {}),
+    }
+    return json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8")
+
+
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """Atomically replace ``path`` with ``data`` unless it already holds those bytes."""
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+    return True
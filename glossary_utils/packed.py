@@ -0,0 +1,166 @@
+"""Flat lookup tables that are read in place, for example from a memory mapping.
+
+The shared term store (:mod:`glossary_utils.shared_store`) puts the search
+indexes next to the term bodies so reader workers map them instead of
+building private copies.  Two layouts cover that:
+
+* :func:`pack_sections` concatenates named blobs behind a small JSON header,
+  and :func:`unpack_sections` returns zero-copy views of them.
+* :func:`pack_table` stores string keys in sorted order with an offset table,
+  and :class:`PackedTable` binary-searches them and decodes only the value
+  that was asked for.
+* :func:`pack_strings` stores a list of strings, and :class:`PackedStrings`
+  reads them back by position.
+
+Offsets are native-endian ``uint32``; the files never leave the machine that
+wrote them.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from array import array
+from typing import Any, Callable, Dict, Generic, Iterable, Iterator, Mapping, Sequence, Tuple, TypeVar
+
+V = TypeVar("V")
+_LENGTH = struct.Struct("=I")
+
+
+def pack_sections(sections: Mapping[str, bytes]) -> bytes:
+    """Return ``sections`` as one blob readable with :func:`unpack_sections`."""
+    parts = []
+    write_sections(parts.append, sections)
+    return b"".join(parts)
+
+
+def write_sections(write: Callable[[bytes], Any], sections: Mapping[str, bytes]) -> None:
+    """Stream the :func:`pack_sections` layout through ``write`` without joining the blobs."""
+    offsets: Dict[str, Tuple[int, int]] = {}
+    offset = 0
+    for name, blob in sections.items():
+        offsets[name] = (offset, len(blob))
+        offset += len(blob)
+    header = json.dumps(offsets, separators=(",", ":")).encode("utf-8")
+    write(_LENGTH.pack(len(header)))
+    write(header)
+    for blob in sections.values():
+        write(blob)
+
+
+def unpack_sections(buffer: Any) -> Dict[str, memoryview]:
+    """Return views of the sections in a :func:`pack_sections` blob."""
+    view = memoryview(buffer)
+    (length,) = _LENGTH.unpack_from(view, 0)
+    base = _LENGTH.size + length
+    offsets = json.loads(bytes(view[_LENGTH.size : base]))
+    return {name: view[base + offset : base + offset + size] for name, (offset, size) in offsets.items()}
+
+
+def pack_table(items: Iterable[Tuple[str, bytes]]) -> bytes:
+    """Pack ``(key, value)`` pairs, sorted by key, for :class:`PackedTable`."""
+    rows = sorted((key.encode("utf-8"), value) for key, value in items)
+    key_offsets = array("I", [0])
+    value_offsets = array("I", [0])
+    for key, value in rows:
+        key_offsets.append(key_offsets[-1] + len(key))
+        value_offsets.append(value_offsets[-1] + len(value))
+    return b"".join(
+        [
+            _LENGTH.pack(len(rows)),
+            key_offsets.tobytes(),
+            value_offsets.tobytes(),
+            *(key for key, _ in rows),
+            *(value for _, value in rows),
+        ]
+    )
+
+
+class PackedTable(Mapping[str, V], Generic[V]):
+    """Read-only mapping over a :func:`pack_table` blob.
+
+    Lookups binary-search the sorted keys in place and pass the raw value to
+    ``decode``, so nothing is copied up front.
+    """
+
+    def __init__(self, buffer: Any, decode: Callable[[memoryview], V]) -> None:
+        view = memoryview(buffer)
+        (count,) = _LENGTH.unpack_from(view, 0)
+        width = 4 * (count + 1)
+        start = _LENGTH.size
+        self._count = count
+        self._key_offsets = view[start : start + width].cast("I")
+        self._value_offsets = view[start + width : start + 2 * width].cast("I")
+        keys_start = start + 2 * width
+        values_start = keys_start + self._key_offsets[count]
+        self._keys = view[keys_start:values_start]
+        self._values = view[values_start : values_start + self._value_offsets[count]]
+        self._decode = decode
+
+    def _key(self, position: int) -> bytes:
+        return bytes(self._keys[self._key_offsets[position] : self._key_offsets[position + 1]])
+
+    def _find(self, key: object) -> int:
+        if not isinstance(key, str):
+            return -1
+        target = key.encode("utf-8")
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(middle) < target:
+                low = middle + 1
+            else:
+                high = middle
+        return low if low < self._count and self._key(low) == target else -1
+
+    def __getitem__(self, key: str) -> V:
+        position = self._find(key)
+        if position < 0:
+            raise KeyError(key)
+        return self._decode(self._values[self._value_offsets[position] : self._value_offsets[position + 1]])
+
+    def __contains__(self, key: object) -> bool:
+        return self._find(key) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        for position in range(self._count):
+            yield self._key(position).decode("utf-8")
+
+    def __len__(self) -> int:
+        return self._count
+
+
+def decode_text(view: memoryview) -> str:
+    return str(view, "utf-8")
+
+
+def pack_strings(values: Sequence[str]) -> bytes:
+    """Pack ``values`` for :class:`PackedStrings`."""
+    blobs = [value.encode("utf-8") for value in values]
+    offsets = array("I", [0])
+    for blob in blobs:
+        offsets.append(offsets[-1] + len(blob))
+    return b"".join([_LENGTH.pack(len(blobs)), offsets.tobytes(), *blobs])
+
+
+class PackedStrings(Mapping[int, str]):
+    """Read-only ``position -> string`` mapping over a :func:`pack_strings` blob."""
+
+    def __init__(self, buffer: Any) -> None:
+        view = memoryview(buffer)
+        (count,) = _LENGTH.unpack_from(view, 0)
+        start = _LENGTH.size + 4 * (count + 1)
+        self._count = count
+        self._offsets = view[_LENGTH.size : start].cast("I")
+        self._blob = view[start:]
+
+    def __getitem__(self, position: int) -> str:
+        if not 0 <= position < self._count:
+            raise KeyError(position)
+        return str(self._blob[self._offsets[position] : self._offsets[position + 1]], "utf-8")
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(self._count))
+
+    def __len__(self) -> int:
+        return self._count
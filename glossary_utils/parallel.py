@@ -0,0 +1,116 @@
+"""Parse many term files at once with a process pool.
+
+YAML parsing is CPU-bound and holds the GIL, so a thread pool does not help;
+:func:`load_paths` fans files out to worker processes instead and returns the
+results in the order the paths were given, so output never depends on
+scheduling.  Starting a pool costs tens of milliseconds, which is more than a
+small corpus takes to parse, so below ``serial_below`` files (or with a single
+worker) everything runs in-process.  :func:`map_ordered` applies the same policy
+to any picklable function, e.g. rendering pages.
+
+:func:`iter_paths` is the streaming variant: it yields results in order while
+keeping only a bounded window of chunks in flight, so memory does not grow with
+the number of files.
+
+The worker count defaults to ``GLOSSARY_PARSE_WORKERS`` or the number of CPUs.
+``loader`` must be picklable, i.e. a module-level function.
+
+Pools use the platform's default start method unless ``mp_context`` says
+otherwise.  On Linux that is ``fork``, which is only safe from a
+single-threaded process: forking while another thread holds a lock copies the
+lock into the child still held.  Long-running services that parse from a
+background thread should pass :func:`thread_safe_context`.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.context import BaseContext
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .parse_cache import cached_load_path
+
+WORKERS_ENV = "GLOSSARY_PARSE_WORKERS"
+SERIAL_BELOW = 256
+# Several chunks per worker balance uneven file sizes without paying IPC per file.
+_CHUNKS_PER_WORKER = 4
+# iter_paths caps chunks at this many files so the in-flight window stays small.
+STREAM_CHUNK = 32
+
+
+def default_workers() -> int:
+    configured = os.environ.get(WORKERS_ENV)
+    if configured:
+        return max(1, int(configured))
+    return os.cpu_count() or 1
+
+
+def thread_safe_context() -> BaseContext:
+    """Return a start method whose workers do not inherit this process's threads."""
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(method)
+
+
+def map_ordered(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    workers: Optional[int] = None,
+    serial_below: int = SERIAL_BELOW,
+    mp_context: Optional[BaseContext] = None,
+) -> List[Any]:
+    """Return ``[func(item) for item in items]``, computed in worker processes when worthwhile."""
+    ordered = list(items)
+    workers = min(default_workers() if workers is None else max(1, workers), len(ordered))
+    if workers <= 1 or len(ordered) < serial_below:
+        return [func(item) for item in ordered]
+    chunksize = max(1, len(ordered) // (workers * _CHUNKS_PER_WORKER))
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as pool:
+        return list(pool.map(func, ordered, chunksize=chunksize))
+
+
+def load_paths(
+    paths: Iterable[Path],
+    loader: Callable[[Path], Any] = cached_load_path,
+    workers: Optional[int] = None,
+    serial_below: int = SERIAL_BELOW,
+    mp_context: Optional[BaseContext] = None,
+) -> Dict[Path, Any]:
+    """Return ``{path: loader(path)}`` in input order, parsing in parallel when worthwhile."""
+    ordered = list(paths)
+    return dict(zip(ordered, map_ordered(loader, ordered, workers, serial_below, mp_context)))
+
+
+def _load_chunk(loader: Callable[[Path], Any], paths: List[Path]) -> List[Any]:
+    return [loader(path) for path in paths]
+
+
+def iter_paths(
+    paths: Iterable[Path],
+    loader: Callable[[Path], Any] = cached_load_path,
+    workers: Optional[int] = None,
+    serial_below: int = SERIAL_BELOW,
+    mp_context: Optional[BaseContext] = None,
+) -> Iterator[Tuple[Path, Any]]:
+    """Yield ``(path, loader(path))`` in input order, holding at most two chunks per worker."""
+    ordered = list(paths)
+    workers = min(default_workers() if workers is None else max(1, workers), len(ordered))
+    if workers <= 1 or len(ordered) < serial_below:
+        for path in ordered:
+            yield path, loader(path)
+        return
+    chunksize = max(1, min(STREAM_CHUNK, len(ordered) // (workers * _CHUNKS_PER_WORKER)))
+    chunks = [ordered[start : start + chunksize] for start in range(0, len(ordered), chunksize)]
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as pool:
+        pending: Deque[Tuple[List[Path], Any]] = deque()
+        for chunk in chunks:
+            pending.append((chunk, pool.submit(_load_chunk, loader, chunk)))
+            if len(pending) >= workers * 2:
+                done, future = pending.popleft()
+                yield from zip(done, future.result())
+        while pending:
+            done, future = pending.popleft()
+            yield from zip(done, future.result())
@@ -0,0 +1,179 @@
+"""Persistent cache of parsed YAML shared by the scripts and the API.
+
+Every entry point used to parse ``data/terms`` from scratch, so one
+``make check build`` run parsed the corpus several times.  :class:`ParseCache`
+stores each file's parse result as a pickle under a cache directory, one entry
+per source path.  An entry records the source's size, modification time and
+SHA-256 digest:
+
+* a matching size and mtime is trusted without reading the file;
+* otherwise the bytes are hashed, and a matching digest (a fresh checkout, a
+  ``touch``) reuses the entry and refreshes its stamp;
+* anything else is parsed with :func:`~glossary_utils.simple_yaml.safe_load`
+  and written back.
+
+Entries are replaced atomically, so concurrent processes never read a partial
+pickle.  Hits refresh the entry's mtime and, once the directory outgrows
+``max_bytes``, the least recently used entries are evicted.
+
+The default directory is ``.glossary_cache/yaml`` at the repository root and can
+be moved with ``GLOSSARY_CACHE_DIR``; setting it to an empty string disables
+caching.  Like snapshots, cache entries are pickles and must only be read from
+directories you control.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+from . import simple_yaml
+from .simple_yaml import safe_load
+
+CACHE_VERSION = 1
+CACHE_DIR_ENV = "GLOSSARY_CACHE_DIR"
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / ".glossary_cache" / "yaml"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# Evict down to this fraction of ``max_bytes`` so a full cache is not pruned on every write.
+_PRUNE_TARGET = 0.8
+
+
+def _parser_name() -> str:
+    loader = simple_yaml.SafeLoader
+    return "SimpleYAMLParser" if loader is None else loader.__name__
+
+
+class ParseCache:
+    """Parse YAML files through an on-disk cache of their parse results."""
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        # Different parsers may disagree on edge cases, so never mix their results.
+        self._parser = _parser_name()
+        self._total: Optional[int] = None
+
+    def load_path(self, path: Path) -> Any:
+        """Return the parsed contents of ``path``, parsing only on a cache miss."""
+        stat = path.stat()
+        entry_path = self._entry_path(path)
+        entry = self._read_entry(entry_path)
+        if entry is not None and (entry["size"], entry["mtime_ns"]) == (stat.st_size, stat.st_mtime_ns):
+            self.hits += 1
+            self._touch(entry_path)
+            return entry["value"]
+
+        raw = path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        if entry is not None and entry["sha256"] == digest:
+            self.hits += 1
+            value = entry["value"]
+        else:
+            self.misses += 1
+            value = safe_load(raw.decode("utf-8"))
+        self._write_entry(
+            entry_path,
+            {
+                "version": CACHE_VERSION,
+                "parser": self._parser,
+                "source": str(path.resolve()),
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": digest,
+                "value": value,
+            },
+        )
+        return value
+
+    def prune(self, max_bytes: Optional[int] = None) -> int:
+        """Evict least recently used entries until at most ``max_bytes`` remain; return the count."""
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        entries: List[Tuple[int, int, Path]] = []
+        for entry_path in self.directory.glob("*.pickle"):
+            try:
+                stat = entry_path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry_path))
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, entry_path in sorted(entries):
+            if total <= limit:
+                break
+            entry_path.unlink(missing_ok=True)
+            total -= size
+            evicted += 1
+        self._total = total
+        return evicted
+
+    def clear(self) -> None:
+        self.prune(0)
+
+    def _entry_path(self, path: Path) -> Path:
+        key = hashlib.sha256(str(path.resolve()).encode("utf-8")).hexdigest()
+        return self.directory / f"{key}.pickle"
+
+    def _read_entry(self, entry_path: Path) -> Optional[dict]:
+        try:
+            entry = pickle.loads(entry_path.read_bytes())
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            return None
+        if (
+            not isinstance(entry, dict)
+            or entry.get("version") != CACHE_VERSION
+            or entry.get("parser") != self._parser
+        ):
+            return None
+        return entry
+
+    def _write_entry(self, entry_path: Path, entry: dict) -> None:
+        blob = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            previous = entry_path.stat().st_size if entry_path.exists() else 0
+            tmp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(blob)
+            os.replace(tmp_path, entry_path)
+        except OSError:
+            # A read-only or full cache directory must never break a build.
+            return
+        if self._total is None:
+            self.prune()
+        else:
+            self._total += len(blob) - previous
+            if self._total > self.max_bytes:
+                self.prune(int(self.max_bytes * _PRUNE_TARGET))
+
+    @staticmethod
+    def _touch(entry_path: Path) -> None:
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+
+
+_default_cache: Optional[ParseCache] = None
+
+
+def default_parse_cache() -> Optional[ParseCache]:
+    """Return the process-wide cache, or ``None`` when caching is disabled."""
+    global _default_cache
+    directory = os.environ.get(CACHE_DIR_ENV, str(DEFAULT_CACHE_DIR))
+    if not directory:
+        return None
+    if _default_cache is None or _default_cache.directory != Path(directory):
+        _default_cache = ParseCache(Path(directory))
+    return _default_cache
+
+
+def cached_load_path(path: Path) -> Any:
+    """Drop-in replacement for :func:`safe_load_path` that goes through the default cache."""
+    cache = default_parse_cache()
+    if cache is None:
+        return simple_yaml.safe_load_path(path)
+    return cache.load_path(path)
@@ -0,0 +1,632 @@
+"""In-memory indexes that speed up glossary lookups.
+
+The API answers ``GET /terms?q=`` with a case-insensitive substring test over a
+handful of fields.  Rather than lowercasing every field of every term on each
+request, :class:`SubstringIndex` lowercases them once and keeps character
+n-gram postings so a query only has to confirm a small candidate set.
+:class:`FacetIndex` does the same for exact-match filters such as categories
+and roles, turning combined filters into set intersections.
+:class:`BM25Index` ranks free-text matches by relevance and tolerates typos,
+and :class:`PrefixIndex` completes names as the user types.
+
+Each index can :meth:`pack` itself into flat bytes and be rebuilt over them
+with ``from_packed``; the shared term store publishes those bytes so reader
+workers map one copy of the postings instead of each building their own.
+"""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import json
+import math
+import re
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Set, Tuple
+
+from .packed import PackedStrings, PackedTable, decode_text, pack_sections, pack_strings, pack_table, unpack_sections
+
+NGRAM_SIZE = 3
+# Field values are stored as one string so a candidate is confirmed with a
+# single ``in`` test; YAML text cannot carry a raw NUL, so it never appears in
+# a value and cannot create false matches across field boundaries.
+FIELD_SEPARATOR = "\x00"
+
+
+def _pack_json(value: object) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def _unpack_ids(view: memoryview) -> array:
+    ids = array("I")
+    ids.frombytes(view)
+    return ids
+
+
+class SubstringIndex:
+    """Answer ``query in value`` lookups using character n-gram postings.
+
+    Every n-gram of length ``1..ngram_size`` is indexed so short queries are
+    answered straight from the postings.  Longer queries intersect the postings
+    of their n-grams and confirm each candidate with a plain substring test,
+    which keeps results identical to a linear scan.
+    """
+
+    def __init__(self, documents: Mapping[str, Iterable[Optional[str]]], ngram_size: int = NGRAM_SIZE) -> None:
+        if ngram_size < 1:
+            raise ValueError("ngram_size must be at least 1")
+        self.ngram_size = ngram_size
+        self._order: Dict[str, int] = {}
+        self._next_position = 0
+        self._values: Dict[str, str] = {}
+        self._postings: Dict[str, Set[str]] = {}
+        # Set by from_packed: values and postings are then keyed by document
+        # number, and results are translated back to keys at the end.
+        self._packed_keys: Optional[List[str]] = None
+        for key, values in documents.items():
+            self.add(key, values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def add(self, key: str, values: Iterable[Optional[str]]) -> None:
+        if key in self._values:
+            raise KeyError(f"Duplicate key in substring index: {key}")
+        self._insert(key, values, None)
+
+    def replace(self, keys: Iterable[str], documents: Mapping[str, Iterable[Optional[str]]]) -> "SubstringIndex":
+        """Return a copy without ``keys`` and with ``documents`` (re)indexed.
+
+        Only the postings of n-grams the change touches are copied, so the
+        cost follows the size of the change rather than of the corpus.  A key
+        that is re-indexed keeps its place in :meth:`search` order.
+        """
+        index = SubstringIndex({}, self.ngram_size)
+        index._order = dict(self._order)
+        index._next_position = self._next_position
+        index._values = dict(self._values)
+        index._postings = dict(self._postings)
+        copied: Set[str] = set()
+        for key in {*keys, *documents}:
+            lowered = index._values.pop(key, None)
+            if lowered is None:
+                continue
+            for gram in self._ngrams(lowered):
+                bucket = index._writable(gram, copied)
+                bucket.discard(key)
+                if not bucket:
+                    del index._postings[gram]
+            if key not in documents:
+                del index._order[key]
+        for key, values in documents.items():
+            index._insert(key, values, copied)
+        return index
+
+    def _insert(self, key: str, values: Iterable[Optional[str]], copied: Optional[Set[str]]) -> None:
+        lowered = FIELD_SEPARATOR.join((value or "").lower() for value in values)
+        if key not in self._order:
+            self._order[key] = self._next_position
+            self._next_position += 1
+        self._values[key] = lowered
+        for gram in self._ngrams(lowered):
+            self._writable(gram, copied).add(key)
+
+    def pack(self) -> bytes:
+        """Return the index as bytes for :meth:`from_packed`."""
+        keys = sorted(self._values, key=self._order.__getitem__)
+        ids = {key: doc_id for doc_id, key in enumerate(keys)}
+        return pack_sections(
+            {
+                "meta": _pack_json({"ngram_size": self.ngram_size, "keys": keys}),
+                "values": pack_strings([self._values[key] for key in keys]),
+                "postings": pack_table(
+                    (gram, array("I", sorted(ids[key] for key in bucket)).tobytes())
+                    for gram, bucket in self._postings.items()
+                ),
+            }
+        )
+
+    @classmethod
+    def from_packed(cls, buffer: Any) -> "SubstringIndex":
+        """Return a read-only index over :meth:`pack` output, decoding postings on lookup."""
+        sections = unpack_sections(buffer)
+        meta = json.loads(bytes(sections["meta"]))
+        index = cls({}, meta["ngram_size"])
+        index._packed_keys = meta["keys"]
+        index._order = {key: position for position, key in enumerate(index._packed_keys)}
+        index._next_position = len(index._packed_keys)
+        index._values = PackedStrings(sections["values"])
+        index._postings = PackedTable(sections["postings"], lambda view: set(_unpack_ids(view)))
+        return index
+
+    def _writable(self, gram: str, copied: Optional[Set[str]]) -> Set[str]:
+        """Return ``gram``'s postings, copying a set still shared with the source index."""
+        if copied is None or gram in copied:
+            return self._postings.setdefault(gram, set())
+        copied.add(gram)
+        bucket = self._postings[gram] = set(self._postings.get(gram, ()))
+        return bucket
+
+    def search(self, query: str) -> List[str]:
+        """Return the keys whose values contain ``query``, in insertion order."""
+        matches = self.search_set(query)
+        return sorted(matches, key=self._order.__getitem__)
+
+    def search_set(self, query: str) -> Set[str]:
+        matches = self._search(query.lower())
+        if self._packed_keys is None:
+            return matches
+        keys = self._packed_keys
+        return {keys[doc_id] for doc_id in matches}
+
+    def _search(self, needle: str) -> Set[Any]:
+        if not needle:
+            return set(self._values)
+        if FIELD_SEPARATOR in needle:
+            return {
+                key
+                for key, value in self._values.items()
+                if any(needle in part for part in value.split(FIELD_SEPARATOR))
+            }
+        size = min(len(needle), self.ngram_size)
+        grams = {needle[i : i + size] for i in range(len(needle) - size + 1)}
+        postings = sorted((self._postings.get(gram, set()) for gram in grams), key=len)
+        if not postings[0]:
+            return set()
+        candidates = set(postings[0])
+        for bucket in postings[1:]:
+            candidates &= bucket
+            if not candidates:
+                return candidates
+        if len(needle) <= self.ngram_size:
+            return candidates
+        values = self._values
+        return {key for key in candidates if needle in values[key]}
+
+    def _ngrams(self, value: str) -> Set[str]:
+        grams: Set[str] = set()
+        length = len(value)
+        for size in range(1, self.ngram_size + 1):
+            grams.update(value[i : i + size] for i in range(length - size + 1))
+        return grams
+
+
+class FacetIndex:
+    """Map lowercased facet values to the set of keys that carry them."""
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, Set[str]] = {}
+        self._keys: Dict[str, Tuple[str, ...]] = {}
+        # Original spelling -> number of keys carrying it, so removals know when it goes.
+        self._raw: Dict[str, int] = {}
+        self._sorted: Optional[Tuple[str, ...]] = None
+
+    def add(self, key: str, values: Iterable[str]) -> None:
+        self._add(key, values, None)
+
+    def replace(self, keys: Iterable[str], items: Mapping[str, Iterable[str]]) -> "FacetIndex":
+        """Return a copy without ``keys`` and with ``items`` (re)added, copying only touched postings."""
+        index = FacetIndex()
+        index._postings = dict(self._postings)
+        index._keys = dict(self._keys)
+        index._raw = dict(self._raw)
+        copied: Set[str] = set()
+        for key in {*keys, *items}:
+            for value in index._keys.pop(key, ()):
+                lowered = value.lower()
+                bucket = index._writable(lowered, copied)
+                bucket.discard(key)
+                if not bucket:
+                    del index._postings[lowered]
+                index._raw[value] -= 1
+                if not index._raw[value]:
+                    del index._raw[value]
+        for key, values in items.items():
+            index._add(key, values, copied)
+        return index
+
+    def pack(self) -> bytes:
+        """Return the index as bytes for :meth:`from_packed`; facets are small, so this is JSON."""
+        return _pack_json(self._keys)
+
+    @classmethod
+    def from_packed(cls, buffer: Any) -> "FacetIndex":
+        index = cls()
+        for key, values in json.loads(bytes(buffer)).items():
+            index.add(key, values)
+        return index
+
+    def _add(self, key: str, values: Iterable[str], copied: Optional[Set[str]]) -> None:
+        values = tuple(values)
+        self._keys[key] = self._keys.get(key, ()) + values
+        for value in values:
+            self._writable(value.lower(), copied).add(key)
+            self._raw[value] = self._raw.get(value, 0) + 1
+        self._sorted = None
+
+    def _writable(self, lowered: str, copied: Optional[Set[str]]) -> Set[str]:
+        if copied is None or lowered in copied:
+            return self._postings.setdefault(lowered, set())
+        copied.add(lowered)
+        bucket = self._postings[lowered] = set(self._postings.get(lowered, ()))
+        return bucket
+
+    def lookup(self, values: Iterable[str]) -> Set[str]:
+        """Return the keys carrying any of ``values`` (compared case-insensitively)."""
+        matches: Set[str] = set()
+        for value in values:
+            matches |= self._postings.get(value.lower(), set())
+        return matches
+
+    def values(self) -> Tuple[str, ...]:
+        """Return the distinct values as originally spelled, sorted."""
+        if self._sorted is None:
+            self._sorted = tuple(sorted(self._raw))
+        return self._sorted
+
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def max_typo_distance(token: str) -> int:
+    """Edits tolerated for a token: none for short words, two for long ones."""
+    if len(token) < 4:
+        return 0
+    if len(token) < 8:
+        return 1
+    return 2
+
+
+def _deletes(word: str, distance: int) -> Set[str]:
+    variants = {word}
+    frontier = {word}
+    for _ in range(distance):
+        frontier = {item[:i] + item[i + 1 :] for item in frontier for i in range(len(item))}
+        variants |= frontier
+    return variants
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Optimal string alignment distance, or ``limit + 1`` once it exceeds ``limit``."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+class RankedResults(NamedTuple):
+    hits: List[Tuple[str, float]]
+    # Query tokens missing from the vocabulary -> the words searched instead.
+    corrections: Dict[str, List[str]]
+
+
+class _ImpactTable(Mapping[str, List[Tuple[int, float]]]):
+    """Token -> ``(doc id, BM25F impact)`` pairs, computed on first lookup and cached.
+
+    Impacts depend on corpus-wide statistics (document count and average
+    field lengths), so a :meth:`BM25Index.replace` starts a fresh table over
+    the patched frequencies instead of recomputing every posting up front.
+    """
+
+    def __init__(self, index: "BM25Index") -> None:
+        self._frequencies = index._frequencies
+        self._documents = index._documents
+        self._boosts = tuple(index._boosts.values())
+        self._k1 = index._k1
+        self._b = index._b
+        self._count = len(index._documents) or 1
+        self._averages = tuple((total / self._count) or 1.0 for total in index._totals)
+        self._cache: Dict[str, List[Tuple[int, float]]] = {}
+
+    def __getitem__(self, token: str) -> List[Tuple[int, float]]:
+        cached = self._cache.get(token)
+        if cached is None:
+            cached = self._cache[token] = self.compute(token)
+        return cached
+
+    def compute(self, token: str) -> List[Tuple[int, float]]:
+        """Return ``token``'s impacts without caching them."""
+        bucket = self._frequencies[token]
+        k1, b = self._k1, self._b
+        idf = math.log(1 + (self._count - len(bucket) + 0.5) / (len(bucket) + 0.5))
+        impacts = []
+        for doc_id, counts in bucket.items():
+            lengths = self._documents[doc_id][0]
+            weight = 0.0
+            for boost, average, count, length in zip(self._boosts, self._averages, counts, lengths):
+                if count:
+                    weight += count * boost / (1 - b + b * length / average)
+            impacts.append((doc_id, idf * weight * (k1 + 1) / (k1 + weight)))
+        return impacts
+
+    def __contains__(self, token: object) -> bool:
+        return token in self._frequencies
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._frequencies)
+
+    def __len__(self) -> int:
+        return len(self._frequencies)
+
+
+def _unpack_impacts(view: memoryview) -> List[Tuple[int, float]]:
+    count = len(view) // 12
+    impacts = array("d")
+    impacts.frombytes(view[4 * count :])
+    return list(zip(_unpack_ids(view[: 4 * count]), impacts))
+
+
+class BM25Index:
+    """Rank documents with BM25F over boosted fields, with a typo fallback.
+
+    Each field's term frequency is normalised by that field's average length,
+    scaled by the field boost and summed before BM25 saturation, so a hit in a
+    short, boosted field such as the term name outweighs one buried in a long
+    definition.  Per-token impacts are computed on a token's first query and
+    cached, which leaves later queries with one dictionary lookup and one pass
+    over the postings per token.
+
+    Query tokens that are not in the vocabulary are matched against words
+    within :func:`max_typo_distance` edits via a symmetric-delete index, and
+    their impact is multiplied by ``typo_penalty`` per edit.
+
+    :meth:`replace` re-tokenizes only the documents that changed; untouched
+    postings are shared with the source index.  :meth:`pack` stores the
+    computed impacts, so an index rebuilt with :meth:`from_packed` answers
+    queries but cannot be replaced.
+    """
+
+    def __init__(
+        self,
+        documents: Mapping[str, Mapping[str, str]],
+        boosts: Mapping[str, float],
+        k1: float = 1.2,
+        b: float = 0.75,
+        typo_penalty: float = 0.5,
+    ) -> None:
+        self.typo_penalty = typo_penalty
+        self._boosts = dict(boosts)
+        self._k1 = k1
+        self._b = b
+        self._keys: List[Optional[str]] = []
+        self._ids: Dict[str, int] = {}
+        # doc id -> (tokens per field, distinct tokens)
+        self._documents: Dict[int, Tuple[Tuple[int, ...], Tuple[str, ...]]] = {}
+        self._totals = [0] * len(self._boosts)
+        # token -> {doc id: occurrences per field}
+        self._frequencies: Dict[str, Dict[int, Tuple[int, ...]]] = {}
+        # Symmetric-delete variant -> words.  It only grows and is shared with
+        # replaced copies, so lookups skip words that left the vocabulary.
+        self._deletes: Dict[str, List[str]] = {}
+        self._fuzzy_words: Set[str] = set()
+        # Vocabulary size -> packed ``_deletes``; shared like ``_deletes`` so
+        # publishing a replaced copy skips re-packing when no word was added.
+        self._packed_deletes: Dict[int, bytes] = {}
+        # Most postings share a handful of per-field count tuples; store each once.
+        self._count_tuples: Dict[Tuple[int, ...], Tuple[int, ...]] = {}
+        for key, fields in documents.items():
+            self._add(key, fields, None)
+        self._postings = _ImpactTable(self)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def pack(self) -> bytes:
+        """Return the index as bytes for :meth:`from_packed`."""
+        rows = []
+        for token in self._frequencies:
+            impacts = self._postings.compute(token)
+            rows.append(
+                (
+                    token,
+                    array("I", [doc_id for doc_id, _ in impacts]).tobytes()
+                    + array("d", [impact for _, impact in impacts]).tobytes(),
+                )
+            )
+        deletes = self._packed_deletes.get(len(self._fuzzy_words))
+        if deletes is None:
+            deletes = pack_table(
+                (variant, "\0".join(words).encode("utf-8")) for variant, words in self._deletes.items()
+            )
+            self._packed_deletes.clear()
+            self._packed_deletes[len(self._fuzzy_words)] = deletes
+        return pack_sections(
+            {
+                "meta": _pack_json({"keys": self._keys, "typo_penalty": self.typo_penalty}),
+                "postings": pack_table(rows),
+                "deletes": deletes,
+            }
+        )
+
+    @classmethod
+    def from_packed(cls, buffer: Any) -> "BM25Index":
+        """Return a query-only index over :meth:`pack` output."""
+        sections = unpack_sections(buffer)
+        meta = json.loads(bytes(sections["meta"]))
+        index = cls({}, {}, typo_penalty=meta["typo_penalty"])
+        index._keys = meta["keys"]
+        index._ids = {key: doc_id for doc_id, key in enumerate(index._keys) if key is not None}
+        index._postings = PackedTable(sections["postings"], _unpack_impacts)
+        index._deletes = PackedTable(sections["deletes"], lambda view: decode_text(view).split("\0"))
+        return index
+
+    def replace(self, keys: Iterable[str], documents: Mapping[str, Mapping[str, str]]) -> "BM25Index":
+        """Return a copy without ``keys`` and with ``documents`` (re)indexed."""
+        index = BM25Index({}, self._boosts, self._k1, self._b, self.typo_penalty)
+        index._keys = list(self._keys)
+        index._ids = dict(self._ids)
+        index._documents = dict(self._documents)
+        index._totals = list(self._totals)
+        index._frequencies = dict(self._frequencies)
+        index._deletes = self._deletes
+        index._fuzzy_words = self._fuzzy_words
+        index._packed_deletes = self._packed_deletes
+        index._count_tuples = self._count_tuples
+        copied: Set[str] = set()
+        for key in {*keys, *documents}:
+            doc_id = index._ids.get(key)
+            if doc_id is None:
+                continue
+            lengths, tokens = index._documents.pop(doc_id)
+            index._totals = [total - length for total, length in zip(index._totals, lengths)]
+            for token in tokens:
+                bucket = index._writable(token, copied)
+                del bucket[doc_id]
+                if not bucket:
+                    del index._frequencies[token]
+            if key not in documents:
+                # Doc ids are positions in ``_keys``; a removed key leaves a hole.
+                del index._ids[key]
+                index._keys[doc_id] = None
+        for key, fields in documents.items():
+            index._add(key, fields, copied)
+        index._postings = _ImpactTable(index)
+        return index
+
+    def _add(self, key: str, fields: Mapping[str, str], copied: Optional[Set[str]]) -> None:
+        doc_id = self._ids.get(key)
+        if doc_id is None:
+            doc_id = self._ids[key] = len(self._keys)
+            self._keys.append(key)
+        counts: Dict[str, List[int]] = {}
+        lengths = []
+        for position, field in enumerate(self._boosts):
+            values = tokenize(fields.get(field) or "")
+            lengths.append(len(values))
+            for token in values:
+                counts.setdefault(token, [0] * len(self._boosts))[position] += 1
+        for token, per_field in counts.items():
+            per_field_counts = tuple(per_field)
+            self._writable(token, copied)[doc_id] = self._count_tuples.setdefault(per_field_counts, per_field_counts)
+            if token not in self._fuzzy_words:
+                self._fuzzy_words.add(token)
+                for variant in _deletes(token, max_typo_distance(token)):
+                    self._deletes.setdefault(variant, []).append(token)
+        self._documents[doc_id] = (tuple(lengths), tuple(counts))
+        self._totals = [total + length for total, length in zip(self._totals, lengths)]
+
+    def _writable(self, token: str, copied: Optional[Set[str]]) -> Dict[int, Tuple[int, ...]]:
+        if copied is None or token in copied:
+            return self._frequencies.setdefault(token, {})
+        copied.add(token)
+        bucket = self._frequencies[token] = dict(self._frequencies.get(token, {}))
+        return bucket
+
+    def search(self, query: str, limit: Optional[int] = None) -> RankedResults:
+        """Return ``(key, score)`` pairs, best first, plus any typo corrections."""
+        scores: Dict[int, float] = {}
+        corrections: Dict[str, List[str]] = {}
+        for token in dict.fromkeys(tokenize(query)):
+            if token in self._postings:
+                matches = [(token, 1.0)]
+            else:
+                matches = self._fuzzy(token)
+                if matches:
+                    corrections[token] = [word for word, _ in matches]
+            for word, factor in matches:
+                for doc_id, impact in self._postings[word]:
+                    scores[doc_id] = scores.get(doc_id, 0.0) + impact * factor
+
+        ranking_key = lambda item: (item[1], -item[0])  # noqa: E731
+        if limit is None:
+            ranked = sorted(scores.items(), key=ranking_key, reverse=True)
+        else:
+            ranked = heapq.nlargest(limit, scores.items(), key=ranking_key)
+        return RankedResults([(self._keys[doc_id], score) for doc_id, score in ranked], corrections)
+
+    def _fuzzy(self, token: str) -> List[Tuple[str, float]]:
+        distance = max_typo_distance(token)
+        if not distance:
+            return []
+        candidates: Set[str] = set()
+        for variant in _deletes(token, distance):
+            candidates.update(self._deletes.get(variant, ()))
+        matches: List[Tuple[str, float]] = []
+        for word in sorted(candidates):
+            if word not in self._postings:
+                continue
+            edits = edit_distance(token, word, distance)
+            if edits <= distance:
+                matches.append((word, self.typo_penalty**edits))
+        return matches
+
+
+def fold_name(name: str) -> str:
+    """Lowercase ``name`` and collapse punctuation so "RAG-eval" matches "rag eval"."""
+    return " ".join(tokenize(name))
+
+
+class PrefixIndex:
+    """Complete names from a sorted array of folded names.
+
+    A lookup is a binary search plus a short forward scan, so it costs
+    microseconds regardless of corpus size.  :meth:`replace` returns a new
+    index with some keys' rows swapped out using a linear merge instead of a
+    full re-sort, which keeps reloads proportional to the number of changes.
+    """
+
+    def __init__(self, rows: Iterable[Tuple[str, str]] = ()) -> None:
+        """Index ``(name, key)`` pairs; a key may appear under several names."""
+        self._set_rows(sorted(self._row(name, key) for name, key in rows))
+
+    def _set_rows(self, rows: List[Tuple[str, str, str]]) -> None:
+        self._rows = rows
+        self._folded = [row[0] for row in rows]
+
+    @staticmethod
+    def _row(name: str, key: str) -> Tuple[str, str, str]:
+        return (fold_name(name), key, name)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def pack(self) -> bytes:
+        """Return the rows as bytes for :meth:`from_packed`."""
+        return _pack_json(self._rows)
+
+    @classmethod
+    def from_packed(cls, buffer: Any) -> "PrefixIndex":
+        index = cls()
+        index._set_rows([tuple(row) for row in json.loads(bytes(buffer))])
+        return index
+
+    def complete(self, prefix: str, limit: int = 10) -> List[Tuple[str, str]]:
+        """Return up to ``limit`` ``(key, matched name)`` pairs in alphabetical order, one per key."""
+        folded = fold_name(prefix)
+        if not folded:
+            return []
+        results: List[Tuple[str, str]] = []
+        seen: Set[str] = set()
+        position = bisect.bisect_left(self._folded, folded)
+        while position < len(self._rows) and len(results) < limit:
+            name, key, original = self._rows[position]
+            if not name.startswith(folded):
+                break
+            if key not in seen:
+                seen.add(key)
+                results.append((key, original))
+            position += 1
+        return results
+
+    def replace(self, keys: Set[str], rows: Iterable[Tuple[str, str]]) -> "PrefixIndex":
+        """Return a copy without ``keys``' rows and with ``rows`` merged in."""
+        kept = [row for row in self._rows if row[1] not in keys]
+        added = sorted(self._row(name, key) for name, key in rows)
+        index = PrefixIndex()
+        index._set_rows(list(heapq.merge(kept, added)))
+        return index
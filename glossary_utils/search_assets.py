@@ -0,0 +1,252 @@
+"""Compact, shardable and precompressed search payloads for the static site.
+
+``site/docs/search.md`` downloads the whole search index before it becomes
+usable, so its size matters.  :func:`compact_search_index` turns the list of
+search records into::
+
+    {"version": 1, "fields": [...], "tables": {...}, "terms": [[...], ...]}
+
+where each term is a row of values in ``fields`` order and the repeated
+category, role, NIST tag and status strings are replaced by indexes into
+``tables``.  An interned value is therefore ``null``, an index, or a list of
+indexes.  :func:`expand_search_index` is the exact inverse.
+
+:func:`shard_search_index` splits the rows by first letter or by primary
+category into files the page fetches in parallel (and other clients can fetch
+one at a time), and :func:`precompressed_variants` produces ``.gz`` (and, when
+the optional ``brotli`` package is installed, ``.br``) siblings that static
+hosts serve without compressing on the fly.
+
+:func:`build_client_index` prebuilds the page's inverted index: sorted tokens,
+their delta-encoded postings and a table mapping every one- and two-character
+prefix to its slice of the token list, so a keystroke costs a few binary
+searches instead of a scan over every record.  :class:`ClientIndexReader`
+mirrors the page's lookup for tests and benchmarks.
+"""
+
+from __future__ import annotations
+
+import bisect
+import gzip
+import json
+import re
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Tuple
+
+from .search import tokenize
+
+try:  # pragma: no cover - optional dependency
+    import brotli
+except ModuleNotFoundError:  # pragma: no cover - fallback path
+    brotli = None
+
+COMPACT_VERSION = 1
+SEARCH_FIELDS = (
+    "term",
+    "aliases",
+    "categories",
+    "roles",
+    "short_def",
+    "nist_rmf_tags",
+    "status",
+    "last_reviewed",
+    "slug",
+)
+INTERNED_FIELDS = ("categories", "roles", "nist_rmf_tags", "status")
+SHARD_MODES = ("letter", "category")
+CLIENT_INDEX_VERSION = 1
+# The fields the page's free-text box searches.
+CLIENT_INDEX_FIELDS = ("term", "aliases", "short_def", "categories")
+PREFIX_TABLE_LENGTH = 2
+
+
+def encode_compact(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _intern(table: Dict[str, int], value: Any, field: str) -> int:
+    if not isinstance(value, str):
+        raise ValueError(f"Cannot intern non-string {field} value: {value!r}")
+    return table.setdefault(value, len(table))
+
+
+def compact_search_index(records: Sequence[Mapping[str, Any]]) -> Dict[str, Any]:
+    """Return the row-oriented form of ``records`` with interned lookup tables."""
+    tables: Dict[str, Dict[str, int]] = {field: {} for field in INTERNED_FIELDS}
+    rows: List[List[Any]] = []
+    for record in records:
+        row: List[Any] = []
+        for field in SEARCH_FIELDS:
+            value = record.get(field)
+            if field in tables and value is not None:
+                if isinstance(value, list):
+                    value = [_intern(tables[field], item, field) for item in value]
+                else:
+                    value = _intern(tables[field], value, field)
+            row.append(value)
+        rows.append(row)
+    return {
+        "version": COMPACT_VERSION,
+        "fields": list(SEARCH_FIELDS),
+        "tables": {field: list(table) for field, table in tables.items()},
+        "terms": rows,
+    }
+
+
+def expand_rows(payload: Mapping[str, Any], rows: Sequence[Sequence[Any]]) -> List[Dict[str, Any]]:
+    fields: List[str] = payload["fields"]
+    tables: Mapping[str, List[str]] = payload["tables"]
+    records: List[Dict[str, Any]] = []
+    for row in rows:
+        record: Dict[str, Any] = {}
+        for field, value in zip(fields, row):
+            table = tables.get(field)
+            if table is not None and value is not None:
+                value = [table[item] for item in value] if isinstance(value, list) else table[value]
+            record[field] = value
+        records.append(record)
+    return records
+
+
+def expand_search_index(payload: Mapping[str, Any]) -> List[Dict[str, Any]]:
+    """Rebuild the original search records from :func:`compact_search_index` output."""
+    return expand_rows(payload, payload["terms"])
+
+
+def shard_key(record: Mapping[str, Any], mode: str) -> str:
+    """Return the file-name-safe shard a record belongs to."""
+    if mode == "letter":
+        text = str(record.get("slug") or record.get("term") or "")
+        first = text[:1].lower()
+        if first.isascii() and first.isalpha():
+            return first
+        return "0-9" if first.isdigit() else "other"
+    if mode == "category":
+        categories = record.get("categories") or []
+        primary = str(categories[0]) if categories else "uncategorized"
+        return re.sub(r"[^a-z0-9]+", "-", primary.lower()).strip("-") or "uncategorized"
+    raise ValueError(f"Unknown shard mode: {mode}")
+
+
+def shard_search_index(
+    records: Sequence[Mapping[str, Any]], mode: str
+) -> Tuple[Dict[str, Any], Dict[str, List[List[Any]]]]:
+    """Split ``records`` into compact shards; return ``(manifest, {key: rows})``.
+
+    Every shard shares the manifest's lookup tables.  Records are placed by
+    :func:`shard_key` (a term's primary category when sharding by category),
+    so each term appears in exactly one shard and shard order follows
+    ``records``.
+    """
+    compact = compact_search_index(records)
+    shards: Dict[str, List[List[Any]]] = {}
+    for record, row in zip(records, compact["terms"]):
+        shards.setdefault(shard_key(record, mode), []).append(row)
+    manifest = {
+        "version": COMPACT_VERSION,
+        "shard_by": mode,
+        "fields": compact["fields"],
+        "tables": compact["tables"],
+        "shards": [{"key": key, "file": f"{key}.json", "terms": len(rows)} for key, rows in sorted(shards.items())],
+    }
+    return manifest, dict(sorted(shards.items()))
+
+
+def ordered_records(records: Sequence[Mapping[str, Any]], shard_by: Optional[str] = None) -> List[Mapping[str, Any]]:
+    """Return ``records`` in the order the page holds them once every shard is loaded."""
+    if shard_by is None:
+        return list(records)
+    # Shards are listed by key and keep input order inside, so a stable sort matches.
+    return sorted(records, key=lambda record: shard_key(record, shard_by))
+
+
+def _record_tokens(record: Mapping[str, Any]) -> Set[str]:
+    tokens: Set[str] = set()
+    for field in CLIENT_INDEX_FIELDS:
+        value = record.get(field)
+        for text in value if isinstance(value, list) else [value]:
+            if text:
+                tokens.update(tokenize(str(text)))
+    return tokens
+
+
+def build_client_index(records: Sequence[Mapping[str, Any]]) -> Dict[str, Any]:
+    """Return the inverted index the search page loads; doc ids are positions in ``records``."""
+    postings: Dict[str, List[int]] = {}
+    for doc_id, record in enumerate(records):
+        for token in _record_tokens(record):
+            postings.setdefault(token, []).append(doc_id)
+    tokens = sorted(postings)
+    prefixes: Dict[str, List[int]] = {}
+    for position, token in enumerate(tokens):
+        for length in range(1, PREFIX_TABLE_LENGTH + 1):
+            bounds = prefixes.setdefault(token[:length], [position, position])
+            bounds[1] = position + 1
+    encoded: List[List[int]] = []
+    for token in tokens:
+        doc_ids = postings[token]
+        encoded.append([doc_ids[0]] + [b - a for a, b in zip(doc_ids, doc_ids[1:])])
+    return {
+        "version": CLIENT_INDEX_VERSION,
+        "terms": len(records),
+        "tokens": tokens,
+        "postings": encoded,
+        "prefixes": prefixes,
+    }
+
+
+class ClientIndexReader:
+    """Answer queries against :func:`build_client_index` output the way the page does.
+
+    Every query token must be a prefix of some token in a matching record.
+    When no record matches that way, the page falls back to its substring
+    scan, so mid-word fragments such as ``former`` still find
+    ``transformer``.
+    """
+
+    def __init__(self, payload: Mapping[str, Any]) -> None:
+        self._tokens: List[str] = payload["tokens"]
+        self._prefixes: Mapping[str, List[int]] = payload["prefixes"]
+        self._postings: List[List[int]] = []
+        for gaps in payload["postings"]:
+            doc_ids, total = [], 0
+            for gap in gaps:
+                total += gap
+                doc_ids.append(total)
+            self._postings.append(doc_ids)
+
+    def prefix_matches(self, prefix: str) -> Set[int]:
+        bounds = self._prefixes.get(prefix[:PREFIX_TABLE_LENGTH])
+        if bounds is None:
+            return set()
+        start, end = bounds
+        matches: Set[int] = set()
+        position = bisect.bisect_left(self._tokens, prefix, start, end)
+        while position < end and self._tokens[position].startswith(prefix):
+            matches.update(self._postings[position])
+            position += 1
+        return matches
+
+    def search(self, query: str) -> Optional[List[int]]:
+        """Return matching doc ids in order, or ``None`` when the page should scan instead.
+
+        That is the case when ``query`` has no tokens to look up, or when no
+        record has words starting with all of them.
+        """
+        tokens = sorted(dict.fromkeys(tokenize(query)), key=len, reverse=True)
+        if not tokens:
+            return None
+        # Longer prefixes match fewer records, so start the intersection with them.
+        matches = self.prefix_matches(tokens[0])
+        for token in tokens[1:]:
+            if not matches:
+                break
+            matches &= self.prefix_matches(token)
+        return sorted(matches) if matches else None
+
+
+def precompressed_variants(data: bytes) -> Dict[str, Optional[bytes]]:
+    """Return ``{".gz": bytes, ".br": bytes or None}``; ``None`` means brotli is unavailable."""
+    # mtime=0 keeps the gzip header, and therefore unchanged outputs, byte-stable.
+    variants: Dict[str, Optional[bytes]] = {".gz": gzip.compress(data, compresslevel=9, mtime=0)}
+    variants[".br"] = brotli.compress(data, quality=11) if brotli is not None else None
+    return variants
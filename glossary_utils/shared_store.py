@@ -0,0 +1,282 @@
+"""Memory-mapped term snapshots shared between worker processes.
+
+One process (the publisher) serialises the term store into a generation file
+and flips a small ``CURRENT`` pointer to it.  Every other process maps the
+file read-only, so the bulky term bodies, and any index sections published
+with them, live once in the page cache rather than once per worker.  A
+generation file is ``MAGIC`` (8 bytes) followed by a
+:func:`~glossary_utils.packed.pack_sections` blob with these sections:
+
+* ``terms``: the compact UTF-8 JSON array of every term, exactly as the API
+  sends it;
+* ``rows``: a JSON list of ``[slug, offset, length]`` rows locating each term
+  inside that array;
+* any extra sections the publisher passed, such as packed search indexes.
+
+Serving a term, or the whole list, is therefore a slice of the mapping.  A
+reload writes a new generation next to the old one, so readers never observe
+a file that is still being written.
+
+Publisher election relies on ``fcntl.flock`` and is therefore POSIX-only.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import threading
+import time
+from datetime import date
+from pathlib import Path
+from typing import IO, Any, Callable, Collection, Dict, Generic, Iterable, Iterator, List, Mapping, Optional, Tuple, TypeVar
+
+from .packed import unpack_sections, write_sections
+
+try:  # pragma: no cover - platform dependent
+    import fcntl
+except ModuleNotFoundError:  # pragma: no cover - Windows
+    fcntl = None
+
+MAGIC = b"GLSHM003"
+POINTER_NAME = "CURRENT"
+LOCK_NAME = "publisher.lock"
+
+T = TypeVar("T")
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serialisable")
+
+
+def encode_json(value: Any) -> bytes:
+    """Encode ``value`` byte-for-byte like FastAPI's default ``JSONResponse``."""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=_json_default).encode("utf-8")
+
+
+def pack_terms(
+    terms: Mapping[str, Mapping[str, Any]],
+    previous: Optional[Mapping[str, bytes]] = None,
+    stale: Collection[str] = (),
+) -> Tuple[List[Tuple[str, int, int]], bytes]:
+    """Encode ``terms`` as one JSON array and locate each element inside it.
+
+    Terms found in ``previous`` and not listed in ``stale`` reuse their
+    encoded bytes, so a reload only encodes the terms that changed.
+    """
+    parts: List[bytes] = [b"["]
+    rows: List[Tuple[str, int, int]] = []
+    offset = 1
+    for position, (slug, term) in enumerate(terms.items()):
+        if position:
+            parts.append(b",")
+            offset += 1
+        if previous is not None and slug in previous and slug not in stale:
+            blob = previous[slug]
+        else:
+            blob = encode_json(term)
+        rows.append((slug, offset, len(blob)))
+        parts.append(blob)
+        offset += len(blob)
+    parts.append(b"]")
+    return rows, b"".join(parts)
+
+
+class EncodedTerms(Mapping[str, bytes]):
+    """Slug to encoded JSON over a packed term array (bytes or a view of a mapping)."""
+
+    def __init__(self, buffer: Any, rows: List[Tuple[str, int, int]]) -> None:
+        self._buffer = buffer
+        self._offsets: Dict[str, Tuple[int, int]] = {slug: (offset, size) for slug, offset, size in rows}
+
+    @classmethod
+    def pack(
+        cls,
+        terms: Mapping[str, Mapping[str, Any]],
+        previous: Optional[Mapping[str, bytes]] = None,
+        stale: Collection[str] = (),
+    ) -> "EncodedTerms":
+        """Encode ``terms``; see :func:`pack_terms` for reusing ``previous`` bytes."""
+        rows, array = pack_terms(terms, previous, stale)
+        return cls(array, rows)
+
+    def rows(self) -> List[Tuple[str, int, int]]:
+        """Return ``[slug, offset, length]`` rows relative to :meth:`array`."""
+        return [(slug, offset, size) for slug, (offset, size) in self._offsets.items()]
+
+    def array(self) -> bytes:
+        """Return the JSON array of every term in corpus order."""
+        return bytes(self._buffer)
+
+    def join(self, slugs: Iterable[str]) -> bytes:
+        """Return a JSON array of the given terms without re-encoding them."""
+        return b"[" + b",".join(self[slug] for slug in slugs) + b"]"
+
+    def __getitem__(self, slug: str) -> bytes:
+        offset, size = self._offsets[slug]
+        return bytes(self._buffer[offset : offset + size])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __contains__(self, slug: object) -> bool:
+        return slug in self._offsets
+
+
+def _generation_path(directory: Path, generation: int) -> Path:
+    return directory / f"terms-{generation:06d}.bin"
+
+
+def read_generation(directory: Path) -> Optional[int]:
+    try:
+        return int((directory / POINTER_NAME).read_text(encoding="utf-8").strip())
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def publish_terms(
+    directory: Path,
+    terms: Mapping[str, Mapping[str, Any]],
+    encoded: Optional[EncodedTerms] = None,
+    sections: Optional[Mapping[str, bytes]] = None,
+) -> int:
+    """Write ``terms`` as a new generation, point readers at it and return its number.
+
+    ``encoded`` may carry the terms already packed, which skips encoding them
+    again; ``sections`` are stored alongside and exposed as
+    :attr:`SharedTermMap.sections`.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    generation = (read_generation(directory) or 0) + 1
+
+    if encoded is None:
+        rows, array = pack_terms(terms)
+    else:
+        rows, array = encoded.rows(), encoded.array()
+    table = json.dumps(rows, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    target = _generation_path(directory, generation)
+    tmp_target = target.with_name(target.name + ".tmp")
+    with tmp_target.open("wb") as handle:
+        handle.write(MAGIC)
+        write_sections(handle.write, {**(sections or {}), "rows": table, "terms": array})
+    os.replace(tmp_target, target)
+
+    pointer = directory / POINTER_NAME
+    tmp_pointer = pointer.with_name(POINTER_NAME + ".tmp")
+    tmp_pointer.write_text(str(generation), encoding="utf-8")
+    os.replace(tmp_pointer, pointer)
+
+    # Keep the previous generation for readers that are about to switch; older
+    # files can go (POSIX keeps existing mappings valid after unlink).
+    for stale in directory.glob("terms-*.bin"):
+        if stale not in (target, _generation_path(directory, generation - 1)):
+            stale.unlink(missing_ok=True)
+    return generation
+
+
+class SharedTermMap(Mapping[str, dict]):
+    """Read-only mapping of slug to term backed by one mapped generation file."""
+
+    def __init__(self, path: Path, generation: int) -> None:
+        self.path = path
+        self.generation = generation
+        with path.open("rb") as handle:
+            self._mm = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[: len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a shared term snapshot")
+        sections = unpack_sections(memoryview(self._mm)[len(MAGIC) :])
+        rows = json.loads(bytes(sections.pop("rows")))
+        self.encoded = EncodedTerms(sections.pop("terms"), rows)
+        # Extra sections passed to publish_terms, as zero-copy views of the mapping.
+        self.sections: Dict[str, memoryview] = sections
+
+    @classmethod
+    def open(cls, directory: Path, generation: int) -> "SharedTermMap":
+        return cls(_generation_path(directory, generation), generation)
+
+    def __getitem__(self, slug: str) -> dict:
+        return json.loads(self.encoded[slug])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.encoded)
+
+    def __len__(self) -> int:
+        return len(self.encoded)
+
+    def __contains__(self, slug: object) -> bool:
+        return slug in self.encoded
+
+
+class SharedTermReader(Generic[T]):
+    """Follow the ``CURRENT`` pointer and rebuild a view when it moves.
+
+    The pointer is re-read at most every ``check_interval`` seconds, so the
+    steady-state cost per request is a clock read.
+    """
+
+    def __init__(
+        self, directory: Path, build: Callable[[SharedTermMap], T], check_interval: float = 1.0
+    ) -> None:
+        self.directory = directory
+        self.check_interval = check_interval
+        self._build = build
+        self._state: Optional[Tuple[int, T]] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> Optional[int]:
+        state = self._state
+        return None if state is None else state[0]
+
+    def current(self, wait: float = 0.0, force: bool = False) -> Optional[T]:
+        """Return the view for the newest generation, or ``None`` if none exists.
+
+        ``wait`` bounds how long to wait for a publisher that has not written
+        its first generation yet; ``force`` skips the ``check_interval``.
+        """
+        state = self._state
+        now = time.monotonic()
+        if state is not None and not force and now - self._checked_at < self.check_interval:
+            return state[1]
+        deadline = now + wait
+        with self._lock:
+            while True:
+                self._checked_at = time.monotonic()
+                generation = read_generation(self.directory)
+                state = self._state
+                if generation is not None and (state is None or state[0] != generation):
+                    try:
+                        view = self._build(SharedTermMap.open(self.directory, generation))
+                    except FileNotFoundError:
+                        # Superseded between reading the pointer and opening the
+                        # file; keep the mapped generation and retry next check.
+                        pass
+                    else:
+                        self._state = state = (generation, view)
+                if state is not None or time.monotonic() >= deadline:
+                    return None if state is None else state[1]
+                time.sleep(0.05)
+
+
+def try_acquire_publisher(directory: Path) -> Optional[IO[str]]:
+    """Return an open lock handle if this process should publish, else ``None``.
+
+    The handle must stay open for as long as the process publishes.
+    """
+    if fcntl is None:
+        raise RuntimeError("Shared term snapshots require fcntl (POSIX)")
+    directory.mkdir(parents=True, exist_ok=True)
+    handle = (directory / LOCK_NAME).open("w")
+    try:
+        fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        handle.close()
+        return None
+    return handle
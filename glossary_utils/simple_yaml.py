@@ -1,10 +1,12 @@
 """YAML helpers with graceful fallback for the glossary project.
 
-The project prefers :func:`yaml.safe_load` from PyYAML so values such as
+The project prefers PyYAML's safe loader so values such as
 ``"Silence alerts: skip postmortems"`` remain plain strings instead of being
-parsed as nested dictionaries.  For environments where PyYAML is unavailable
-we retain a tiny parser that understands the limited subset of YAML found in
-``data/terms``.
+parsed as nested dictionaries.  When PyYAML was built against libyaml the C
+``CSafeLoader`` is used, which parses the same documents several times faster
+than the pure-Python ``SafeLoader``.  For environments where PyYAML is
+unavailable we retain a tiny parser that understands the limited subset of
+YAML found in ``data/terms``.
 """
 
 from __future__ import annotations
@@ -18,13 +20,32 @@ try:  # pragma: no cover - exercised implicitly through public helpers
 except ModuleNotFoundError:  # pragma: no cover - fallback path
     yaml = None
 
+# PyYAML only exposes the libyaml bindings when it was compiled against them.
+SafeLoader = None if yaml is None else getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class SimpleYAMLParser:
+    """Indentation-driven parser for the YAML subset used by ``data/terms``.
+
+    Every line is stripped and measured once up front, and parsing is a single
+    forward pass over those arrays.  A mapping that starts on a sequence item
+    (``- key: value``) is parsed in place: the item's own line is re-read as
+    if the dash were indentation, ``base_indent`` moves past the dash and
+    ``_item_limit`` confines the nested block to the item's more deeply
+    indented (or blank) lines.
+    """
+
     lines: List[str]
     base_indent: int = 0
     index: int = 0
 
+    def __post_init__(self) -> None:
+        self._stripped = [line.strip() for line in self.lines]
+        self._indents = [self.absolute_indent(line) for line in self.lines]
+        # Column the current sequence item's lines must be indented past; -1 outside items.
+        self._item_limit = -1
+
     @classmethod
     def from_text(cls, text: str, base_indent: int = 0) -> "SimpleYAMLParser":
         lines = [line.rstrip("\n") for line in text.splitlines()]
@@ -34,14 +55,12 @@ class SimpleYAMLParser:
         return self.parse_block(0)
 
     def parse_block(self, indent: int) -> Any:
-        while self.index < len(self.lines):
-            line = self.lines[self.index]
-            stripped = line.strip()
+        while self._available():
+            stripped = self._stripped[self.index]
             if not stripped or stripped.startswith("#"):
                 self.index += 1
                 continue
-            current_indent = self.get_indent(line)
-            if current_indent < indent:
+            if self.get_indent(self.index) < indent:
                 break
             if stripped.startswith("- "):
                 return self.parse_sequence(indent)
@@ -50,17 +69,15 @@ class SimpleYAMLParser:
 
     def parse_mapping(self, indent: int) -> dict:
         result: dict = {}
-        while self.index < len(self.lines):
-            line = self.lines[self.index]
-            stripped = line.strip()
+        while self._available():
+            stripped = self._stripped[self.index]
             if not stripped or stripped.startswith("#"):
                 self.index += 1
                 continue
-            current_indent = self.get_indent(line)
-            if current_indent < indent or stripped.startswith("- "):
+            if self.get_indent(self.index) < indent or stripped.startswith("- "):
                 break
             if ":" not in stripped:
-                raise ValueError(f"Unsupported YAML mapping line: {line}")
+                raise ValueError(f"Unsupported YAML mapping line: {self.lines[self.index]}")
             key, rest = stripped.split(":", 1)
             key = key.strip()
             rest = rest.strip()
@@ -77,14 +94,12 @@ class SimpleYAMLParser:
 
     def parse_sequence(self, indent: int) -> list:
         result: list = []
-        while self.index < len(self.lines):
-            line = self.lines[self.index]
-            stripped = line.strip()
+        while self._available():
+            stripped = self._stripped[self.index]
             if not stripped or stripped.startswith("#"):
                 self.index += 1
                 continue
-            current_indent = self.get_indent(line)
-            if current_indent < indent or not stripped.startswith("- "):
+            if self.get_indent(self.index) < indent or not stripped.startswith("- "):
                 break
             item_content = stripped[2:]
             self.index += 1
@@ -103,32 +118,31 @@ class SimpleYAMLParser:
         return result
 
     def parse_nested_item(self, indent: int, first_line: str) -> Any:
-        item_lines: List[str] = [" " * (self.base_indent + indent + 2) + first_line]
-        while self.index < len(self.lines):
-            next_line = self.lines[self.index]
-            stripped = next_line.strip()
-            if not stripped:
-                item_lines.append(next_line)
+        item_index = self.index - 1
+        outer_base, outer_limit = self.base_indent, self._item_limit
+        self.base_indent = outer_base + indent + 2
+        self._item_limit = outer_base + indent
+        self._stripped[item_index] = first_line.strip()
+        self._indents[item_index] = self.base_indent + self.absolute_indent(first_line)
+        self.index = item_index
+        try:
+            value = self.parse_block(0)
+            # Item lines the nested block stopped short of are skipped, not reparsed.
+            while self._available():
                 self.index += 1
-                continue
-            next_indent = self.get_indent(next_line)
-            if next_indent <= indent:
-                break
-            item_lines.append(next_line)
-            self.index += 1
-        sub_parser = SimpleYAMLParser(item_lines, base_indent=self.base_indent + indent + 2)
-        return sub_parser.parse_block(0)
+        finally:
+            self.base_indent, self._item_limit = outer_base, outer_limit
+        return value
 
     def parse_folded_block(self, indent: int) -> str:
         lines: List[str] = []
-        while self.index < len(self.lines):
+        while self._available():
             line = self.lines[self.index]
-            stripped = line.strip("\n")
-            if not stripped:
+            if not line:
                 lines.append("")
                 self.index += 1
                 continue
-            if self.get_indent(line) < indent + 2:
+            if self.get_indent(self.index) < indent + 2:
                 break
             trimmed = line[self.base_indent + indent + 2 :]
             lines.append(trimmed.rstrip())
@@ -146,8 +160,12 @@ class SimpleYAMLParser:
             paragraphs.append(" ".join(part.strip() for part in current).strip())
         return "\n\n".join(paragraphs)
 
-    def get_indent(self, line: str) -> int:
-        return max(0, self.absolute_indent(line) - self.base_indent)
+    def get_indent(self, index: int) -> int:
+        return max(0, self._indents[index] - self.base_indent)
+
+    def _available(self) -> bool:
+        index = self.index
+        return index < len(self.lines) and (self._indents[index] > self._item_limit or not self._stripped[index])
 
     @staticmethod
     def absolute_indent(line: str) -> int:
@@ -177,7 +195,7 @@ def parse_scalar(text: str) -> Any:
 
 def safe_load(text: str) -> Any:
     if yaml is not None:
-        return yaml.safe_load(text)  # type: ignore[no-any-return]
+        return yaml.load(text, Loader=SafeLoader)  # type: ignore[no-any-return]
     parser = SimpleYAMLParser.from_text(text)
     return parser.parse()
 
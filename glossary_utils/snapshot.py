@@ -0,0 +1,129 @@
+"""Prebuilt binary snapshots of the parsed ``data/terms`` corpus.
+
+``scripts/build_index.py`` writes the parsed YAML of every term file into one
+versioned pickle so services can start with a single file read instead of
+parsing the whole corpus.  The file records, for every source file, its size,
+modification time and SHA-256 digest.  :func:`load_snapshot` only returns the
+entries when they still describe the directory on disk: files whose stamp
+matches are trusted without being read, and files whose stamp moved (a fresh
+checkout, for example) are confirmed by hashing their bytes, which is far
+cheaper than parsing them.
+
+Snapshots are pickles and must only be loaded from build directories you
+control.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_FILENAME = "terms.snapshot"
+
+FileStamp = Tuple[int, int]
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def write_snapshot(
+    path: Path,
+    data_dir: Path,
+    entries: Mapping[Path, Any],
+    records: Optional[Mapping[Path, Mapping[str, Any]]] = None,
+) -> int:
+    """Serialise parsed ``entries`` (keyed by source path) and return the byte size.
+
+    ``records`` may supply each source's ``size``, ``mtime_ns`` and ``sha256``
+    (as produced by :func:`glossary_utils.manifest.scan_sources`) so the
+    sources are not read and hashed again.
+    """
+    files: Dict[str, Dict[str, Any]] = {}
+    payload_entries: Dict[str, Any] = {}
+    for source, entry in entries.items():
+        if records is not None and source in records:
+            record = records[source]
+            files[source.name] = {key: record[key] for key in ("size", "mtime_ns", "sha256")}
+        else:
+            raw = source.read_bytes()
+            stat = source.stat()
+            files[source.name] = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": _digest(raw),
+            }
+        payload_entries[source.name] = entry
+    payload = pickle.dumps({"files": files, "entries": payload_entries}, protocol=pickle.HIGHEST_PROTOCOL)
+    envelope = pickle.dumps(
+        {"version": SNAPSHOT_VERSION, "sha256": _digest(payload), "payload": payload},
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(envelope)
+    os.replace(tmp_path, path)
+    return len(envelope)
+
+
+def _read_content(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        envelope = pickle.loads(path.read_bytes())
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        return None
+    if not isinstance(envelope, dict) or envelope.get("version") != SNAPSHOT_VERSION:
+        return None
+    payload = envelope.get("payload")
+    if not isinstance(payload, bytes) or _digest(payload) != envelope.get("sha256"):
+        return None
+    return pickle.loads(payload)
+
+
+def read_snapshot_entries(path: Path) -> Optional[Dict[str, Tuple[Dict[str, Any], Any]]]:
+    """Return ``{file name: (recorded source, entry)}`` without checking the sources on disk.
+
+    The recorded source is the ``size``, ``mtime_ns`` and ``sha256`` the
+    snapshot was written for.  Incremental builds use this to reuse the
+    entries of files whose digest has not changed, and to tell whether the
+    snapshot still describes the sources at all.
+    """
+    content = _read_content(path)
+    if content is None:
+        return None
+    files = content["files"]
+    return {name: (files[name], entry) for name, entry in content["entries"].items()}
+
+
+def load_snapshot(
+    path: Path, data_dir: Path, pattern: str = "*.yml"
+) -> Optional[Tuple[Dict[Path, FileStamp], Dict[Path, Any]]]:
+    """Return ``(stamps, entries)`` keyed by source path, or ``None`` if stale.
+
+    A missing, corrupt or outdated snapshot returns ``None`` so callers can
+    fall back to parsing YAML.
+    """
+    content = _read_content(path)
+    if content is None:
+        return None
+    files: Dict[str, Dict[str, Any]] = content["files"]
+
+    sources = sorted(data_dir.glob(pattern))
+    if [source.name for source in sources] != sorted(files):
+        return None
+
+    stamps: Dict[Path, FileStamp] = {}
+    for source in sources:
+        recorded = files[source.name]
+        stat = source.stat()
+        if stat.st_size != recorded["size"]:
+            return None
+        if stat.st_mtime_ns != recorded["mtime_ns"] and _digest(source.read_bytes()) != recorded["sha256"]:
+            return None
+        stamps[source] = (stat.st_mtime_ns, stat.st_size)
+
+    entries = content["entries"]
+    return stamps, {source: entries[source.name] for source in sources}
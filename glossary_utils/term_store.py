@@ -0,0 +1,196 @@
+"""Incrementally reloaded, snapshot-based store for glossary term files.
+
+:class:`TermStore` remembers the modification time and size of every file it
+has parsed.  A refresh stats the directory, reparses only the files that were
+added or changed, drops the ones that disappeared and publishes a new
+immutable :class:`StoreSnapshot` with a single reference swap, so readers keep
+using the previous snapshot until the new one is complete.
+
+A ``bootstrap`` callable can seed the very first snapshot, for example from a
+prebuilt :mod:`glossary_utils.snapshot` file, so a cold start skips parsing.
+
+Changes can be picked up by calling :meth:`TermStore.refresh` directly or by
+starting a background watcher.  The watcher uses ``watchfiles`` (inotify on
+Linux, shipped with ``uvicorn[standard]``) when it is installed and falls back
+to polling otherwise.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Generic, List, Mapping, Optional, Tuple, TypeVar
+
+from .parallel import load_paths, thread_safe_context
+from .simple_yaml import safe_load_path
+
+try:  # pragma: no cover - optional dependency
+    import watchfiles
+except ModuleNotFoundError:  # pragma: no cover - fallback path
+    watchfiles = None
+
+T = TypeVar("T")
+FileStamp = Tuple[int, int]
+
+
+@dataclass(frozen=True)
+class StoreSnapshot(Generic[T]):
+    generation: int
+    stamps: Mapping[Path, FileStamp]
+    entries: Mapping[Path, Any]
+    view: T
+
+
+@dataclass(frozen=True)
+class RefreshResult:
+    generation: int
+    added: List[Path] = field(default_factory=list)
+    modified: List[Path] = field(default_factory=list)
+    removed: List[Path] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.modified or self.removed)
+
+
+class TermStore(Generic[T]):
+    """Hold parsed term files plus a derived view and reload them incrementally.
+
+    ``loader`` turns one file into an entry and is only called for new or
+    changed files.  ``build`` turns the ordered ``{path: entry}`` mapping into
+    the view readers consume (for example a slug dictionary plus indexes).
+    ``bootstrap`` may return ``(stamps, entries)`` for the first load, or
+    ``None`` to fall back to calling ``loader`` on every file.  When
+    ``update`` is given it replaces ``build`` on reloads and receives the
+    previous snapshot plus the :class:`RefreshResult`, so parts of the view
+    can be patched instead of rebuilt.  Changed files are handed to
+    :func:`~glossary_utils.parallel.load_paths`, so a large batch (a fresh
+    start or a branch switch) is parsed by up to ``workers`` processes.  The
+    watcher refreshes from a background thread while the server's threads
+    keep running, so those processes come from
+    :func:`~glossary_utils.parallel.thread_safe_context` rather than ``fork``.
+    """
+
+    def __init__(
+        self,
+        data_dir: Path,
+        build: Callable[[Mapping[Path, Any]], T],
+        loader: Callable[[Path], Any] = safe_load_path,
+        pattern: str = "*.yml",
+        bootstrap: Optional[Callable[[], Optional[Tuple[Mapping[Path, FileStamp], Mapping[Path, Any]]]]] = None,
+        update: Optional[Callable[["StoreSnapshot[T]", Mapping[Path, Any], "RefreshResult"], T]] = None,
+        workers: Optional[int] = None,
+    ) -> None:
+        self.data_dir = data_dir
+        self.pattern = pattern
+        self._build = build
+        self._loader = loader
+        self._bootstrap = bootstrap
+        self._update = update
+        self.workers = workers
+        self._snapshot: Optional[StoreSnapshot[T]] = None
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watcher: Optional[threading.Thread] = None
+
+    def snapshot(self) -> StoreSnapshot[T]:
+        """Return the current snapshot, loading the directory on first use."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            self.refresh()
+            snapshot = self._snapshot
+        assert snapshot is not None
+        return snapshot
+
+    def current(self) -> T:
+        return self.snapshot().view
+
+    def refresh(self, force: bool = False) -> RefreshResult:
+        """Reparse added or changed files and publish a new snapshot.
+
+        With ``force`` every file is reparsed, which also covers edits that
+        kept both the size and the modification time of a file.
+        """
+        with self._refresh_lock:
+            previous = self._snapshot
+            if previous is None and not force and self._bootstrap is not None:
+                seeded = self._bootstrap()
+                if seeded is not None:
+                    stamps, entries = seeded
+                    self._snapshot = StoreSnapshot(
+                        generation=1, stamps=dict(stamps), entries=dict(entries), view=self._build(entries)
+                    )
+                    return RefreshResult(generation=1, added=list(entries))
+            old_stamps: Mapping[Path, FileStamp] = {} if previous is None or force else previous.stamps
+            old_entries: Mapping[Path, Any] = {} if previous is None else previous.entries
+
+            stamps = self._scan()
+            added = [path for path in stamps if path not in old_stamps and path not in old_entries]
+            modified = [
+                path
+                for path, stamp in stamps.items()
+                if old_stamps.get(path) != stamp and path not in added
+            ]
+            removed = [path for path in old_entries if path not in stamps]
+            if previous is not None and not (added or modified or removed):
+                return RefreshResult(generation=previous.generation)
+
+            reparsed = load_paths(added + modified, self._loader, self.workers, mp_context=thread_safe_context())
+            entries = {
+                path: reparsed[path] if path in reparsed else old_entries[path]
+                for path in stamps
+            }
+            generation = 1 if previous is None else previous.generation + 1
+            result = RefreshResult(generation=generation, added=added, modified=modified, removed=removed)
+            if previous is not None and self._update is not None:
+                view = self._update(previous, entries, result)
+            else:
+                view = self._build(entries)
+            self._snapshot = StoreSnapshot(generation=generation, stamps=stamps, entries=entries, view=view)
+            return result
+
+    def start_watching(self, interval: float = 2.0) -> None:
+        """Refresh in a daemon thread whenever files under ``data_dir`` change."""
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        self._stop.clear()
+        if watchfiles is not None:
+            target, args = self._watch_events, ()
+        else:
+            target, args = self._watch_polling, (interval,)
+        self._watcher = threading.Thread(target=target, args=args, name="term-store-watcher", daemon=True)
+        self._watcher.start()
+
+    def stop_watching(self) -> None:
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join(timeout=5)
+            self._watcher = None
+
+    def _scan(self) -> Dict[Path, FileStamp]:
+        stamps: Dict[Path, FileStamp] = {}
+        for path in sorted(self.data_dir.glob(self.pattern)):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            stamps[path] = (stat.st_mtime_ns, stat.st_size)
+        return stamps
+
+    def _refresh_quietly(self) -> None:
+        # A file caught halfway through an editor save may not parse; keep
+        # serving the previous snapshot and retry on the next change.
+        try:
+            self.refresh()
+        except Exception as error:  # noqa: BLE001
+            print(f"Term store refresh failed: {error}", file=sys.stderr)
+
+    def _watch_polling(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            self._refresh_quietly()
+
+    def _watch_events(self) -> None:  # pragma: no cover - needs a live filesystem watcher
+        for _changes in watchfiles.watch(self.data_dir, stop_event=self._stop):
+            self._refresh_quietly()
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import argparse
+import filecmp
+import hashlib
 import json
+import os
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import sys
 
@@ -14,9 +17,35 @@ REPO_ROOT = CURRENT_DIR.parent
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-from glossary_utils import safe_load_path
+from glossary_utils import SNAPSHOT_FILENAME, iter_paths, load_paths, read_snapshot_entries, write_snapshot
+from glossary_utils.manifest import (
+    SourceRecord,
+    diff_sources,
+    encode_manifest,
+    load_manifest,
+    scan_sources,
+    write_if_changed,
+)
+from glossary_utils.search_assets import (
+    SHARD_MODES,
+    build_client_index,
+    compact_search_index,
+    encode_compact,
+    ordered_records,
+    precompressed_variants,
+    shard_search_index,
+)
 
 SITE_ASSETS_DIR = REPO_ROOT / "site" / "docs" / "assets"
+MANIFEST_FILENAME = "build-manifest.json"
+GLOSSARY_FILENAME = "glossary.json"
+SEARCH_INDEX_FILENAME = "search-index.json"
+NDJSON_FILENAME = "glossary.ndjson"
+OUTPUT_FILENAMES = (GLOSSARY_FILENAME, SEARCH_INDEX_FILENAME, NDJSON_FILENAME)
+SITE_SEARCH_PATH = SITE_ASSETS_DIR / "glossary-search.json"
+SITE_SHARD_DIR = SITE_ASSETS_DIR / "glossary-search"
+SITE_CLIENT_INDEX_PATH = SITE_ASSETS_DIR / "glossary-search-index.json"
+COMPRESSED_SUFFIXES = (".gz", ".br")
 
 
 def normalize_term(term: str) -> str:
@@ -26,42 +55,355 @@ def normalize_term(term: str) -> str:
     return slug
 
 
-def load_terms(data_dir: Path) -> List[Dict[str, Any]]:
-    terms: List[Dict[str, Any]] = []
-    for path in sorted(data_dir.glob("*.yml")):
-        data = safe_load_path(path) or {}
-        if not isinstance(data, dict):
-            raise ValueError(f"Expected mapping in {path}")
-        canonical = str(data.get("term", path.stem))
-        data["slug"] = normalize_term(canonical)
-        data["_source_file"] = str(path)
-        terms.append(data)
-    return terms
+def read_term_files(data_dir: Path, workers: Optional[int] = None) -> Dict[Path, Any]:
+    return load_paths(sorted(data_dir.glob("*.yml")), workers=workers)
+
+
+def prepare_term(path: Path, data: Any) -> Dict[str, Any]:
+    data = data or {}
+    if not isinstance(data, dict):
+        raise ValueError(f"Expected mapping in {path}")
+    canonical = str(data.get("term", path.stem))
+    data["slug"] = normalize_term(canonical)
+    data["_source_file"] = str(path)
+    return data
+
+
+def prepare_terms(sources: Dict[Path, Any]) -> List[Dict[str, Any]]:
+    return [prepare_term(path, data) for path, data in sources.items()]
+
+
+def load_terms(data_dir: Path, workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    return prepare_terms(read_term_files(data_dir, workers))
+
+
+def iter_terms(paths: Iterable[Path], workers: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """Yield prepared terms one at a time, in ``paths`` order."""
+    for path, data in iter_paths(paths, workers=workers):
+        yield prepare_term(path, data)
+
+
+def search_record(entry: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "term": entry.get("term"),
+        "aliases": entry.get("aliases", []),
+        "categories": entry.get("categories", []),
+        "roles": entry.get("roles", []),
+        "short_def": entry.get("short_def"),
+        "nist_rmf_tags": entry.get("governance", {}).get("nist_rmf_tags", []),
+        "status": entry.get("status"),
+        "last_reviewed": entry.get("last_reviewed"),
+        "slug": entry.get("slug"),
+    }
 
 
 def build_search_index(terms: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    index: List[Dict[str, Any]] = []
-    for entry in terms:
-        index.append(
-            {
-                "term": entry.get("term"),
-                "aliases": entry.get("aliases", []),
-                "categories": entry.get("categories", []),
-                "roles": entry.get("roles", []),
-                "short_def": entry.get("short_def"),
-                "nist_rmf_tags": entry.get("governance", {}).get("nist_rmf_tags", []),
-                "status": entry.get("status"),
-                "last_reviewed": entry.get("last_reviewed"),
-                "slug": entry.get("slug"),
-            }
+    return [search_record(entry) for entry in terms]
+
+
+# The aggregated files are spliced from per-term fragments encoded exactly as
+# ``json.dump(..., indent=2)`` would encode them in place, so an incremental
+# build only encodes changed terms.  JSON strings cannot contain raw newlines,
+# which makes re-indenting and splitting on line structure safe.
+
+
+def encode_fragment(value: Any, level: int) -> str:
+    """Encode ``value`` as it appears ``level`` containers deep in an indented dump."""
+    return json.dumps(value, indent=2, ensure_ascii=False).replace("\n", "\n" + "  " * level)
+
+
+def join_fragments(fragments: List[str], level: int) -> str:
+    """Return the indented JSON array of encoded object ``fragments``."""
+    if not fragments:
+        return "[]"
+    separator = "\n" + "  " * (level + 1)
+    return "[" + separator + ("," + separator).join(fragments) + "\n" + "  " * level + "]"
+
+
+def split_fragments(text: str, level: int) -> List[str]:
+    """Inverse of :func:`join_fragments` for arrays of objects."""
+    separator = "\n" + "  " * (level + 1)
+    closing = "\n" + "  " * level + "]"
+    if text == "[]":
+        return []
+    if not (text.startswith("[" + separator + "{") and text.endswith(closing)):
+        raise ValueError("Not an indented JSON array of objects")
+    # Lines inside an object are indented deeper, so only element boundaries
+    # have the array's own indentation directly followed by "{".
+    parts = text[len("[" + separator) : -len(closing)].split("," + separator + "{")
+    return parts[:1] + ["{" + part for part in parts[1:]]
+
+
+def encode_line(value: Any) -> str:
+    """Encode ``value`` as one ``glossary.ndjson`` line."""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def glossary_json(fragments: List[str]) -> str:
+    return '{\n  "terms": ' + join_fragments(fragments, 1) + "\n}"
+
+
+def search_index_json(fragments: List[str]) -> str:
+    return join_fragments(fragments, 0)
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class StreamedOutput:
+    """Write an output file piece by piece, then replace ``path`` only if its bytes changed.
+
+    Comparing the finished temporary file with the current one keeps
+    unchanged outputs' mtimes, like :func:`write_if_changed`, without holding
+    either file in memory.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        self._file = self._tmp_path.open("wb")
+        self._hash = hashlib.sha256()
+
+    def write(self, text: str) -> None:
+        data = text.encode("utf-8")
+        self._hash.update(data)
+        self._file.write(data)
+
+    def finish(self) -> Tuple[bool, str]:
+        """Close the stream and return ``(written, sha256)``."""
+        self._file.close()
+        if self.path.is_file() and filecmp.cmp(self._tmp_path, self.path, shallow=False):
+            self._tmp_path.unlink()
+            return False, self._hash.hexdigest()
+        os.replace(self._tmp_path, self.path)
+        return True, self._hash.hexdigest()
+
+    def abort(self) -> None:
+        self._file.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+
+def stream_outputs(
+    output_dir: Path,
+    terms: Iterable[Dict[str, Any]],
+    search_sink: Optional[List[Dict[str, Any]]] = None,
+) -> Tuple[int, List[Path], Dict[str, str]]:
+    """Write the aggregated outputs one term at a time; return ``(count, written, digests)``.
+
+    The bytes match :func:`glossary_json`, :func:`search_index_json` and
+    joined :func:`encode_line` output for the same terms, so streamed and
+    in-memory builds are interchangeable, including for incremental reuse.
+    Each search record is appended to ``search_sink`` when given, so the
+    site payload comes from the same pass; that list grows with the corpus.
+    """
+    streams = {name: StreamedOutput(output_dir / name) for name in OUTPUT_FILENAMES}
+    glossary, search, ndjson = (streams[name] for name in OUTPUT_FILENAMES)
+    count = 0
+    try:
+        glossary.write('{\n  "terms": [')
+        search.write("[")
+        for term in terms:
+            separator = "," if count else ""
+            glossary.write(separator + "\n    " + encode_fragment(term, 2))
+            record = search_record(term)
+            fragment = encode_fragment(record, 1)
+            search.write(separator + "\n  " + fragment)
+            if search_sink is not None:
+                search_sink.append(record)
+            ndjson.write(encode_line(term))
+            count += 1
+        glossary.write("\n  ]\n}" if count else "]\n}")
+        search.write("\n]" if count else "]")
+    except BaseException:
+        for stream in streams.values():
+            stream.abort()
+        raise
+    finished = {name: stream.finish() for name, stream in streams.items()}
+    written = [output_dir / name for name, (changed, _) in finished.items() if changed]
+    return count, written, {name: digest for name, (_, digest) in finished.items()}
+
+
+def reusable_fragments(
+    previous: Dict[str, SourceRecord], outputs: Dict[str, str], output_dir: Path
+) -> Dict[str, Tuple[str, str, str]]:
+    """Map unchanged source names to their ``(glossary, search, ndjson)`` fragments from the last build.
+
+    The previous outputs are only trusted when their digests match the ones the
+    manifest recorded, i.e. nobody edited them since.
+    """
+    try:
+        glossary_bytes, search_bytes, ndjson_bytes = (
+            (output_dir / name).read_bytes() for name in OUTPUT_FILENAMES
         )
-    return index
+    except OSError:
+        return {}
+    current = dict(zip(OUTPUT_FILENAMES, map(_digest, (glossary_bytes, search_bytes, ndjson_bytes))))
+    if any(outputs.get(name) != digest for name, digest in current.items()):
+        return {}
+    glossary_text = glossary_bytes.decode("utf-8")
+    prefix, suffix = '{\n  "terms": ', "\n}"
+    try:
+        if not (glossary_text.startswith(prefix) and glossary_text.endswith(suffix)):
+            raise ValueError("Unexpected glossary.json layout")
+        glossary = split_fragments(glossary_text[len(prefix) : -len(suffix)], 1)
+        search = split_fragments(search_bytes.decode("utf-8"), 0)
+    except ValueError:
+        return {}
+    lines = ndjson_bytes.decode("utf-8").splitlines(keepends=True)
+    names = sorted(previous)
+    if not len(names) == len(glossary) == len(search) == len(lines):
+        return {}
+    return {name: (glossary[i], search[i], lines[i]) for i, name in enumerate(names)}
+
+
+def reusable_entries(
+    records: Dict[Path, SourceRecord], snapshot: Optional[Dict[str, Tuple[Dict[str, Any], Any]]]
+) -> Dict[str, Any]:
+    """Return the raw snapshot entries whose source digest still matches ``records``."""
+    digests = {path.name: record["sha256"] for path, record in records.items()}
+    return {
+        name: entry
+        for name, (source, entry) in (snapshot or {}).items()
+        if digests.get(name) == source["sha256"]
+    }
+
+
+def site_search_files(
+    search_bytes: bytes, records: List[Dict[str, Any]], search_format: str, shard_by: Optional[str]
+) -> Dict[Path, bytes]:
+    """Return the search payload files the static site should serve.
+
+    ``records`` are the entries ``search_bytes`` encodes.  The prebuilt
+    inverted index comes last; its doc ids are positions in the term list the
+    page assembles from the other files.
+    """
+    if shard_by is None:
+        payload = search_bytes if search_format == "indented" else encode_compact(compact_search_index(records))
+        files = {SITE_SEARCH_PATH: payload}
+    else:
+        # When sharded, glossary-search.json becomes the manifest the page reads first.
+        manifest, shards = shard_search_index(records, shard_by)
+        files = {SITE_SHARD_DIR / f"{key}.json": encode_compact(rows) for key, rows in shards.items()}
+        files[SITE_SEARCH_PATH] = encode_compact(manifest)
+    files[SITE_CLIENT_INDEX_PATH] = encode_compact(build_client_index(ordered_records(records, shard_by)))
+    return files
+
+
+def _encoded_sizes(data: bytes, variants: Dict[str, Optional[bytes]]) -> Dict[str, Optional[int]]:
+    sizes: Dict[str, Optional[int]] = {"": len(data)}
+    sizes.update({suffix: None if blob is None else len(blob) for suffix, blob in variants.items()})
+    return sizes
+
+
+def write_site_search(
+    files: Dict[Path, bytes], precompress: bool
+) -> Tuple[int, Dict[Path, Dict[str, Optional[int]]]]:
+    """Write ``files`` plus compressed siblings, drop stale ones and return ``(written, sizes)``.
+
+    ``sizes`` maps each file to its bytes per encoding (``""`` for the plain
+    file); ``None`` marks an encoding that could not be produced.
+    """
+    written = 0
+    sizes: Dict[Path, Dict[str, Optional[int]]] = {}
+    expected = set()
+    for path, data in files.items():
+        written += write_if_changed(path, data)
+        expected.add(path)
+        variants = precompressed_variants(data)
+        sizes[path] = _encoded_sizes(data, variants)
+        for suffix in COMPRESSED_SUFFIXES:
+            blob = variants[suffix]
+            if blob is not None and precompress:
+                sibling = path.with_name(path.name + suffix)
+                written += write_if_changed(sibling, blob)
+                expected.add(sibling)
+    # A stale shard or compressed copy would be served instead of fresh data.
+    candidates = [
+        path.with_name(path.name + suffix)
+        for path in (SITE_SEARCH_PATH, SITE_CLIENT_INDEX_PATH)
+        for suffix in COMPRESSED_SUFFIXES
+    ]
+    if SITE_SHARD_DIR.is_dir():
+        candidates += sorted(SITE_SHARD_DIR.iterdir())
+    for path in candidates:
+        if path not in expected and path.is_file():
+            path.unlink()
+    if SITE_SHARD_DIR.is_dir() and not any(SITE_SHARD_DIR.iterdir()):
+        SITE_SHARD_DIR.rmdir()
+    return written, sizes
+
+
+def _total_sizes(sizes: List[Dict[str, Optional[int]]]) -> Dict[str, Optional[int]]:
+    totals: Dict[str, Optional[int]] = {}
+    for key in ("", ".gz", ".br"):
+        values = [row[key] for row in sizes]
+        totals[key] = None if None in values else sum(values)
+    return totals
+
+
+def _size_row(label: str, sizes: Dict[str, Optional[int]]) -> str:
+    cells = [f"{sizes[key]:>10,}" if sizes[key] is not None else f"{'-':>10}" for key in ("", ".gz", ".br")]
+    return f"  {label:<32}" + "".join(cells)
+
+
+def build_in_memory(
+    args: argparse.Namespace,
+    records: Dict[Path, SourceRecord],
+    previous: Optional[Dict[str, SourceRecord]],
+    manifest: Optional[Dict[str, Any]],
+) -> Tuple[int, List[Path], Dict[str, str], bytes, Optional[int], List[str]]:
+    """Build the outputs (and snapshot) reusing unchanged fragments.
+
+    Returns ``(processed, written, output digests, search bytes, snapshot size, removed names)``.
+    """
+    snapshot_path = args.output_dir / SNAPSHOT_FILENAME
+    snapshot = None if args.no_snapshot else read_snapshot_entries(snapshot_path)
+    fragments: Dict[str, Tuple[str, str, str]] = {}
+    entries: Dict[str, Any] = {}
+    removed: List[str] = []
+    if previous is not None:
+        changed, removed = diff_sources(records, previous)
+        unchanged = {path.name for path in records} - {path.name for path in changed}
+        fragments = {
+            name: parts
+            for name, parts in reusable_fragments(previous, manifest.get("outputs", {}), args.output_dir).items()
+            if name in unchanged
+        }
+        if not args.no_snapshot:
+            entries = reusable_entries(records, snapshot)
+    stale = [
+        path
+        for path in records
+        if path.name not in fragments or (not args.no_snapshot and path.name not in entries)
+    ]
+    parsed = load_paths(stale, workers=args.workers)
+
+    # Pickle the untouched parse results before prepare_term annotates them.
+    snapshot_size = None
+    # Compare with what the snapshot itself recorded rather than with the
+    # manifest: a --stream build updates the manifest but not the snapshot.
+    # Stamps are recorded too, so a touched file refreshes it as well.
+    signature = {path.name: record for path, record in records.items()}
+    recorded = None if snapshot is None else {name: source for name, (source, _) in snapshot.items()}
+    if not args.no_snapshot and recorded != signature:
+        snapshot_entries = {path: parsed[path] if path in parsed else entries[path.name] for path in records}
+        snapshot_size = write_snapshot(snapshot_path, args.data_dir, snapshot_entries, records)
 
+    for path, data in parsed.items():
+        term = prepare_term(path, data)
+        fragments[path.name] = (encode_fragment(term, 2), encode_fragment(search_record(term), 1), encode_line(term))
+    ordered = [fragments[path.name] for path in records]
 
-def write_json(path: Path, payload: Any) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2, ensure_ascii=False)
+    glossary_bytes = glossary_json([glossary for glossary, _, _ in ordered]).encode("utf-8")
+    search_bytes = search_index_json([search for _, search, _ in ordered]).encode("utf-8")
+    ndjson_bytes = "".join(line for _, _, line in ordered).encode("utf-8")
+    outputs = dict(zip(OUTPUT_FILENAMES, (glossary_bytes, search_bytes, ndjson_bytes)))
+    paths = {name: args.output_dir / name for name in outputs}
+    written = [paths[name] for name, data in outputs.items() if write_if_changed(paths[name], data)]
+    output_digests = {name: _digest(data) for name, data in outputs.items()}
+    return len(parsed), written, output_digests, search_bytes, snapshot_size, removed
 
 
 def main() -> None:
@@ -78,24 +420,99 @@ def main() -> None:
         default=Path("build"),
         help="Directory for generated JSON files",
     )
+    parser.add_argument(
+        "--no-snapshot",
+        action="store_true",
+        help=f"Skip writing the binary {SNAPSHOT_FILENAME} the API loads at startup",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes used to parse YAML (default: GLOSSARY_PARSE_WORKERS or CPU count)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=f"Reprocess only terms whose content changed since the last build (tracked in {MANIFEST_FILENAME})",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream terms one at a time into glossary.json, glossary.ndjson and search-index.json "
+        "instead of holding every term in memory (always a full rebuild; skips the snapshot)",
+    )
+    parser.add_argument(
+        "--search-format",
+        choices=("indented", "compact"),
+        default="compact",
+        help="Site search payload format: compact rows with interned lookup tables (the committed asset), "
+        "or indented records",
+    )
+    parser.add_argument(
+        "--shard-by",
+        choices=SHARD_MODES,
+        default=None,
+        help="Split the site search payload into compact shards listed by glossary-search.json",
+    )
+    parser.add_argument(
+        "--precompress",
+        action="store_true",
+        help="Also write .gz (and .br when brotli is installed) copies of the site search files",
+    )
     args = parser.parse_args()
+    if args.stream and args.incremental:
+        parser.error("--stream rebuilds every output and cannot be combined with --incremental")
 
-    terms = load_terms(args.data_dir)
-    if not terms:
-        raise SystemExit(f"No term files found in {args.data_dir}")
+    manifest_path = args.output_dir / MANIFEST_FILENAME
+    snapshot_path = args.output_dir / SNAPSHOT_FILENAME
+    manifest = load_manifest(manifest_path) if args.incremental else None
+    previous: Optional[Dict[str, SourceRecord]] = None
+    if manifest is not None and manifest.get("data_dir") == str(args.data_dir):
+        previous = manifest["sources"]
 
-    glossary_payload = {"terms": terms}
-    search_payload = build_search_index(terms)
+    records = scan_sources(args.data_dir, previous)
+    if not records:
+        raise SystemExit(f"No term files found in {args.data_dir}")
 
-    write_json(args.output_dir / "glossary.json", glossary_payload)
-    write_json(args.output_dir / "search-index.json", search_payload)
+    snapshot_size = None
+    removed: List[str] = []
+    if args.stream:
+        # The site payload and client index are built from every search
+        # record at once, so only the three aggregated outputs stream.
+        search_records: List[Dict[str, Any]] = []
+        processed, written, output_digests = stream_outputs(
+            args.output_dir, iter_terms(records, args.workers), search_records
+        )
+        search_bytes = (args.output_dir / SEARCH_INDEX_FILENAME).read_bytes()
+    else:
+        processed, written, output_digests, search_bytes, snapshot_size, removed = build_in_memory(
+            args, records, previous, manifest
+        )
+        search_records = json.loads(search_bytes)
 
     # Ensure the MkDocs site has access to the search payload for client-side lookup.
-    write_json(SITE_ASSETS_DIR / "glossary-search.json", search_payload)
+    site_files = site_search_files(search_bytes, search_records, args.search_format, args.shard_by)
+    site_written, site_sizes = write_site_search(site_files, args.precompress)
+    baseline_sizes = _encoded_sizes(search_bytes, precompressed_variants(search_bytes))
+    payload_sizes = _total_sizes([row for path, row in site_sizes.items() if path != SITE_CLIENT_INDEX_PATH])
+    write_if_changed(manifest_path, encode_manifest(args.data_dir, records, output_digests))
 
     print(
-        f"Wrote {len(terms)} term(s) to {args.output_dir / 'glossary.json'} and search index."
+        f"Processed {processed} of {len(records)} term(s)"
+        + (f", dropped {len(removed)} removed term(s)" if removed else "")
+        + f"; wrote {len(written)} of {len(OUTPUT_FILENAMES)} output file(s), the rest were unchanged."
     )
+    layout = args.search_format if args.shard_by is None else f"{len(site_files) - 2} shard(s) by {args.shard_by}"
+    print(f"Wrote {site_written} site search file(s); payload sizes in bytes:")
+    print(f"  {'':<32}{'raw':>10}{'gzip':>10}{'brotli':>10}")
+    print(_size_row("indented (before)", baseline_sizes))
+    print(_size_row(f"{layout} (after)", payload_sizes))
+    print(_size_row("prebuilt inverted index", site_sizes[SITE_CLIENT_INDEX_PATH]))
+    if snapshot_size is not None:
+        print(f"Wrote API snapshot to {snapshot_path} ({snapshot_size} bytes).")
+    elif args.stream and not args.no_snapshot:
+        print("Skipped the API snapshot: it needs the whole corpus in memory, which --stream avoids.")
 
 
 if __name__ == "__main__":
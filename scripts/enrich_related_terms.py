@@ -1,18 +1,34 @@
 # scripts/enrich_related_terms.py
 from __future__ import annotations
+import argparse
+import bisect
+import hashlib
+import heapq
 import json
 import math
 import os
 import re
+from array import array
 from collections import Counter
+from itertools import chain
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, Iterator, List, Tuple
 from urllib.parse import urlparse
 
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
 IN = Path("build/glossary.json")
+# Written next to glossary.json by build_index.py; read line by line when present.
+IN_NDJSON = Path("build/glossary.ndjson")
 OUT_JSON = Path("build/related.json")
 # IMPORTANT: since mkdocs.yml lives under site/, docs_dir is "docs"
 OUT_DIR = Path("site/docs/includes/related")  # MkDocs will include these via --8<--
+# Text hashes, full-precision neighbour lists and include hashes from the last run.
+OUT_STATE = Path("build/related-state.json")
+RELATED_INCREMENTAL_ENV = "GLOSSARY_RELATED_INCREMENTAL"
 
 S3_INPUT_ENV = "INPUT_S3_URI"
 S3_OUTPUT_ENV = "OUTPUT_S3_PREFIX"
@@ -21,6 +37,22 @@ AWS_REGION_ENV = "AWS_REGION"
 MODEL = "sentence-transformers/all-MiniLM-L6-v2"  # fast CPU model
 TOP_K = 8
 CACHE_DIR = Path(os.environ.get("GLOSSARY_EMBEDDING_CACHE", "models/all-MiniLM-L6-v2")).expanduser()
+# Encoded term vectors from earlier runs, keyed by model and text hash; set it empty to disable.
+EMBEDDING_STORE_ENV = "GLOSSARY_EMBEDDING_STORE"
+_store_dir = os.environ.get(EMBEDDING_STORE_ENV, "build/embeddings")
+EMBEDDING_STORE_DIR = Path(_store_dir).expanduser() if _store_dir else None
+# Upper bound on the scratch arrays of one block of similarity rows.
+BLOCK_BYTES = int(os.environ.get("GLOSSARY_SIMILARITY_BLOCK_BYTES", 64 * 2**20))
+COMMON_TOKEN_FRACTION = 16  # tokens in >= 1/16 of the terms are scored densely
+# "exact" (default) or "ivf"; see NEIGHBOUR_BACKENDS.
+NEIGHBOUR_BACKEND_ENV = "GLOSSARY_NEIGHBOUR_BACKEND"
+IVF_LISTS_ENV = "GLOSSARY_IVF_LISTS"
+IVF_PROBES_ENV = "GLOSSARY_IVF_PROBES"
+IVF_PROBES = 8
+KMEANS_SAMPLE_PER_LIST = 64
+# Terms whose exact neighbours are recomputed to report an approximate backend's recall.
+RECALL_SAMPLE_ENV = "GLOSSARY_RECALL_SAMPLE"
+RECALL_SAMPLE = 1000
 
 
 def _parse_s3_uri(uri: str) -> Tuple[str, str]:
@@ -47,19 +79,22 @@ def _s3_client():
     return boto3.client("s3")
 
 
-def _maybe_download_input() -> None:
+def _maybe_download_input() -> Path | None:
     uri = os.environ.get(S3_INPUT_ENV)
     if not uri:
-        return
+        return None
 
     bucket, key = _parse_s3_uri(uri)
     client = _s3_client()
-    IN.parent.mkdir(parents=True, exist_ok=True)
-    print(f"Downloading glossary from {uri} -> {IN}")
-    client.download_file(bucket, key, str(IN))
+    target = IN_NDJSON if key.endswith(".ndjson") else IN
+    target.parent.mkdir(parents=True, exist_ok=True)
+    print(f"Downloading glossary from {uri} -> {target}")
+    client.download_file(bucket, key, str(target))
+    return target
 
 
-def _maybe_upload_outputs() -> None:
+def _maybe_download_previous_run() -> None:
+    """Fetch the state file and embedding store saved by the previous Batch run, if any."""
     prefix = os.environ.get(S3_OUTPUT_ENV)
     if not prefix:
         return
@@ -67,49 +102,400 @@ def _maybe_upload_outputs() -> None:
     bucket, root_key = _parse_s3_uri(prefix)
     base = root_key.rstrip("/")
     client = _s3_client()
+    targets = [(OUT_STATE, OUT_STATE.name)]
+    if EMBEDDING_STORE_DIR is not None:
+        targets += [(path, f"embeddings/{path.name}") for path in _embedding_store_paths(EMBEDDING_STORE_DIR)]
+    for path, name in targets:
+        key = f"{base}/{name}" if base else name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            client.download_file(bucket, key, str(path))
+        except Exception as error:  # first run, or the object was never uploaded
+            print(f"Nothing to reuse at s3://{bucket}/{key} ({error})")
+
+
+def _maybe_upload_outputs(includes: List[Path] | None = None, removed: List[Path] = ()) -> None:
+    """Upload the outputs; only ``includes`` and deletions of ``removed`` when given."""
+    prefix = os.environ.get(S3_OUTPUT_ENV)
+    if not prefix:
+        return
 
-    json_key = f"{base}/related.json" if base else "related.json"
-    print(f"Uploading {OUT_JSON} -> s3://{bucket}/{json_key}")
-    client.upload_file(str(OUT_JSON), bucket, json_key)
+    bucket, root_key = _parse_s3_uri(prefix)
+    base = root_key.rstrip("/")
+    client = _s3_client()
+
+    for path in (OUT_JSON, OUT_STATE):
+        key = f"{base}/{path.name}" if base else path.name
+        print(f"Uploading {path} -> s3://{bucket}/{key}")
+        client.upload_file(str(path), bucket, key)
 
     md_prefix = f"{base}/includes" if base else "includes"
-    for path in OUT_DIR.glob("*.md"):
+    for path in OUT_DIR.glob("*.md") if includes is None else includes:
         dest_key = f"{md_prefix}/{path.name}" if md_prefix else path.name
         print(f"Uploading {path} -> s3://{bucket}/{dest_key}")
         client.upload_file(str(path), bucket, dest_key)
+    for path in removed:
+        dest_key = f"{md_prefix}/{path.name}"
+        print(f"Deleting s3://{bucket}/{dest_key}")
+        client.delete_object(Bucket=bucket, Key=dest_key)
+
+    if EMBEDDING_STORE_DIR is not None:
+        for path in _embedding_store_paths(EMBEDDING_STORE_DIR):
+            if path.exists():
+                dest_key = f"{base}/embeddings/{path.name}" if base else f"embeddings/{path.name}"
+                print(f"Uploading {path} -> s3://{bucket}/{dest_key}")
+                client.upload_file(str(path), bucket, dest_key)
 
 
 def _tokenize(text: str) -> List[str]:
     return re.findall(r"\b\w+\b", text.lower())
 
 
-def _tfidf_embeddings(texts: List[str]) -> List[dict[str, float]]:
-    tokenised = [Counter(_tokenize(text)) for text in texts]
-    doc_freq: Counter[str] = Counter()
-    for bucket in tokenised:
-        doc_freq.update(bucket.keys())
+SparseVector = Tuple[array, array]
+
+
+def _tfidf_embeddings(texts: List[str]) -> List[SparseVector]:
+    """Return L2-normalised TF-IDF vectors as ``(token ids, weights)`` array pairs.
+
+    Tokens are interned to integer ids in order of first appearance, and each
+    vector lists its tokens in the order they first occur in its text.
+    """
+    vocabulary: Dict[str, int] = {}
+    doc_freq: List[int] = []
+    tokenised: List[Dict[int, int]] = []
+    for text in texts:
+        counts: Dict[int, int] = {}
+        for token in _tokenize(text):
+            token_id = vocabulary.setdefault(token, len(vocabulary))
+            counts[token_id] = counts.get(token_id, 0) + 1
+        doc_freq.extend([0] * (len(vocabulary) - len(doc_freq)))
+        for token_id in counts:
+            doc_freq[token_id] += 1
+        tokenised.append(counts)
     total_docs = len(texts)
+    idf = [math.log((total_docs + 1) / (freq + 1)) + 1 for freq in doc_freq]
 
-    vectors: List[dict[str, float]] = []
-    for bucket in tokenised:
-        total_terms = sum(bucket.values()) or 1
-        normalised: dict[str, float] = {}
+    vectors: List[SparseVector] = []
+    for counts in tokenised:
+        total_terms = sum(counts.values()) or 1
+        weights = array("d")
         norm = 0.0
-        for term, count in bucket.items():
-            tf = count / total_terms
-            idf = math.log((total_docs + 1) / (doc_freq[term] + 1)) + 1
-            weight = tf * idf
-            normalised[term] = weight
+        for token_id, count in counts.items():
+            weight = count / total_terms * idf[token_id]
+            weights.append(weight)
             norm += weight * weight
         norm = math.sqrt(norm) or 1.0
-        vectors.append({term: weight / norm for term, weight in normalised.items()})
+        vectors.append((array("l", counts), array("d", [weight / norm for weight in weights])))
     return vectors
 
 
-def _sparse_cosine(a: dict[str, float], b: dict[str, float]) -> float:
-    if len(a) > len(b):
-        a, b = b, a
-    return sum(weight * b.get(term, 0.0) for term, weight in a.items())
+Neighbours = List[List[Tuple[float, int]]]
+
+
+def _sparse_top_k(vectors: List[SparseVector], k: int) -> Neighbours:
+    """Pure-Python top ``k`` for TF-IDF vectors, scoring only pairs that share a token.
+
+    Postings are kept ordered by vector length, so each term walks only the
+    postings of terms at least as long as itself and pushes the score to the
+    longer term's list too. Every score is summed over the shorter vector's
+    tokens in its own order, exactly as ``sum(weight * b.get(token, 0.0))``
+    over the shorter dict used to, so results match the old all-pairs loop
+    bit for bit. Pairs without a shared token score zero (``0`` when either
+    vector is empty, like an empty ``sum``).
+    """
+    total = len(vectors)
+    lengths = [len(ids) for ids, _ in vectors]
+    postings: Dict[int, Tuple[List[int], List[float], List[int]]] = {}
+    for doc in sorted(range(total), key=lengths.__getitem__):
+        for token_id, weight in zip(*vectors[doc]):
+            docs, weights, sizes = postings.setdefault(token_id, ([], [], []))
+            docs.append(doc)
+            weights.append(weight)
+            sizes.append(lengths[doc])
+
+    heaps: List[List[Tuple[float, int]]] = [[] for _ in range(total)]
+    for i, (ids, weights) in enumerate(vectors):
+        length = lengths[i]
+        scores: Dict[int, float] = {}
+        get = scores.get
+        for token_id, weight in zip(ids, weights):
+            docs, post_weights, sizes = postings[token_id]
+            start = bisect.bisect_left(sizes, length)
+            for j, other in zip(docs[start:], post_weights[start:]):
+                scores[j] = get(j, 0) + weight * other
+        scores.pop(i, None)
+
+        heap = heaps[i]
+        for j, score in scores.items():
+            item = (score, j)
+            if len(heap) < k:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                heapq.heapreplace(heap, item)
+            if lengths[j] > length:
+                # Same sum the longer term would compute over this term's tokens.
+                other_heap = heaps[j]
+                item = (score, i)
+                if len(other_heap) < k:
+                    heapq.heappush(other_heap, item)
+                elif item > other_heap[0]:
+                    heapq.heapreplace(other_heap, item)
+
+    neighbours: Neighbours = []
+    for i, heap in enumerate(heaps):
+        top = sorted(heap, reverse=True)
+        seen = {j for _, j in top}
+        j = total - 1
+        while len(top) < k and j >= 0:
+            if j != i and j not in seen:
+                top.append((0 if not lengths[i] or not lengths[j] else 0.0, j))
+            j -= 1
+        neighbours.append(top)
+    return neighbours
+
+
+def _pairwise_top_k(embeddings, flavour: str, k: int) -> Neighbours:
+    """Top ``k`` neighbours in pure Python, used when NumPy is not installed."""
+    if flavour != "dense":
+        return _sparse_top_k(embeddings, k)
+    neighbours: Neighbours = []
+    for i, a in enumerate(embeddings):
+        scores = []
+        for j, b in enumerate(embeddings):
+            if i == j:
+                continue
+            scores.append((float(sum(x * y for x, y in zip(a, b))), j))
+        scores.sort(reverse=True)
+        neighbours.append(scores[:k])
+    return neighbours
+
+
+def _select_top_k(block, rows, k: int, columns=None) -> Neighbours:
+    """Return each row's ``k`` best ``(score, index)`` pairs, skipping the row itself.
+
+    ``rows`` holds the term index of every block row and ``columns`` the sorted
+    term index of every block column (all terms when omitted). Rows are ordered
+    like ``sorted(..., reverse=True)`` on ``(score, index)`` tuples, i.e. ties go
+    to the higher index, so results match the pure loop.
+    """
+    own = rows if columns is None else np.searchsorted(columns, rows)
+    block[np.arange(len(rows)), own] = -np.inf
+    k = min(k, block.shape[1] - 1)
+    if k <= 0:
+        return [[] for _ in rows]
+    part = np.argpartition(block, -k, axis=1)[:, -k:]
+    thresholds = np.take_along_axis(block, part, axis=1).min(axis=1)
+    neighbours: Neighbours = []
+    for row, threshold in zip(block, thresholds):
+        # Everything tied with the k-th score competes on the column index.
+        candidates = np.flatnonzero(row >= threshold)
+        order = candidates[np.lexsort((-candidates, -row[candidates]))[:k]]
+        labels = order if columns is None else columns[order]
+        neighbours.append([(float(row[j]), int(label)) for j, label in zip(order, labels)])
+    return neighbours
+
+
+def _dense_score_blocks(embeddings):
+    """Yield ``(first row, scores)`` blocks of the cosine matrix of unit vectors."""
+    matrix = np.ascontiguousarray(embeddings, dtype=np.float32)
+    total = matrix.shape[0]
+    rows = max(1, BLOCK_BYTES // (4 * total))
+    for start in range(0, total, rows):
+        yield start, matrix[start : start + rows] @ matrix.T
+
+
+def _sparse_csr(vectors: List[SparseVector]):
+    """Pack sparse vectors as CSR arrays ``(indptr, indices, data, vocabulary size)``."""
+    indptr = np.zeros(len(vectors) + 1, dtype=np.int64)
+    np.cumsum([len(ids) for ids, _ in vectors], out=indptr[1:])
+    indices = np.fromiter(chain.from_iterable(ids for ids, _ in vectors), dtype=np.int64, count=int(indptr[-1]))
+    data = np.fromiter(chain.from_iterable(weights for _, weights in vectors), dtype=np.float64, count=int(indptr[-1]))
+    return indptr, indices, data, int(indices.max()) + 1 if len(indices) else 0
+
+
+def _sparse_score_blocks(vectors: List[SparseVector]):
+    """Yield ``(first row, scores)`` blocks of sparse dot products without SciPy.
+
+    Tokens found in at least ``1 / COMMON_TOKEN_FRACTION`` of the terms are
+    scored with a dense matmul, since their postings would touch most pairs
+    anyway. For the rest, each block gathers the token postings of its
+    (row, token) entries from the transposed (CSC) copy and sums the products
+    with ``bincount``. Blocks are cut so the gathered entries and the dense
+    score rows both stay within ``BLOCK_BYTES``.
+    """
+    indptr, indices, data, vocabulary_size = _sparse_csr(vectors)
+    total = len(vectors)
+    entry_rows = np.repeat(np.arange(total, dtype=np.int64), np.diff(indptr))
+    doc_freq = np.bincount(indices, minlength=vocabulary_size)
+
+    common = doc_freq * COMMON_TOKEN_FRACTION >= total
+    columns = np.cumsum(common) - 1
+    in_common = common[indices]
+    dense = np.zeros((total, int(common.sum())))
+    dense[entry_rows[in_common], columns[indices[in_common]]] = data[in_common]
+
+    # Keep only the rare-token entries in the CSR arrays.
+    keep = ~in_common
+    indptr = np.concatenate(([0], np.cumsum(np.bincount(entry_rows[keep], minlength=total))))
+    indices, data, entry_rows = indices[keep], data[keep], entry_rows[keep]
+
+    # Transpose to postings: for each token, the documents containing it.
+    order = np.argsort(indices, kind="stable")
+    doc_ids = entry_rows[order]
+    post_weights = data[order]
+    post_lengths = np.bincount(indices, minlength=vocabulary_size)
+    post_ptr = np.concatenate(([0], np.cumsum(post_lengths)))
+
+    # Postings gathered per row: the summed posting lengths of its tokens.
+    work = np.concatenate(([0], np.cumsum(post_lengths[indices])))
+    row_work = work[indptr[1:]] - work[indptr[:-1]]
+    # Gathered entries cost a doc id, a weight and a flat index (24 bytes); the
+    # sparse and dense score rows cost 8 bytes per term each.
+    start = 0
+    while start < total:
+        end, budget = start, BLOCK_BYTES
+        while end < total and (end == start or budget >= 24 * row_work[end] + 16 * total):
+            budget -= 24 * row_work[end] + 16 * total
+            end += 1
+        lo, hi = indptr[start], indptr[end]
+        tokens = indices[lo:hi]
+        lengths = post_lengths[tokens]
+        rows = np.repeat(np.arange(end - start, dtype=np.int64), np.diff(indptr[start : end + 1]))
+        # Positions of every posting of every token, flattened.
+        offsets = np.repeat(post_ptr[tokens] - np.cumsum(lengths) + lengths, lengths)
+        positions = offsets + np.arange(int(lengths.sum()), dtype=np.int64)
+        weights = np.repeat(data[lo:hi], lengths) * post_weights[positions]
+        flat = np.repeat(rows, lengths) * total + doc_ids[positions]
+        scores = np.bincount(flat, weights=weights, minlength=(end - start) * total).reshape(end - start, total)
+        # bincount returns integers when there is nothing to add up.
+        scores = scores.astype(np.float64, copy=False)
+        if dense.shape[1]:
+            scores += dense[start:end] @ dense.T
+        yield start, scores
+        start = end
+
+
+def nearest_neighbours(embeddings, flavour: str, k: int = TOP_K) -> Neighbours:
+    """Return each term's top ``k`` ``(score, index)`` neighbours, best first."""
+    total = len(embeddings)
+    k = min(k, total - 1)
+    if k <= 0:
+        return [[] for _ in range(total)]
+    if np is None:
+        return _pairwise_top_k(embeddings, flavour, k)
+    blocks = _dense_score_blocks(embeddings) if flavour == "dense" else _sparse_score_blocks(embeddings)
+    neighbours: Neighbours = []
+    for offset, block in blocks:
+        neighbours.extend(_select_top_k(block, np.arange(offset, offset + len(block)), k))
+    return neighbours
+
+
+def _spherical_kmeans(matrix, lists: int, rng, iterations: int = 10):
+    """Cluster unit vectors into ``lists`` unit centroids, trained on a sample."""
+    sample = matrix[rng.choice(len(matrix), min(len(matrix), lists * KMEANS_SAMPLE_PER_LIST), replace=False)]
+    centroids = sample[rng.choice(len(sample), lists, replace=False)].copy()
+    for _ in range(iterations):
+        assign = np.argmax(sample @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, sample)
+        empty = np.bincount(assign, minlength=lists) == 0
+        # Reseed empty lists with random sample points.
+        sums[empty] = sample[rng.choice(len(sample), int(empty.sum()))]
+        centroids = sums / np.linalg.norm(sums, axis=1, keepdims=True).clip(min=1e-12)
+    return centroids
+
+
+def _probe_lists(matrix, centroids, probes: int):
+    """Return every row's nearest centroid and its ``probes`` nearest centroids."""
+    step = max(1, BLOCK_BYTES // (4 * len(centroids)))
+    nearest, closest = [], []
+    for start in range(0, len(matrix), step):
+        scores = matrix[start : start + step] @ centroids.T
+        nearest.append(np.argmax(scores, axis=1))
+        closest.append(np.argpartition(-scores, probes - 1, axis=1)[:, :probes])
+    return np.concatenate(nearest), np.concatenate(closest)
+
+
+def ivf_neighbours(
+    embeddings, flavour: str, k: int = TOP_K, lists: int | None = None, probes: int = IVF_PROBES
+) -> Neighbours:
+    """Approximate top ``k`` neighbours from an inverted-file (IVF) index.
+
+    Terms are clustered with spherical k-means into ``lists`` inverted lists
+    (``sqrt(n)`` by default) and filed under their nearest centroid. Each term
+    is then scored exactly against the members of its ``probes`` nearest lists
+    only, so a run costs about ``probes / lists`` of the exact pass. Only dense
+    embeddings have the fixed width k-means needs; TF-IDF vectors (and runs
+    without NumPy) use the exact backend.
+    """
+    total = len(embeddings)
+    if np is None or flavour != "dense":
+        print("The ivf backend needs NumPy and dense embeddings; using exact neighbours.", flush=True)
+        return nearest_neighbours(embeddings, flavour, k)
+    k = min(k, total - 1)
+    lists = max(1, min(lists or round(math.sqrt(total)), total))
+    if k <= 0 or probes >= lists:
+        return nearest_neighbours(embeddings, flavour, k)
+
+    matrix = np.ascontiguousarray(embeddings, dtype=np.float32)
+    centroids = _spherical_kmeans(matrix, lists, np.random.default_rng(0))
+    nearest, closest = _probe_lists(matrix, centroids, probes)
+    members = np.argsort(nearest, kind="stable")
+    member_bounds = np.concatenate(([0], np.cumsum(np.bincount(nearest, minlength=lists))))
+    # Every (query, list) probe, grouped by list.
+    visits = np.argsort(closest.ravel(), kind="stable")
+    visit_bounds = np.concatenate(([0], np.cumsum(np.bincount(closest.ravel(), minlength=lists))))
+
+    best_scores = np.full((total, k), -np.inf)
+    best_ids = np.full((total, k), -1, dtype=np.int64)
+    for c in range(lists):
+        columns = members[member_bounds[c] : member_bounds[c + 1]]
+        if not len(columns):
+            continue
+        queries = visits[visit_bounds[c] : visit_bounds[c + 1]] // probes
+        keep = min(k, len(columns))
+        step = max(1, BLOCK_BYTES // (4 * len(columns)))
+        for start in range(0, len(queries), step):
+            rows = queries[start : start + step]
+            block = (matrix[rows] @ matrix[columns].T).astype(np.float64)
+            block[rows[:, None] == columns[None, :]] = -np.inf
+            top = np.argpartition(-block, keep - 1, axis=1)[:, :keep]
+            # Merge this list's best into each query's running top k.
+            scores = np.concatenate((best_scores[rows], np.take_along_axis(block, top, axis=1)), axis=1)
+            ids = np.concatenate((best_ids[rows], columns[top]), axis=1)
+            winners = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            best_scores[rows] = np.take_along_axis(scores, winners, axis=1)
+            best_ids[rows] = np.take_along_axis(ids, winners, axis=1)
+
+    # Best first, ties to the higher index as in the exact backend.
+    order = np.lexsort((-best_ids, -best_scores), axis=1)
+    best_scores = np.take_along_axis(best_scores, order, axis=1)
+    best_ids = np.take_along_axis(best_ids, order, axis=1)
+    return [
+        [(float(score), int(j)) for score, j in zip(scores, ids) if j >= 0]
+        for scores, ids in zip(best_scores, best_ids)
+    ]
+
+
+NEIGHBOUR_BACKENDS = {"exact": nearest_neighbours, "ivf": ivf_neighbours}
+
+
+def recall_at_k(embeddings, flavour: str, approximate: Neighbours, sample: int, k: int = TOP_K) -> float | None:
+    """Mean fraction of the exact top ``k`` found in ``approximate``, over ``sample`` random terms."""
+    total = len(embeddings)
+    if np is None or flavour != "dense" or sample <= 0 or total < 2:
+        return None
+    rows = np.sort(np.random.default_rng(1).choice(total, min(sample, total), replace=False))
+    matrix = np.ascontiguousarray(embeddings, dtype=np.float32)
+    found = 0
+    wanted = 0
+    step = max(1, BLOCK_BYTES // (4 * total))
+    for start in range(0, len(rows), step):
+        chunk = rows[start : start + step]
+        for row, exact in zip(chunk, _select_top_k(matrix[chunk] @ matrix.T, chunk, k)):
+            found += len({j for _, j in exact} & {j for _, j in approximate[row]})
+            wanted += len(exact)
+    return found / wanted if wanted else None
 
 
 def _load_sentence_transformer(cache_candidate: Path, model_path_override: Path | None) -> Tuple[object, str] | None:
@@ -140,7 +526,163 @@ def _load_sentence_transformer(cache_candidate: Path, model_path_override: Path
     raise last_error  # type: ignore[misc]
 
 
-def embed_texts(texts: List[str]) -> Tuple[List, str]:
+def incremental_neighbours(embeddings, slugs: List[str], hashes: List[str], previous: Dict[str, Dict], k: int = TOP_K):
+    """Update the previous run's neighbour lists after some term texts changed.
+
+    ``previous`` maps slug to ``{"sha256", "neighbours": [[score, slug], ...]}``.
+    Changed and new terms, and terms whose old list names a changed or removed
+    term, get their whole row rescored. Every other list can only gain changed
+    terms, so it is merged with their scores. One edit therefore costs a few
+    ``O(n)`` rows instead of the ``O(n^2)`` full pass. Returns
+    ``(neighbours, changed, rescored)``.
+    """
+    total = len(slugs)
+    k = min(k, total - 1)
+    if k <= 0:
+        return [[] for _ in range(total)], total, 0
+    matrix = np.ascontiguousarray(embeddings, dtype=np.float32)
+    position = {slug: i for i, slug in enumerate(slugs)}
+    changed = [i for i, slug in enumerate(slugs) if previous.get(slug, {}).get("sha256") != hashes[i]]
+    is_changed = set(changed)
+
+    old_scores = np.full((total, k), -np.inf)
+    old_ids = np.full((total, k), -1, dtype=np.int64)
+    rescore = list(changed)
+    for i, slug in enumerate(slugs):
+        if i in is_changed:
+            continue
+        entries = previous[slug]["neighbours"][:k]
+        ids = [position.get(other, -1) for _, other in entries]
+        # A neighbour that left or moved leaves a hole only a full row can refill.
+        if len(entries) < k or any(j < 0 or j in is_changed for j in ids):
+            rescore.append(i)
+            continue
+        old_scores[i] = [score for score, _ in entries]
+        old_ids[i] = ids
+
+    neighbours: Neighbours = [[] for _ in range(total)]
+    rows_to_rescore = np.array(sorted(rescore), dtype=np.int64)
+    step = max(1, BLOCK_BYTES // (4 * total))
+    for start in range(0, len(rows_to_rescore), step):
+        rows = rows_to_rescore[start : start + step]
+        for row, top in zip(rows, _select_top_k(matrix[rows] @ matrix.T, rows, k)):
+            neighbours[row] = top
+
+    kept = np.setdiff1d(np.arange(total), rows_to_rescore)
+    columns = np.array(changed, dtype=np.int64)
+    step = max(1, BLOCK_BYTES // (8 * (k + len(columns))))
+    for start in range(0, len(kept), step):
+        rows = kept[start : start + step]
+        scores, ids = old_scores[rows], old_ids[rows]
+        if len(columns):
+            scores = np.concatenate((scores, matrix[rows] @ matrix[columns].T), axis=1)
+            ids = np.concatenate((ids, np.broadcast_to(columns, (len(rows), len(columns)))), axis=1)
+            # Best first, ties to the higher index as in the full pass.
+            order = np.lexsort((-ids, -scores), axis=1)[:, :k]
+            scores, ids = np.take_along_axis(scores, order, axis=1), np.take_along_axis(ids, order, axis=1)
+        for row, row_scores, row_ids in zip(rows, scores, ids):
+            neighbours[row] = [(float(score), int(j)) for score, j in zip(row_scores, row_ids)]
+    return neighbours, len(changed), len(rows_to_rescore)
+
+
+def _load_related_state(path: Path) -> Dict | None:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _write_if_changed(path: Path, text: str) -> bool:
+    """Write ``text`` unless ``path`` already holds it; return whether it was written."""
+    try:
+        if path.read_text(encoding="utf-8") == text:
+            return False
+    except OSError:
+        pass
+    path.write_text(text, encoding="utf-8")
+    return True
+
+
+def _render_include(items: List[Dict]) -> str:
+    lines = ["\n**Related terms**\n", ""]
+    for r in items:
+        lines.append(f"- [{r['title']}](../../terms/{r['slug']}.md)")
+    return "\n".join(lines) + "\n"
+
+
+def _embedding_store_paths(store_dir: Path) -> Tuple[Path, Path]:
+    stem = MODEL.replace("/", "--")
+    return store_dir / f"{stem}.npy", store_dir / f"{stem}.json"
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _load_embedding_store(store_dir: Path | None):
+    """Return ``(memory-mapped matrix, (slug, text hash) per row)``, or ``(None, [])`` if unusable."""
+    if store_dir is None:
+        return None, []
+    matrix_path, index_path = _embedding_store_paths(store_dir)
+    try:
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+        matrix = np.load(matrix_path, mmap_mode="r")
+    except (OSError, ValueError):
+        return None, []
+    entries = [(entry["slug"], entry["sha256"]) for entry in index.get("terms", [])]
+    if index.get("model") != MODEL or matrix.ndim != 2 or matrix.shape[0] != len(entries):
+        return None, []
+    return matrix, entries
+
+
+def _save_embedding_store(store_dir: Path, slugs: List[str], hashes: List[str], matrix) -> None:
+    """Replace the store with ``matrix``, one row per term in ``slugs`` order."""
+    matrix_path, index_path = _embedding_store_paths(store_dir)
+    store_dir.mkdir(parents=True, exist_ok=True)
+    tmp_matrix = matrix_path.with_suffix(".tmp.npy")
+    np.save(tmp_matrix, np.ascontiguousarray(matrix, dtype=np.float32))
+    os.replace(tmp_matrix, matrix_path)
+    index = {
+        "model": MODEL,
+        "terms": [{"slug": slug, "sha256": digest} for slug, digest in zip(slugs, hashes)],
+    }
+    tmp_index = index_path.with_suffix(".tmp")
+    tmp_index.write_text(json.dumps(index, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp_index, index_path)
+
+
+def cached_embeddings(texts: List[str], slugs: List[str], encode, store_dir: Path | None):
+    """Return ``(embeddings, hits, misses)``, calling ``encode`` only for texts missing from the store.
+
+    Vectors are looked up by the SHA-256 of their text under ``MODEL``, so a
+    renamed term still hits and an edited one is re-encoded. The store is then
+    rewritten to hold exactly the current terms. ``store_dir=None`` disables it.
+    """
+    hashes = [_text_hash(text) for text in texts]
+    stored, entries = _load_embedding_store(store_dir)
+    rows = {digest: row for row, (_, digest) in enumerate(entries)}
+    hit_positions = [i for i, digest in enumerate(hashes) if digest in rows]
+    miss_positions = [i for i, digest in enumerate(hashes) if digest not in rows]
+
+    encoded = np.asarray(encode([texts[i] for i in miss_positions])) if miss_positions else None
+    width = encoded.shape[1] if encoded is not None else stored.shape[1] if stored is not None else 0
+    embeddings = np.empty((len(texts), width), dtype=np.float32)
+    if hit_positions:
+        # Fancy indexing reads only the hit rows from the memory map.
+        embeddings[hit_positions] = stored[[rows[hashes[i]] for i in hit_positions]]
+    if miss_positions:
+        embeddings[miss_positions] = encoded
+    del stored
+    if store_dir is not None and entries != list(zip(slugs, hashes)):
+        _save_embedding_store(store_dir, slugs, hashes, embeddings)
+    return embeddings, len(hit_positions), len(miss_positions)
+
+
+class _ModelUnavailable(Exception):
+    """The SentenceTransformer model could not be loaded."""
+
+
+def embed_texts(texts: List[str], slugs: List[str] | None = None) -> Tuple[List, str]:
     try:
         import huggingface_hub  # type: ignore
         if not hasattr(huggingface_hub, "cached_download"):
@@ -154,30 +696,51 @@ def embed_texts(texts: List[str]) -> Tuple[List, str]:
         print("sentence-transformers not available; falling back to TF-IDF.", flush=True)
         return _tfidf_embeddings(texts), "sparse"
 
+    def encode(batch: List[str]):
+        # Only loaded when some text is missing from the embedding store.
+        try:
+            env_override = os.environ.get("GLOSSARY_EMBEDDING_MODEL_PATH")
+            override_path = Path(env_override).expanduser() if env_override else None
+            loaded = _load_sentence_transformer(CACHE_DIR, override_path)
+            if loaded is None:
+                raise ImportError
+        except Exception as error:  # pragma: no cover
+            raise _ModelUnavailable(error) from error
+        model, _ = loaded
+        return model.encode(
+            batch,
+            batch_size=64,
+            show_progress_bar=True,
+            normalize_embeddings=True,
+        )
+
     try:
-        env_override = os.environ.get("GLOSSARY_EMBEDDING_MODEL_PATH")
-        override_path = Path(env_override).expanduser() if env_override else None
-        loaded = _load_sentence_transformer(CACHE_DIR, override_path)
-        if loaded is None:
-            raise ImportError
-        model, flavour = loaded
-    except Exception as error:  # pragma: no cover
+        if np is None:
+            return encode(texts), "dense"
+        embeddings, hits, misses = cached_embeddings(texts, slugs or [""] * len(texts), encode, EMBEDDING_STORE_DIR)
+    except _ModelUnavailable as error:  # pragma: no cover
         print(f"Failed to load {MODEL} ({error}); falling back to TF-IDF.", flush=True)
         return _tfidf_embeddings(texts), "sparse"
+    print(f"Embedding store: {hits} hits, {misses} misses", flush=True)
+    return embeddings, "dense"
 
-    embeddings = model.encode(
-        texts,
-        batch_size=64,
-        show_progress_bar=True,
-        normalize_embeddings=True,
-    )
-    return embeddings, flavour
+
+def _iter_raw_terms(source: Path) -> Iterator[Dict]:
+    if source.suffix == ".ndjson":
+        # One term per line, so only the current term is ever decoded.
+        with source.open(encoding="utf-8") as handle:
+            for line in handle:
+                if line.strip():
+                    yield json.loads(line)
+        return
+    yield from json.loads(source.read_text(encoding="utf-8"))["terms"]
 
 
-def load_terms():
-    data = json.loads(IN.read_text(encoding="utf-8"))
+def load_terms(source: Path | None = None):
+    if source is None:
+        source = IN_NDJSON if IN_NDJSON.exists() else IN
     items = []
-    for t in data["terms"]:
+    for t in _iter_raw_terms(source):
         slug = (t.get("slug") or t["term"].strip().lower().replace(" ", "-"))
         body = " ".join(
             [
@@ -193,42 +756,89 @@ def load_terms():
 
 
 def main():
-    _maybe_download_input()
-    terms = load_terms()
+    parser = argparse.ArgumentParser(description="Compute related terms for every glossary entry.")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        default=os.environ.get(RELATED_INCREMENTAL_ENV, "") not in ("", "0"),
+        help=f"Only update neighbour lists affected by edited terms (or set {RELATED_INCREMENTAL_ENV}=1)",
+    )
+    args = parser.parse_args()
+
+    downloaded = _maybe_download_input()
+    _maybe_download_previous_run()
+    terms = load_terms(downloaded)
     texts = [x["text"] for x in terms]
-    embeddings, flavour = embed_texts(texts)
+    slugs = [x["slug"] for x in terms]
+    duplicates = sorted(slug for slug, count in Counter(slugs).items() if count > 1)
+    if duplicates:
+        # Includes and the state file are keyed by slug, so a repeat would overwrite another term's output.
+        raise SystemExit(f"Duplicate term slugs: {', '.join(duplicates)}")
+    hashes = [_text_hash(text) for text in texts]
+    embeddings, flavour = embed_texts(texts, slugs)
+    state = _load_related_state(OUT_STATE) or {}
+    previous = state.get("terms", {})
+
+    backend = os.environ.get(NEIGHBOUR_BACKEND_ENV) or "exact"
+    if backend not in NEIGHBOUR_BACKENDS:
+        raise SystemExit(f"{NEIGHBOUR_BACKEND_ENV} must be one of {sorted(NEIGHBOUR_BACKENDS)}, not {backend!r}")
+    # TF-IDF weights depend on the whole corpus, so any edit moves every vector.
+    reusable = state.get("model") == MODEL and state.get("flavour") == flavour == "dense"
+    if args.incremental and backend == "exact" and reusable and state.get("top_k") == TOP_K and np is not None:
+        neighbours, changed, rescored = incremental_neighbours(embeddings, slugs, hashes, previous)
+        print(f"Incremental update: {changed} changed terms, {rescored} of {len(slugs)} neighbour lists rescored")
+    elif backend == "ivf":
+        lists = int(os.environ[IVF_LISTS_ENV]) if os.environ.get(IVF_LISTS_ENV) else None
+        probes = int(os.environ.get(IVF_PROBES_ENV) or IVF_PROBES)
+        neighbours = ivf_neighbours(embeddings, flavour, lists=lists, probes=probes)
+        recall = recall_at_k(embeddings, flavour, neighbours, int(os.environ.get(RECALL_SAMPLE_ENV) or RECALL_SAMPLE))
+        if recall is not None:
+            print(f"ivf recall@{TOP_K}: {recall:.3f} (sampled against exact neighbours)")
+    else:
+        if args.incremental:
+            print("No reusable dense-embedding run in the state file; recomputing every neighbour list.")
+        neighbours = nearest_neighbours(embeddings, flavour)
 
     related = {}
-    for i, a in enumerate(embeddings):
-        scores = []
-        for j, b in enumerate(embeddings):
-            if i == j:
-                continue
-            if flavour == "dense":
-                score = float(sum(x * y for x, y in zip(a, b)))
-            else:
-                score = _sparse_cosine(a, b)
-            scores.append((score, j))
-        scores.sort(reverse=True)
-        top = scores[:TOP_K]
+    for i, top in enumerate(neighbours):
         related[terms[i]["slug"]] = [
             {"slug": terms[j]["slug"], "title": terms[j]["title"], "score": round(s, 3)}
             for s, j in top
         ]
 
     OUT_JSON.parent.mkdir(parents=True, exist_ok=True)
-    OUT_JSON.write_text(json.dumps(related, ensure_ascii=False, indent=2), encoding="utf-8")
+    _write_if_changed(OUT_JSON, json.dumps(related, ensure_ascii=False, indent=2))
 
-    # write small markdown includes per term
+    # write small markdown includes per term, touching only the ones that changed
     OUT_DIR.mkdir(parents=True, exist_ok=True)
-    for slug, lst in related.items():
-        lines = ["\n**Related terms**\n", ""]
-        for r in lst:
-            lines.append(f"- [{r['title']}](../../terms/{r['slug']}.md)")
-        (OUT_DIR / f"{slug}.md").write_text("\n".join(lines) + "\n", encoding="utf-8")
-
-    print(f"Wrote related data: {OUT_JSON} and {OUT_DIR}/*.md")
-    _maybe_upload_outputs()
+    changed_includes: List[Path] = []
+    new_state = {"model": MODEL if flavour == "dense" else None, "flavour": flavour, "top_k": TOP_K, "terms": {}}
+    written = 0
+    for i, slug in enumerate(slugs):
+        text = _render_include(related[slug])
+        include_hash = _text_hash(text)
+        path = OUT_DIR / f"{slug}.md"
+        if previous.get(slug, {}).get("include_sha256") != include_hash:
+            changed_includes.append(path)
+            written += _write_if_changed(path, text)
+        elif not path.exists():
+            # Restore a locally missing include; the uploaded copy is already current.
+            written += _write_if_changed(path, text)
+        new_state["terms"][slug] = {
+            "sha256": hashes[i],
+            "include_sha256": include_hash,
+            "neighbours": [[score, slugs[j]] for score, j in neighbours[i]],
+        }
+    removed = [OUT_DIR / f"{slug}.md" for slug in previous if slug not in new_state["terms"]]
+    for path in removed:
+        path.unlink(missing_ok=True)
+    OUT_STATE.write_text(json.dumps(new_state, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+
+    print(
+        f"Wrote related data: {OUT_JSON} and {OUT_DIR}/*.md "
+        f"({written} includes written, {len(changed_includes)} changed, {len(removed)} removed)"
+    )
+    _maybe_upload_outputs(changed_includes, removed)
 
 
 if __name__ == "__main__":
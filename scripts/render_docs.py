@@ -5,16 +5,20 @@ from __future__ import annotations
 import argparse
 import sys
 from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 CURRENT_DIR = Path(__file__).resolve().parent
 REPO_ROOT = CURRENT_DIR.parent
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-from glossary_utils import safe_load_path
+from glossary_utils import load_paths, map_ordered
+from glossary_utils.manifest import write_if_changed
 
+TEMPLATES_DIR = CURRENT_DIR / "templates"
 HEADER_COMMENT = """<!--\n  This file is auto-generated by scripts/render_docs.py. Do not edit manually.\n-->"""
 MKDOCS_PATH = REPO_ROOT / "site" / "mkdocs.yml"
 NAV_START_MARKER = "# AUTOGENERATED TERMS START"
@@ -211,10 +215,10 @@ def normalize_term(term: str) -> str:
     return slug
 
 
-def load_terms(data_dir: Path) -> List[Dict[str, Any]]:
+def load_terms(data_dir: Path, workers: Optional[int] = None) -> List[Dict[str, Any]]:
     terms: List[Dict[str, Any]] = []
-    for path in sorted(data_dir.glob("*.yml")):
-        data = safe_load_path(path) or {}
+    for path, data in load_paths(sorted(data_dir.glob("*.yml")), workers=workers).items():
+        data = data or {}
         if not isinstance(data, dict):
             raise ValueError(f"Expected mapping in {path}")
         data["slug"] = normalize_term(str(data.get("term", path.stem)))
@@ -378,6 +382,120 @@ def render_term_page(term: Dict[str, Any]) -> str:
     return "\n".join(lines).rstrip() + "\n"
 
 
+# The template renderer produces the same bytes as render_term_page.  Every
+# block that depends only on a term's roles, categories or status is built
+# once per distinct value and shared by all terms that carry it.
+
+
+@lru_cache(maxsize=None)
+def _term_template() -> Any:
+    from jinja2 import Environment, FileSystemLoader
+
+    environment = Environment(
+        loader=FileSystemLoader(str(TEMPLATES_DIR)),
+        autoescape=False,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        keep_trailing_newline=True,
+    )
+    return environment.get_template("term_page.md.j2")
+
+
+@lru_cache(maxsize=None)
+def _role_titles(roles: Tuple[str, ...]) -> Tuple[str, ...]:
+    return tuple(ROLE_DIRECTORY.get(role, {}).get("title", role) for role in roles)
+
+
+@lru_cache(maxsize=None)
+def _role_takeaways(roles: Tuple[str, ...]) -> Tuple[str, ...]:
+    lines = []
+    for role in roles:
+        label = ROLE_DIRECTORY.get(role, {}).get("title", role.title())
+        guidance = ROLE_TAKEAWAYS.get(role, "Focus on how this affects your workflows.")
+        lines.append(f"- **{label}:** {guidance}")
+    return tuple(lines)
+
+
+@lru_cache(maxsize=None)
+def _practice_messages(categories: Tuple[str, ...], has_roles: bool) -> Tuple[str, ...]:
+    messages: List[str] = []
+    for category in categories:
+        messages.extend(CATEGORY_APPLY_GUIDANCE.get(category, []))
+    if has_roles:
+        messages.append("Share takeaways with the accountable roles listed above so actions land with the right owners.")
+    return tuple(dict.fromkeys(message for message in messages if message))
+
+
+@lru_cache(maxsize=None)
+def _status_chip(status_value: Optional[str]) -> str:
+    if not status_value:
+        return "`—`"
+    return f"<span class=\"status-chip status-{status_value}\">{status_value.replace('_', ' ').title()}</span>"
+
+
+def render_term_page_template(term: Dict[str, Any]) -> str:
+    """Render ``term`` with the precompiled Jinja2 template; output matches :func:`render_term_page`.
+
+    Field lookups and stripping happen here so the template only lays out
+    plain values; method calls inside Jinja2 are several times slower.
+    """
+    categories = tuple(term.get("categories") or [])
+    roles = tuple(term.get("roles") or [])
+    audiences = term.get("audiences") or {}
+    examples = term.get("examples") or {}
+    governance = term.get("governance") or {}
+    relationships = term.get("relationships") or {}
+    short_def = term.get("short_def", "")
+    long_def = term.get("long_def", "")
+    exec_view = audiences.get("exec") if audiences else None
+    engineer_view = audiences.get("engineer") if audiences else None
+    risk_notes = governance.get("risk_notes") if governance else None
+    source_file = term.get("_source_file")
+    page = _term_template().render(
+        header=HEADER_COMMENT,
+        name=term.get("term", "").strip(),
+        aliases=term.get("aliases") or [],
+        categories=categories,
+        role_titles=_role_titles(roles),
+        part_of_speech=term.get("part_of_speech", "—"),
+        status_chip=_status_chip(term.get("status")),
+        last_reviewed=term.get("last_reviewed", "—"),
+        call_to_action=CALLS_TO_ACTION.get(term.get("slug")),
+        takeaways=_role_takeaways(roles),
+        practice=_practice_messages(categories, bool(roles)),
+        short_def=short_def.strip() if short_def else None,
+        long_def=long_def.strip() if long_def else None,
+        audiences=audiences,
+        exec_view=exec_view.strip() if exec_view else None,
+        engineer_view=engineer_view.strip() if engineer_view else None,
+        examples=examples,
+        do_examples=(examples.get("do") or []) if examples else [],
+        dont_examples=(examples.get("dont") or []) if examples else [],
+        governance=governance,
+        nist_rmf_tags=(governance.get("nist_rmf_tags") or []) if governance else [],
+        risk_notes=risk_notes.strip() if risk_notes else None,
+        relationships=[
+            f"- **{label}:** {', '.join(relationships[key])}"
+            for key, label in (("broader", "Broader"), ("narrower", "Narrower"), ("related", "Related"))
+            if relationships.get(key)
+        ],
+        term_name=term.get("term", "this term"),
+        citations=[
+            (citation.get("source", "Unknown source").strip(), citation.get("url"))
+            for citation in term.get("citations") or []
+        ],
+        license_name=term.get("license"),
+        source_file=Path(source_file).as_posix() if source_file else None,
+    )
+    return page.rstrip() + "\n"
+
+
+TERM_RENDERERS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    "python": render_term_page,
+    "template": render_term_page_template,
+}
+
+
 def render_index_page(terms: List[Dict[str, Any]]) -> str:
     lines: List[str] = [HEADER_COMMENT, "", "# Glossary Terms", ""]
     lines.append(f"Total entries: {len(terms)}")
@@ -483,24 +601,46 @@ def render_categories_page(terms: List[Dict[str, Any]]) -> str:
     return "\n".join(lines).rstrip() + "\n"
 
 
-def write_docs(terms: List[Dict[str, Any]], docs_dir: Path) -> None:
-    docs_dir.mkdir(parents=True, exist_ok=True)
+@dataclass
+class WriteReport:
+    written: int = 0
+    skipped: int = 0
+    deleted: int = 0
 
-    for path in docs_dir.glob("*.md"):
-        path.unlink()
 
-    for term in terms:
-        destination = docs_dir / f"{term['slug']}.md"
-        destination.write_text(render_term_page(term), encoding="utf-8")
+def render_pages(
+    terms: List[Dict[str, Any]], docs_dir: Path, workers: Optional[int] = None, renderer: str = "python"
+) -> Dict[Path, str]:
+    """Return ``{destination: Markdown}`` for every generated page, rendering term pages in parallel."""
+    term_pages = map_ordered(TERM_RENDERERS[renderer], terms, workers)
+    pages = {docs_dir / f"{term['slug']}.md": page for term, page in zip(terms, term_pages)}
+    pages[docs_dir / "index.md"] = render_index_page(terms)
+    pages[docs_dir.parent / "roles.md"] = render_roles_page(terms)
+    pages[docs_dir.parent / "categories.md"] = render_categories_page(terms)
+    return pages
 
-    index_path = docs_dir / "index.md"
-    index_path.write_text(render_index_page(terms), encoding="utf-8")
 
-    roles_path = docs_dir.parent / "roles.md"
-    roles_path.write_text(render_roles_page(terms), encoding="utf-8")
+def write_docs(
+    terms: List[Dict[str, Any]], docs_dir: Path, workers: Optional[int] = None, renderer: str = "python"
+) -> WriteReport:
+    """Write only pages whose content changed and delete only orphaned term pages.
 
-    categories_path = docs_dir.parent / "categories.md"
-    categories_path.write_text(render_categories_page(terms), encoding="utf-8")
+    Untouched pages keep their mtimes, so ``mkdocs serve`` rebuilds just what
+    an edit affected.
+    """
+    docs_dir.mkdir(parents=True, exist_ok=True)
+    pages = render_pages(terms, docs_dir, workers, renderer)
+    report = WriteReport()
+    for path, page in pages.items():
+        if write_if_changed(path, page.encode("utf-8")):
+            report.written += 1
+        else:
+            report.skipped += 1
+    for path in docs_dir.glob("*.md"):
+        if path not in pages:
+            path.unlink()
+            report.deleted += 1
+    return report
 
 
 def update_mkdocs_nav(terms: List[Dict[str, Any]], mkdocs_path: Path = MKDOCS_PATH) -> None:
@@ -545,7 +685,8 @@ def update_mkdocs_nav(terms: List[Dict[str, Any]], mkdocs_path: Path = MKDOCS_PA
             nav_entries.append(f"{indent}  - {entry['term']}: terms/{entry['slug']}.md")
 
     updated = lines[: start_idx + 1] + nav_entries + lines[end_idx:]
-    mkdocs_path.write_text("\n".join(updated) + "\n", encoding="utf-8")
+    # A rewritten mkdocs.yml makes `mkdocs serve` rebuild the whole site.
+    write_if_changed(mkdocs_path, ("\n".join(updated) + "\n").encode("utf-8"))
 
 
 def main(argv: List[str] | None = None) -> int:
@@ -562,16 +703,31 @@ def main(argv: List[str] | None = None) -> int:
         default=Path("site/docs/terms"),
         help="Directory where Markdown files should be written",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes used to parse YAML and render pages (default: GLOSSARY_PARSE_WORKERS or CPU count)",
+    )
+    parser.add_argument(
+        "--renderer",
+        choices=sorted(TERM_RENDERERS),
+        default="python",
+        help="Term page renderer; both produce identical Markdown",
+    )
     args = parser.parse_args(argv)
 
-    terms = load_terms(args.data_dir)
+    terms = load_terms(args.data_dir, args.workers)
     if not terms:
         print(f"No term files found in {args.data_dir}", file=sys.stderr)
         return 1
 
-    write_docs(terms, args.docs_dir)
+    report = write_docs(terms, args.docs_dir, args.workers, args.renderer)
     update_mkdocs_nav(terms)
-    print(f"Rendered {len(terms)} term page(s) to {args.docs_dir}")
+    print(
+        f"Rendered {len(terms)} term page(s) to {args.docs_dir}: wrote {report.written}, "
+        f"skipped {report.skipped} unchanged, deleted {report.deleted} orphaned page(s)"
+    )
     return 0
 
 
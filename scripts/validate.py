@@ -14,7 +14,7 @@ REPO_ROOT = CURRENT_DIR.parent
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-from glossary_utils import safe_load_path
+from glossary_utils import cached_load_path
 
 SCHEMA_PATH = Path("schema/term.schema.json")
 ALLOWED_PARTS_OF_SPEECH = {"noun", "noun_phrase", "verb", "adjective", "process", "concept"}
@@ -61,7 +61,7 @@ def ensure_list_of_strings(value, *, allow_empty: bool = False) -> bool:
 
 def validate_file(path: Path, required_fields: List[str]) -> List[str]:
     errors: List[str] = []
-    data = safe_load_path(path)
+    data = cached_load_path(path)
 
     if not isinstance(data, dict):
         return [f"{path}: top-level YAML must define a mapping"]
@@ -1,34 +1,274 @@
+import json
+import os
+import shutil
+import tempfile
 import unittest
+from pathlib import Path
+from unittest import mock
+
+from glossary_utils import SharedTermMap, TermStore, publish_terms, search, shared_store
+from glossary_utils.parse_cache import CACHE_DIR_ENV
 
 try:
-    from api.main import list_terms, read_root
+    from api.main import (
+        DATA_DIR,
+        _build_catalog,
+        _catalog_from_mapping,
+        _catalog_from_terms,
+        _catalog_sections,
+        _load_term_file,
+        _load_terms,
+        _matches_query,
+        _terms_by_slug,
+        _update_catalog,
+        app,
+    )
 except ModuleNotFoundError:  # FastAPI missing
-    list_terms = read_root = None
+    app = None
+
+try:
+    from fastapi.encoders import jsonable_encoder
+    from fastapi.responses import JSONResponse
+    from fastapi.testclient import TestClient
+except ModuleNotFoundError:  # FastAPI or httpx missing
+    TestClient = None
 
 
 def fastapi_available() -> bool:
-    return list_terms is not None and read_root is not None
+    return app is not None and TestClient is not None
+
 
+def encoded_list(terms) -> bytes:
+    return JSONResponse(jsonable_encoder(list(terms))).body
+
+
+@unittest.skipUnless(fastapi_available(), "FastAPI test client is not installed")
+class TermFilterTestCase(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(app)
+        self.terms = self.client.get("/terms").json()
+
+    def slugs(self, **params):
+        response = self.client.get("/terms", params=params)
+        self.assertEqual(response.status_code, 200)
+        return [term["slug"] for term in response.json()]
 
-@unittest.skipUnless(fastapi_available(), "FastAPI dependency is not installed")
-class APIFunctionTestCase(unittest.TestCase):
     def test_root_metadata_includes_roles_and_categories(self):
-        payload = read_root()
-        self.assertGreater(payload["count"], 0)
+        payload = self.client.get("/").json()
+        self.assertEqual(payload["count"], len(self.terms))
         self.assertTrue(payload["categories"])  # categories list should not be empty
         self.assertIn("policy", payload["roles"])
 
     def test_role_filter_returns_only_matching_terms(self):
-        results = list_terms(q=None, category=None, status=None, alias=None, role="policy")
+        results = self.client.get("/terms", params={"role": "policy"}).json()
         self.assertTrue(results)
         for term in results:
             roles = [value.lower() for value in term.get("roles", [])]
             self.assertIn("policy", roles)
 
     def test_alias_lookup_returns_expected_slug(self):
-        results = list_terms(q=None, category=None, status=None, alias="RAG", role=None)
-        self.assertEqual(len(results), 1)
-        self.assertEqual(results[0]["slug"], "retrieval-augmented-generation")
+        self.assertEqual(self.slugs(alias="RAG"), ["retrieval-augmented-generation"])
+
+    def test_combined_filters_match_linear_scan(self):
+        results = self.slugs(q="model", category="LLM Core, governance & risk", status="Approved", role="engineering")
+        expected = [
+            term["slug"]
+            for term in self.terms
+            if _matches_query(term, "model")
+            and {value.lower() for value in term["categories"]} & {"llm core", "governance & risk"}
+            and str(term.get("status", "")).lower() == "approved"
+            and "engineering" in {value.lower() for value in term["roles"]}
+        ]
+        self.assertTrue(expected)
+        self.assertEqual(results, expected)
+
+    def test_query_matches_linear_scan(self):
+        for query in ("rag", "Retrieval", "risk", "e", "prompt injection", "no-such-term"):
+            with self.subTest(query=query):
+                expected = [term["slug"] for term in self.terms if _matches_query(term, query)]
+                self.assertEqual(self.slugs(q=query), expected)
+
+
+@unittest.skipUnless(app is not None, "FastAPI dependency is not installed")
+class IncrementalCatalogTestCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._cache_dir = os.environ.get(CACHE_DIR_ENV)
+        os.environ[CACHE_DIR_ENV] = str(Path(self._tmp.name) / "cache")
+        self.data_dir = Path(self._tmp.name) / "terms"
+        self.data_dir.mkdir()
+        for path in sorted(DATA_DIR.glob("*.yml"))[:8]:
+            shutil.copy(path, self.data_dir / path.name)
+        self.store = TermStore(self.data_dir, _build_catalog, loader=_load_term_file, update=_update_catalog)
+        self.store.refresh()
+
+    def tearDown(self):
+        if self._cache_dir is None:
+            os.environ.pop(CACHE_DIR_ENV, None)
+        else:
+            os.environ[CACHE_DIR_ENV] = self._cache_dir
+        self._tmp.cleanup()
+
+    def edit(self, name, old, new):
+        path = self.data_dir / name
+        path.write_text(path.read_text(encoding="utf-8").replace(old, new, 1), encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def assert_matches_full_build(self, catalog):
+        full = _catalog_from_terms(_terms_by_slug(self.store.snapshot().entries))
+        self.assertEqual(catalog.encoded.array(), full.encoded.array())
+        self.assertEqual((catalog.etags, catalog.list_etag), (full.etags, full.list_etag))
+        self.assertEqual((catalog.order, catalog.names), (full.order, full.names))
+        self.assertEqual(catalog.suggest._rows, full.suggest._rows)
+        for name, index in full.facets.items():
+            self.assertEqual(catalog.facets[name].values(), index.values())
+            for value in index.values():
+                self.assertEqual(catalog.facets[name].lookup([value]), index.lookup([value]))
+        for query in ("agent", "a", "bias", "loop", "auditt", "controler"):
+            with self.subTest(query=query):
+                self.assertEqual(catalog.query.search_set(query), full.query.search_set(query))
+                ranked, expected = catalog.ranked.search(query), full.ranked.search(query)
+                self.assertEqual(dict(ranked.hits), dict(expected.hits))
+                self.assertEqual(ranked.corrections, expected.corrections)
+
+    def test_one_edited_file_is_the_only_term_reencoded_and_reindexed(self):
+        self.edit("agent-executor.yml", "Controller layer", "Supervisor loop")
+        encode = mock.Mock(wraps=shared_store.encode_json)
+        tokenize = mock.Mock(wraps=search.tokenize)
+        original_ngrams = search.SubstringIndex._ngrams
+        with mock.patch.object(shared_store, "encode_json", encode), mock.patch.object(
+            search, "tokenize", tokenize
+        ), mock.patch.object(
+            search.SubstringIndex, "_ngrams", autospec=True, side_effect=original_ngrams
+        ) as ngrams:
+            result = self.store.refresh()
+        self.assertEqual([path.name for path in result.modified], ["agent-executor.yml"])
+        self.assertEqual(encode.call_count, 1)
+        # The edited term's five BM25 fields plus its name and two aliases for /suggest.
+        self.assertEqual(tokenize.call_count, 8)
+        # Its old values are dropped and its new ones indexed.
+        self.assertEqual(ngrams.call_count, 2)
+        catalog = self.store.current()
+        self.assertIn("agent-executor", catalog.query.search_set("supervisor loop"))
+        self.assert_matches_full_build(catalog)
+
+    def test_added_and_removed_files_match_a_full_build(self):
+        first = self.store.current()
+        (self.data_dir / "agentic-ai.yml").unlink()
+        shutil.copy(sorted(DATA_DIR.glob("*.yml"))[8], self.data_dir)
+        self.edit("algorithmic-bias.yml", "term:", "term: fair")
+        self.store.refresh()
+        catalog = self.store.current()
+        self.assertNotIn("agentic-ai", catalog.etags)
+        self.assertIn("agentic-ai", first.etags)
+        self.assert_matches_full_build(catalog)
+
+    def test_readers_map_the_published_indexes_without_reindexing(self):
+        self.edit("algorithmic-bias.yml", "term:", "term: fair")
+        self.store.refresh()
+        catalog = self.store.current()
+        shared_dir = Path(self._tmp.name) / "shared"
+        generation = publish_terms(shared_dir, catalog.terms, catalog.encoded, _catalog_sections(catalog))
+        tokenize = mock.Mock(wraps=search.tokenize)
+        with mock.patch.object(search, "tokenize", tokenize), mock.patch.object(
+            search.SubstringIndex, "_ngrams", autospec=True
+        ) as ngrams:
+            reader = _catalog_from_mapping(SharedTermMap.open(shared_dir, generation))
+        self.assertEqual((tokenize.call_count, ngrams.call_count), (0, 0))
+        self.assert_matches_full_build(reader)
+
+
+@unittest.skipUnless(fastapi_available(), "FastAPI test client is not installed")
+class APIHTTPTestCase(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(app)
+
+    def test_term_body_matches_default_json_encoding(self):
+        response = self.client.get("/terms/retrieval-augmented-generation")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-type"], "application/json")
+        expected = JSONResponse(jsonable_encoder(_load_terms()["retrieval-augmented-generation"])).body
+        self.assertEqual(response.content, expected)
+
+    def test_list_bodies_match_default_json_encoding(self):
+        terms = _load_terms()
+        self.assertEqual(self.client.get("/terms").content, encoded_list(terms.values()))
+        response = self.client.get("/terms", params={"role": "policy", "q": "risk"})
+        expected = [
+            term
+            for term in terms.values()
+            if _matches_query(term, "risk") and "policy" in {value.lower() for value in term["roles"]}
+        ]
+        self.assertTrue(expected)
+        self.assertEqual(response.content, encoded_list(expected))
+
+    def test_conditional_get_returns_not_modified(self):
+        for url in ("/terms/retrieval-augmented-generation", "/terms", "/terms?category=LLM%20Core"):
+            with self.subTest(url=url):
+                etag = self.client.get(url).headers["etag"]
+                cached = self.client.get(url, headers={"If-None-Match": f'"stale", W/{etag}'})
+                self.assertEqual(cached.status_code, 304)
+                self.assertEqual(cached.content, b"")
+                self.assertEqual(cached.headers["etag"], etag)
+                self.assertEqual(self.client.get(url, headers={"If-None-Match": '"stale"'}).status_code, 200)
+
+    def test_cursor_pagination_walks_every_term_once(self):
+        seen = []
+        params = {"limit": 25, "fields": "slug"}
+        while True:
+            response = self.client.get("/terms", params=params)
+            self.assertEqual(response.status_code, 200)
+            page = response.json()
+            self.assertLessEqual(len(page), 25)
+            self.assertEqual([list(item) for item in page], [["slug"]] * len(page))
+            seen.extend(item["slug"] for item in page)
+            if "x-next-cursor" not in response.headers:
+                break
+            params["cursor"] = response.headers["x-next-cursor"]
+        self.assertEqual(seen, list(_load_terms()))
+
+    def test_ndjson_streams_one_projected_term_per_line(self):
+        response = self.client.get("/terms", params={"format": "ndjson", "role": "policy", "fields": "slug,short_def"})
+        self.assertEqual(response.headers["content-type"], "application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        expected = self.client.get("/terms", params={"role": "policy"}).json()
+        self.assertEqual(lines, [{"slug": term["slug"], "short_def": term["short_def"]} for term in expected])
+
+    def test_invalid_cursor_is_rejected(self):
+        self.assertEqual(self.client.get("/terms", params={"cursor": "not base64!"}).status_code, 400)
+
+    def test_batch_get_resolves_slugs_and_aliases_per_item(self):
+        names = ["RAG", "Retrieval_Augmented  Generation", "not-a-term", "kv cache"]
+        response = self.client.post("/terms:batchGet", json={"names": names})
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual((payload["found"], payload["missing"]), (3, 1))
+        self.assertEqual([item["query"] for item in payload["results"]], names)
+        self.assertEqual(
+            [item["slug"] for item in payload["results"]],
+            ["retrieval-augmented-generation", "retrieval-augmented-generation", None, "kv-cache"],
+        )
+        self.assertFalse(payload["results"][2]["found"])
+        self.assertEqual(payload["results"][0]["term"], self.client.get("/terms/retrieval-augmented-generation").json())
+
+    def test_search_ranks_and_corrects_typos(self):
+        payload = self.client.get("/search", params={"q": "halucination", "limit": 5}).json()
+        self.assertIn("hallucination", payload["corrections"]["halucination"])
+        self.assertEqual(payload["results"][0]["slug"], "hallucination")
+        scores = [item["score"] for item in payload["results"]]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        self.assertLessEqual(len(scores), 5)
+
+    def test_suggest_completes_terms_and_aliases(self):
+        payload = self.client.get("/suggest", params={"prefix": "rag", "limit": 3}).json()
+        self.assertEqual(payload["suggestions"][0]["slug"], "retrieval-augmented-generation")
+        self.assertEqual(payload["suggestions"][0]["match"], "RAG")
+        self.assertLessEqual(len(payload["suggestions"]), 3)
+        self.assertEqual(self.client.get("/suggest", params={"prefix": ""}).status_code, 422)
+
+    def test_unknown_term_is_not_found(self):
+        self.assertEqual(self.client.get("/terms/not-a-term").status_code, 404)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,142 @@
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+import build_index  # noqa: E402
+from glossary_utils import SNAPSHOT_FILENAME, load_snapshot  # noqa: E402
+from glossary_utils.parse_cache import CACHE_DIR_ENV  # noqa: E402
+
+DATA_DIR = REPO_ROOT / "data" / "terms"
+# An arbitrary past mtime; a build that leaves a file alone must not touch it.
+OLD_MTIME_NS = 1_600_000_000 * 10**9
+
+
+class BuildIndexTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        # Keep parse-cache pickles out of the repo's .glossary_cache/.
+        self._previous_cache_dir = os.environ.get(CACHE_DIR_ENV)
+        os.environ[CACHE_DIR_ENV] = str(self.root / "cache")
+        self.site_dir = self.root / "site"
+        self.data_dir = self.root / "terms"
+        self.data_dir.mkdir()
+        for path in sorted(DATA_DIR.glob("*.yml"))[:6]:
+            shutil.copy(path, self.data_dir / path.name)
+        self.output_dir = self.root / "build"
+
+    def tearDown(self) -> None:
+        if self._previous_cache_dir is None:
+            os.environ.pop(CACHE_DIR_ENV, None)
+        else:
+            os.environ[CACHE_DIR_ENV] = self._previous_cache_dir
+        self._tmp.cleanup()
+
+    def build(self, data_dir: Path, output_dir: Path, *flags: str) -> str:
+        """Run the command line with the site assets redirected; return what it printed."""
+        argv = ["build_index.py", "--data-dir", str(data_dir), "--output-dir", str(output_dir), "--workers", "1"]
+        site_paths = {
+            "SITE_SEARCH_PATH": self.site_dir / "glossary-search.json",
+            "SITE_SHARD_DIR": self.site_dir / "glossary-search",
+            "SITE_CLIENT_INDEX_PATH": self.site_dir / "glossary-search-index.json",
+        }
+        out = io.StringIO()
+        with mock.patch.object(sys, "argv", argv + list(flags)), mock.patch.multiple(build_index, **site_paths):
+            with contextlib.redirect_stdout(out):
+                build_index.main()
+        return out.getvalue()
+
+    def edit(self, name: str, old: str, new: str) -> None:
+        path = self.data_dir / name
+        path.write_text(path.read_text(encoding="utf-8").replace(old, new, 1), encoding="utf-8")
+
+    def outputs(self, output_dir: Path) -> dict:
+        files = {name: (output_dir / name).read_bytes() for name in build_index.OUTPUT_FILENAMES}
+        files["site"] = (self.site_dir / "glossary-search.json").read_bytes()
+        return files
+
+    def full_build(self, *flags: str) -> dict:
+        """Build the current sources from scratch into a fresh directory and return the outputs."""
+        output_dir = Path(tempfile.mkdtemp(dir=self.root))
+        self.build(self.data_dir, output_dir, *flags)
+        return self.outputs(output_dir)
+
+    def slugs(self) -> list:
+        glossary = json.loads((self.output_dir / build_index.GLOSSARY_FILENAME).read_bytes())
+        return [term["slug"] for term in glossary["terms"]]
+
+    def test_default_build_reproduces_the_committed_site_payload(self) -> None:
+        self.build(DATA_DIR, self.output_dir)
+        committed = REPO_ROOT / "site" / "docs" / "assets" / "glossary-search.json"
+        self.assertEqual((self.site_dir / "glossary-search.json").read_bytes(), committed.read_bytes())
+
+    def test_incremental_build_splices_only_the_edited_term(self) -> None:
+        self.build(self.data_dir, self.output_dir, "--incremental")
+        self.edit("agent-executor.yml", "Controller layer", "Supervisor loop")
+        printed = self.build(self.data_dir, self.output_dir, "--incremental")
+        self.assertIn("Processed 1 of 6 term(s)", printed)
+        outputs = self.outputs(self.output_dir)
+        self.assertIn(b"Supervisor loop that schedules", outputs[build_index.GLOSSARY_FILENAME])
+        self.assertEqual(outputs, self.full_build())
+
+    def test_unchanged_outputs_keep_their_mtime(self) -> None:
+        self.build(self.data_dir, self.output_dir, "--incremental")
+        paths = [self.output_dir / name for name in build_index.OUTPUT_FILENAMES]
+        paths.append(self.site_dir / "glossary-search.json")
+        for path in paths:
+            os.utime(path, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+
+        self.build(self.data_dir, self.output_dir, "--incremental")
+        self.assertEqual([path.stat().st_mtime_ns for path in paths], [OLD_MTIME_NS] * len(paths))
+
+        # long_def is not part of the search records, so only the full outputs change.
+        self.edit("agent-executor.yml", "An agent executor is", "An agent executor is, in short,")
+        self.build(self.data_dir, self.output_dir, "--incremental")
+        changed = {path.name for path in paths if path.stat().st_mtime_ns != OLD_MTIME_NS}
+        self.assertEqual(changed, {build_index.GLOSSARY_FILENAME, build_index.NDJSON_FILENAME})
+
+    def test_incremental_build_drops_a_deleted_term(self) -> None:
+        self.build(self.data_dir, self.output_dir, "--incremental")
+        self.assertIn("agentic-ai", self.slugs())
+        (self.data_dir / "agentic-ai.yml").unlink()
+        printed = self.build(self.data_dir, self.output_dir, "--incremental")
+        self.assertIn("dropped 1 removed term(s)", printed)
+        self.assertNotIn("agentic-ai", self.slugs())
+        self.assertNotIn(b'"agentic-ai"', (self.output_dir / build_index.NDJSON_FILENAME).read_bytes())
+        self.assertEqual(self.outputs(self.output_dir), self.full_build())
+
+    def test_full_incremental_and_streamed_outputs_are_byte_equal(self) -> None:
+        self.build(self.data_dir, self.output_dir, "--incremental")
+        self.edit("ai-assurance.yml", "term:", "term: verified")
+        self.build(self.data_dir, self.output_dir, "--incremental")
+        incremental = self.outputs(self.output_dir)
+        self.assertEqual(incremental, self.full_build())
+        self.assertEqual(incremental, self.full_build("--stream"))
+
+    def test_snapshot_follows_the_sources_after_a_streamed_build(self) -> None:
+        self.build(self.data_dir, self.output_dir, "--incremental")
+        self.edit("agent-executor.yml", "Controller layer", "Supervisor loop layer")
+        # --stream records the new sources in the manifest but leaves the snapshot behind.
+        self.build(self.data_dir, self.output_dir, "--stream")
+        snapshot_path = self.output_dir / SNAPSHOT_FILENAME
+        self.assertIsNone(load_snapshot(snapshot_path, self.data_dir))
+
+        self.build(self.data_dir, self.output_dir, "--incremental")
+        loaded = load_snapshot(snapshot_path, self.data_dir)
+        self.assertIsNotNone(loaded)
+        _, entries = loaded
+        self.assertTrue(entries[self.data_dir / "agent-executor.yml"]["short_def"].startswith("Supervisor loop layer"))
+
+
+if __name__ == "__main__":
+    unittest.main()
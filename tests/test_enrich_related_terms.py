@@ -0,0 +1,188 @@
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+import enrich_related_terms as enrich  # noqa: E402
+
+TEXTS = [
+    "retrieval augmented generation grounds answers in documents",
+    "retrieval augmented generation grounds answers in documents",
+    "",
+    "vector index stores embeddings for retrieval",
+    "guardrails block unsafe model outputs",
+    "model evaluation measures accuracy and bias",
+    "embedding vectors capture meaning for search",
+    "prompt injection attacks bypass guardrails",
+    "bias audits review model fairness",
+    "tokens are the units a model reads",
+    "context window limits how many tokens a model reads",
+]
+
+
+def neighbour_ids(neighbours):
+    return [[j for _, j in row] for row in neighbours]
+
+
+def all_pairs_top_k(vectors, k):
+    """The old string-dict loop, over the interned vectors."""
+    mappings = [dict(zip(ids, weights)) for ids, weights in vectors]
+    neighbours = []
+    for i, a in enumerate(mappings):
+        scores = []
+        for j, b in enumerate(mappings):
+            if i != j:
+                small, large = (a, b) if len(a) <= len(b) else (b, a)
+                scores.append((sum(weight * large.get(token, 0.0) for token, weight in small.items()), j))
+        scores.sort(reverse=True)
+        neighbours.append(scores[:k])
+    return neighbours
+
+
+class PurePythonFallbackTestCase(unittest.TestCase):
+    def test_tokens_are_interned_in_order_of_appearance(self) -> None:
+        vectors = enrich._tfidf_embeddings(["b a b", "a c", ""])
+        self.assertEqual([list(ids) for ids, _ in vectors], [[0, 1], [1, 2], []])
+        self.assertAlmostEqual(sum(weight * weight for weight in vectors[0][1]), 1.0)
+
+    def test_inverted_index_matches_all_pairs_loop_exactly(self) -> None:
+        vectors = enrich._tfidf_embeddings(TEXTS)
+        for k in (1, 3, len(TEXTS) - 1):
+            with self.subTest(k=k):
+                self.assertEqual(enrich._sparse_top_k(vectors, k), all_pairs_top_k(vectors, k))
+
+
+@unittest.skipIf(enrich.np is None, "NumPy dependency is not installed")
+class NearestNeighboursTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.block_bytes = enrich.BLOCK_BYTES
+
+    def tearDown(self) -> None:
+        enrich.BLOCK_BYTES = self.block_bytes
+
+    def test_sparse_blocks_match_pairwise_loop(self) -> None:
+        vectors = enrich._tfidf_embeddings(TEXTS)
+        expected = enrich._pairwise_top_k(vectors, "sparse", 3)
+        for block_bytes in (1, 1024, self.block_bytes):
+            with self.subTest(block_bytes=block_bytes):
+                enrich.BLOCK_BYTES = block_bytes
+                neighbours = enrich.nearest_neighbours(vectors, "sparse", k=3)
+                self.assertEqual(neighbour_ids(neighbours), neighbour_ids(expected))
+                for row, expected_row in zip(neighbours, expected):
+                    for (score, _), (expected_score, _) in zip(row, expected_row):
+                        self.assertAlmostEqual(score, expected_score)
+
+    def test_dense_blocks_match_pairwise_loop(self) -> None:
+        rng = enrich.np.random.default_rng(3)
+        matrix = rng.standard_normal((40, 16))
+        matrix /= enrich.np.linalg.norm(matrix, axis=1, keepdims=True)
+        # Round to float32 first so both paths see identical inputs.
+        embeddings = [row.astype(enrich.np.float32).tolist() for row in matrix]
+        enrich.BLOCK_BYTES = 1024
+        self.assertEqual(
+            neighbour_ids(enrich.nearest_neighbours(embeddings, "dense")),
+            neighbour_ids(enrich._pairwise_top_k(embeddings, "dense", enrich.TOP_K)),
+        )
+
+    def test_small_corpora(self) -> None:
+        self.assertEqual(enrich.nearest_neighbours([], "sparse"), [])
+        self.assertEqual(enrich.nearest_neighbours(enrich._tfidf_embeddings(["solo"]), "sparse"), [[]])
+
+    def test_ivf_finds_clustered_neighbours(self) -> None:
+        rng = enrich.np.random.default_rng(0)
+        topics = rng.standard_normal((40, 32))
+        matrix = topics[rng.integers(0, len(topics), 2000)] + 0.3 * rng.standard_normal((2000, 32))
+        matrix /= enrich.np.linalg.norm(matrix, axis=1, keepdims=True)
+        neighbours = enrich.ivf_neighbours(list(matrix), "dense", probes=4)
+        self.assertEqual(len(neighbours), 2000)
+        for row, top in enumerate(neighbours):
+            self.assertEqual(len(top), enrich.TOP_K)
+            self.assertNotIn(row, [j for _, j in top])
+            self.assertEqual(top, sorted(top, reverse=True))
+        self.assertGreater(enrich.recall_at_k(list(matrix), "dense", neighbours, 200), 0.9)
+
+    def test_incremental_update_matches_full_pass(self) -> None:
+        rng = enrich.np.random.default_rng(5)
+
+        def unit(rows):
+            matrix = rng.standard_normal((rows, 12)).astype(enrich.np.float32)
+            return matrix / enrich.np.linalg.norm(matrix, axis=1, keepdims=True)
+
+        matrix = unit(60)
+        slugs = [f"term-{i}" for i in range(60)]
+        hashes = [f"hash-{i}" for i in range(60)]
+        previous = {
+            slug: {"sha256": digest, "neighbours": [[score, slugs[j]] for score, j in top]}
+            for slug, digest, top in zip(slugs, hashes, enrich.nearest_neighbours(matrix, "dense"))
+        }
+        # Edit term 3, drop term 10 and add a new term at the end.
+        matrix[3] = unit(1)[0]
+        hashes[3] = "edited"
+        keep = [i for i in range(60) if i != 10]
+        matrix = enrich.np.vstack([matrix[keep], unit(1)])
+        slugs = [slugs[i] for i in keep] + ["added"]
+        hashes = [hashes[i] for i in keep] + ["added"]
+
+        neighbours, changed, rescored = enrich.incremental_neighbours(matrix, slugs, hashes, previous)
+        self.assertEqual(changed, 2)
+        self.assertLess(rescored, len(slugs))
+        self.assertEqual(neighbour_ids(neighbours), neighbour_ids(enrich.nearest_neighbours(matrix, "dense")))
+
+    def test_ivf_falls_back_to_exact(self) -> None:
+        vectors = enrich._tfidf_embeddings(TEXTS)
+        self.assertEqual(enrich.ivf_neighbours(vectors, "sparse"), enrich.nearest_neighbours(vectors, "sparse"))
+        self.assertIsNone(enrich.recall_at_k(vectors, "sparse", [], 10))
+
+
+@unittest.skipIf(enrich.np is None, "NumPy dependency is not installed")
+class EmbeddingStoreTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.encoded = []
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.store_dir = Path(tmp.name) / "embeddings"
+
+    def encode(self, texts):
+        self.encoded.append(list(texts))
+        return enrich.np.array([[len(text), text.count("a")] for text in texts], dtype=enrich.np.float32)
+
+    def embed(self, texts, slugs, store_dir=None):
+        store_dir = self.store_dir if store_dir is None else store_dir
+        return enrich.cached_embeddings(texts, slugs, self.encode, store_dir)
+
+    def test_only_new_or_changed_texts_are_encoded(self) -> None:
+        first, hits, misses = self.embed(["alpha", "beta"], ["a", "b"])
+        self.assertEqual((hits, misses), (0, 2))
+
+        again, hits, misses = self.embed(["alpha", "beta"], ["a", "b"])
+        self.assertEqual((hits, misses), (2, 0))
+        self.assertEqual(self.encoded, [["alpha", "beta"]])
+        self.assertEqual(again.tolist(), first.tolist())
+
+        edited, hits, misses = self.embed(["beta", "gamma a", "alpha"], ["b", "c", "renamed"])
+        self.assertEqual((hits, misses), (2, 1))
+        self.assertEqual(self.encoded[-1], ["gamma a"])
+        self.assertEqual(edited.tolist(), [[4, 1], [7, 3], [5, 2]])
+
+        _, index_path = enrich._embedding_store_paths(self.store_dir)
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+        self.assertEqual([entry["slug"] for entry in index["terms"]], ["b", "c", "renamed"])
+
+    def test_other_models_and_disabled_store_miss(self) -> None:
+        self.embed(["alpha"], ["a"])
+        _, index_path = enrich._embedding_store_paths(self.store_dir)
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+        index["model"] = "another/model"
+        index_path.write_text(json.dumps(index), encoding="utf-8")
+        self.assertEqual(self.embed(["alpha"], ["a"])[1:], (0, 1))
+
+        _, hits, misses = enrich.cached_embeddings(["alpha"], ["a"], self.encode, None)
+        self.assertEqual((hits, misses), (0, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
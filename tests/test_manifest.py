@@ -0,0 +1,68 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from glossary_utils.manifest import diff_sources, encode_manifest, load_manifest, scan_sources, write_if_changed
+
+
+class ManifestTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.data_dir = self.root / "terms"
+        self.data_dir.mkdir()
+        for name in ("alpha", "beta", "gamma"):
+            self.write(name, f"term: {name}\n")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def write(self, name: str, content: str, mtime_offset: int = 1) -> Path:
+        path = self.data_dir / f"{name}.yml"
+        path.write_text(content, encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + mtime_offset * 1_000_000_000))
+        return path
+
+    def previous(self) -> dict:
+        manifest_path = self.root / "manifest.json"
+        manifest_path.write_bytes(encode_manifest(self.data_dir, scan_sources(self.data_dir)))
+        manifest = load_manifest(manifest_path)
+        assert manifest is not None
+        return manifest["sources"]
+
+    def test_diff_reports_content_changes_additions_and_removals(self) -> None:
+        previous = self.previous()
+        self.write("beta", "term: beta\n", mtime_offset=5)  # touched, same bytes
+        self.write("gamma", "term: gamma2\n", mtime_offset=5)
+        self.write("delta", "term: delta\n")
+        (self.data_dir / "alpha.yml").unlink()
+
+        changed, removed = diff_sources(scan_sources(self.data_dir, previous), previous)
+        self.assertEqual([path.stem for path in changed], ["delta", "gamma"])
+        self.assertEqual(removed, ["alpha.yml"])
+
+    def test_unchanged_stamps_reuse_recorded_digests(self) -> None:
+        previous = self.previous()
+        previous["alpha.yml"]["sha256"] = "recorded"
+        records = scan_sources(self.data_dir, previous)
+        self.assertEqual(records[self.data_dir / "alpha.yml"]["sha256"], "recorded")
+
+    def test_write_if_changed_keeps_identical_files_untouched(self) -> None:
+        target = self.root / "out" / "file.json"
+        self.assertTrue(write_if_changed(target, b"{}"))
+        os.utime(target, ns=(0, 0))
+        self.assertFalse(write_if_changed(target, b"{}"))
+        self.assertEqual(target.stat().st_mtime_ns, 0)
+        self.assertTrue(write_if_changed(target, b"[]"))
+        self.assertEqual(target.read_bytes(), b"[]")
+
+    def test_outdated_manifest_is_ignored(self) -> None:
+        path = self.root / "manifest.json"
+        path.write_text('{"version": 0}', encoding="utf-8")
+        self.assertIsNone(load_manifest(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from glossary_utils import iter_paths, load_paths, safe_load_path, thread_safe_context
+
+
+class LoadPathsTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        data_dir = Path(self._tmp.name)
+        # Deliberately not in sorted order: results must follow the input order.
+        self.paths = []
+        for index in (3, 1, 4, 0, 2):
+            path = data_dir / f"term-{index}.yml"
+            path.write_text(f"term: term {index}\naliases: [t{index}]\n", encoding="utf-8")
+            self.paths.append(path)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_process_pool_matches_serial_order_and_values(self) -> None:
+        serial = load_paths(self.paths, loader=safe_load_path, workers=1)
+        parallel = load_paths(self.paths, loader=safe_load_path, workers=2, serial_below=0)
+        self.assertEqual(list(parallel.items()), list(serial.items()))
+        self.assertEqual(list(serial), self.paths)
+
+    def test_iter_paths_streams_in_input_order(self) -> None:
+        serial = list(iter_paths(self.paths, loader=safe_load_path, workers=1))
+        parallel = list(iter_paths(self.paths, loader=safe_load_path, workers=2, serial_below=0))
+        self.assertEqual(parallel, serial)
+        self.assertEqual(serial, list(load_paths(self.paths, loader=safe_load_path, workers=1).items()))
+
+    def test_thread_safe_context_parses_from_a_background_thread(self) -> None:
+        serial = load_paths(self.paths, loader=safe_load_path, workers=1)
+        self.assertNotEqual(thread_safe_context().get_start_method(), "fork")
+        results = []
+
+        def parse() -> None:
+            context = thread_safe_context()
+            results.append(load_paths(self.paths, loader=safe_load_path, workers=2, serial_below=0, mp_context=context))
+
+        worker = threading.Thread(target=parse)
+        worker.start()
+        worker.join(timeout=60)
+        self.assertEqual(results, [serial])
+
+    def test_small_batches_stay_in_process(self) -> None:
+        seen = []
+
+        def loader(path: Path) -> str:  # a closure cannot be pickled, so this must run serially
+            seen.append(path)
+            return path.stem
+
+        self.assertEqual(list(load_paths(self.paths, loader=loader, workers=4).values()), [p.stem for p in self.paths])
+        self.assertEqual(seen, self.paths)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from glossary_utils import ParseCache, safe_load_path
+
+
+class ParseCacheTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        root = Path(self._tmp.name)
+        self.data_dir = root / "terms"
+        self.data_dir.mkdir()
+        self.cache = ParseCache(root / "cache")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def write(self, name: str, content: str, mtime_offset: int = 1) -> Path:
+        path = self.data_dir / f"{name}.yml"
+        path.write_text(content, encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + mtime_offset * 1_000_000_000))
+        return path
+
+    def test_unchanged_files_are_parsed_once_across_instances(self) -> None:
+        path = self.write("alpha", "term: alpha\naliases: [a]\n")
+        self.assertEqual(self.cache.load_path(path), safe_load_path(path))
+        reopened = ParseCache(self.cache.directory)
+        self.assertEqual(reopened.load_path(path), {"term": "alpha", "aliases": ["a"]})
+        self.assertEqual((self.cache.misses, reopened.hits, reopened.misses), (1, 1, 0))
+
+    def test_edits_are_reparsed_and_touches_are_not(self) -> None:
+        path = self.write("alpha", "term: alpha\n")
+        self.cache.load_path(path)
+        self.write("alpha", "term: alpha\n", mtime_offset=5)
+        self.assertEqual(self.cache.load_path(path), {"term": "alpha"})
+        self.write("alpha", "term: omega\n", mtime_offset=9)
+        self.assertEqual(self.cache.load_path(path), {"term": "omega"})
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+
+    def test_size_bound_evicts_least_recently_used_entries(self) -> None:
+        paths = [self.write(name, f"term: {name}\nshort_def: {'x' * 200}\n") for name in ("a", "b", "c", "d")]
+        for path in paths:
+            self.cache.load_path(path)
+        entry_size = max(entry.stat().st_size for entry in self.cache.directory.glob("*.pickle"))
+        evicted = self.cache.prune(entry_size * 2)
+        self.assertEqual(evicted, 2)
+        self.assertLessEqual(sum(entry.stat().st_size for entry in self.cache.directory.glob("*.pickle")), entry_size * 2)
+
+    def test_corrupt_entries_are_treated_as_misses(self) -> None:
+        path = self.write("alpha", "term: alpha\n")
+        self.cache.load_path(path)
+        for entry in self.cache.directory.glob("*.pickle"):
+            entry.write_bytes(b"not a pickle")
+        self.assertEqual(ParseCache(self.cache.directory).load_path(path), {"term": "alpha"})
+
+
+if __name__ == "__main__":
+    unittest.main()
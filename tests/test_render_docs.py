@@ -0,0 +1,147 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from glossary_utils.parse_cache import CACHE_DIR_ENV  # noqa: E402
+from render_docs import (  # noqa: E402
+    NAV_END_MARKER,
+    NAV_START_MARKER,
+    load_terms,
+    render_pages,
+    render_term_page,
+    update_mkdocs_nav,
+    write_docs,
+)
+
+try:
+    import jinja2  # noqa: F401
+except ModuleNotFoundError:  # Jinja2 missing
+    jinja2 = None
+else:
+    from render_docs import render_term_page_template  # noqa: E402
+
+
+@unittest.skipIf(jinja2 is None, "Jinja2 dependency is not installed")
+class TemplateRendererTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        # Keep parse-cache pickles out of the repo's .glossary_cache/.
+        self._cache_tmp = tempfile.TemporaryDirectory()
+        self._previous_cache_dir = os.environ.get(CACHE_DIR_ENV)
+        os.environ[CACHE_DIR_ENV] = self._cache_tmp.name
+
+    def tearDown(self) -> None:
+        if self._previous_cache_dir is None:
+            os.environ.pop(CACHE_DIR_ENV, None)
+        else:
+            os.environ[CACHE_DIR_ENV] = self._previous_cache_dir
+        self._cache_tmp.cleanup()
+
+    def test_template_matches_python_renderer_for_every_term(self) -> None:
+        terms = load_terms(REPO_ROOT / "data" / "terms", workers=1)
+        self.assertTrue(terms)
+        for term in terms:
+            with self.subTest(term=term["slug"]):
+                self.assertEqual(render_term_page_template(term), render_term_page(term))
+
+    def test_template_matches_sparse_and_whitespace_only_fields(self) -> None:
+        term = {
+            "term": " sparse ",
+            "slug": "temperature",
+            "roles": ["unknown_role", "legal"],
+            "categories": ["Unlisted", "Governance & Risk", "Governance & Risk"],
+            "status": "in_review",
+            "short_def": "   ",
+            "audiences": {"exec": " ", "engineer": ""},
+            "examples": {"do": [], "dont": []},
+            "governance": {"risk_notes": " note "},
+            "citations": [{"url": "https://example.com"}, {"source": " Paper "}],
+        }
+        self.assertEqual(render_term_page_template(term), render_term_page(term))
+
+
+class WriteDocsTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._cache_tmp = tempfile.TemporaryDirectory()
+        self._previous_cache_dir = os.environ.get(CACHE_DIR_ENV)
+        os.environ[CACHE_DIR_ENV] = self._cache_tmp.name
+        self._tmp = tempfile.TemporaryDirectory()
+        self.docs_dir = Path(self._tmp.name) / "docs" / "terms"
+        self.terms = load_terms(REPO_ROOT / "data" / "terms", workers=1)[:4]
+
+    def tearDown(self) -> None:
+        if self._previous_cache_dir is None:
+            os.environ.pop(CACHE_DIR_ENV, None)
+        else:
+            os.environ[CACHE_DIR_ENV] = self._previous_cache_dir
+        self._cache_tmp.cleanup()
+        self._tmp.cleanup()
+
+    def _age_files(self) -> dict:
+        """Backdate every generated file and return its mtime, so rewrites are detectable."""
+        stamps = {}
+        for path in Path(self._tmp.name).rglob("*"):
+            if path.is_file():
+                os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+                stamps[path] = path.stat().st_mtime_ns
+        return stamps
+
+    def test_second_render_writes_nothing(self) -> None:
+        first = write_docs(self.terms, self.docs_dir, workers=1)
+        self.assertEqual((first.written, first.skipped, first.deleted), (len(self.terms) + 3, 0, 0))
+        stamps = self._age_files()
+        second = write_docs(self.terms, self.docs_dir, workers=1)
+        self.assertEqual((second.written, second.skipped, second.deleted), (0, len(self.terms) + 3, 0))
+        self.assertEqual({path: path.stat().st_mtime_ns for path in stamps}, stamps)
+
+    def test_edit_rewrites_only_affected_pages(self) -> None:
+        write_docs(self.terms, self.docs_dir, workers=1)
+        before = render_pages(self.terms, self.docs_dir, workers=1)
+        stamps = self._age_files()
+
+        edited = [dict(term) for term in self.terms]
+        edited[1]["short_def"] = "An edited definition used only by this test."
+        after = render_pages(edited, self.docs_dir, workers=1)
+        affected = {path for path, page in after.items() if before[path] != page}
+        self.assertIn(self.docs_dir / f"{edited[1]['slug']}.md", affected)
+
+        report = write_docs(edited, self.docs_dir, workers=1)
+        self.assertEqual(report.written, len(affected))
+        rewritten = {path for path, stamp in stamps.items() if path.stat().st_mtime_ns != stamp}
+        self.assertEqual(rewritten, affected)
+
+    def test_removed_term_page_is_deleted_and_unrelated_files_kept(self) -> None:
+        write_docs(self.terms, self.docs_dir, workers=1)
+        notes = self.docs_dir / "notes.txt"
+        notes.write_text("keep me", encoding="utf-8")
+        sibling = self.docs_dir.parent / "about.md"
+        sibling.write_text("# About", encoding="utf-8")
+
+        removed = self.terms[2]
+        report = write_docs([term for term in self.terms if term is not removed], self.docs_dir, workers=1)
+        self.assertEqual(report.deleted, 1)
+        self.assertFalse((self.docs_dir / f"{removed['slug']}.md").exists())
+        self.assertTrue((self.docs_dir / f"{self.terms[0]['slug']}.md").exists())
+        self.assertEqual(notes.read_text(encoding="utf-8"), "keep me")
+        self.assertEqual(sibling.read_text(encoding="utf-8"), "# About")
+
+    def test_mkdocs_nav_is_rewritten_only_when_it_changes(self) -> None:
+        mkdocs_path = Path(self._tmp.name) / "mkdocs.yml"
+        mkdocs_path.write_text(f"nav:\n  # {NAV_START_MARKER}\n  # {NAV_END_MARKER}\n", encoding="utf-8")
+        update_mkdocs_nav(self.terms, mkdocs_path)
+        content = mkdocs_path.read_text(encoding="utf-8")
+        self.assertIn(f"terms/{self.terms[0]['slug']}.md", content)
+
+        stamps = self._age_files()
+        update_mkdocs_nav(self.terms, mkdocs_path)
+        self.assertEqual(mkdocs_path.stat().st_mtime_ns, stamps[mkdocs_path])
+        update_mkdocs_nav(self.terms[1:], mkdocs_path)
+        self.assertNotEqual(mkdocs_path.stat().st_mtime_ns, stamps[mkdocs_path])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,186 @@
+import unittest
+
+from glossary_utils import BM25Index, FacetIndex, PrefixIndex, SubstringIndex
+from glossary_utils.search import edit_distance
+
+
+DOCUMENTS = {
+    "retrieval-augmented-generation": ["Retrieval-Augmented Generation", "RAG", "Retrieval & RAG"],
+    "guardrails": ["Guardrails", "Safety filters", "Governance & Risk"],
+    "embedding": ["Embedding", None, "Vector representation of text"],
+}
+
+
+class SubstringIndexTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = SubstringIndex(DOCUMENTS)
+
+    def scan(self, query: str) -> list:
+        q = query.lower()
+        return [key for key, values in DOCUMENTS.items() if any(q in (value or "").lower() for value in values)]
+
+    def test_results_match_linear_scan(self) -> None:
+        for query in ("r", "ag", "RAG", "retrieval", "n-aug", "& r", "vector rep", "missing", " ", "s & r"):
+            with self.subTest(query=query):
+                self.assertEqual(self.index.search(query), self.scan(query))
+
+    def test_matches_do_not_span_field_boundaries(self) -> None:
+        # Without a separator the stored fields would read "ragretrieval & rag".
+        self.assertEqual(self.index.search("ragretrieval"), [])
+        self.assertEqual(self.index.search("guardrailssafety"), [])
+
+    def test_duplicate_keys_are_rejected(self) -> None:
+        with self.assertRaises(KeyError):
+            self.index.add("embedding", ["Embedding"])
+
+    def test_replace_matches_a_fresh_build(self) -> None:
+        edited = {"guardrails": ["Guardrails", "Output filters"], "vector": ["Vector store", "Retrieval & RAG"]}
+        updated = self.index.replace({"embedding", "guardrails"}, edited)
+        fresh = SubstringIndex({"retrieval-augmented-generation": DOCUMENTS["retrieval-augmented-generation"], **edited})
+        self.assertEqual(updated._postings, fresh._postings)
+        self.assertEqual(updated.search("r"), ["retrieval-augmented-generation", "guardrails", "vector"])
+        # The source index is left untouched for readers still holding it.
+        self.assertEqual(self.index.search("safety"), ["guardrails"])
+
+    def test_packed_index_matches_the_source(self) -> None:
+        source = self.index.replace({"guardrails"}, {"vector": ["Vector store", "Retrieval & RAG"]})
+        packed = SubstringIndex.from_packed(source.pack())
+        self.assertEqual(len(packed), len(source))
+        for query in ("r", "ag", "RAG", "retrieval", "& r", "vector st", "safety", "", "\x00"):
+            with self.subTest(query=query):
+                self.assertEqual(packed.search(query), source.search(query))
+
+
+class FacetIndexTestCase(unittest.TestCase):
+    def test_lookup_is_case_insensitive_union(self) -> None:
+        index = FacetIndex()
+        index.add("rag", ["LLM Core", "Retrieval & RAG"])
+        index.add("bias", ["Governance & Risk"])
+        self.assertEqual(index.lookup(["llm core"]), {"rag"})
+        self.assertEqual(index.lookup(["RETRIEVAL & RAG", "governance & risk"]), {"rag", "bias"})
+        self.assertEqual(index.lookup([]), set())
+
+    def test_values_keep_original_spelling_sorted(self) -> None:
+        index = FacetIndex()
+        index.add("a", ["Retrieval & RAG"])
+        self.assertEqual(index.values(), ("Retrieval & RAG",))
+        index.add("b", ["Foundations"])
+        self.assertEqual(index.values(), ("Foundations", "Retrieval & RAG"))
+
+    def test_replace_drops_values_no_key_carries_any_more(self) -> None:
+        index = FacetIndex()
+        index.add("rag", ["LLM Core", "Retrieval & RAG"])
+        index.add("bias", ["Governance & Risk", "LLM Core"])
+        updated = index.replace({"bias", "rag"}, {"rag": ["retrieval & rag"]})
+        self.assertEqual(updated.values(), ("retrieval & rag",))
+        self.assertEqual(updated.lookup(["LLM Core", "Retrieval & RAG"]), {"rag"})
+        self.assertEqual(index.lookup(["llm core"]), {"rag", "bias"})
+
+    def test_packed_index_matches_the_source(self) -> None:
+        index = FacetIndex()
+        index.add("rag", ["LLM Core", "Retrieval & RAG"])
+        index.add("bias", ["llm core"])
+        packed = FacetIndex.from_packed(index.pack())
+        self.assertEqual(packed.values(), index.values())
+        self.assertEqual(packed.lookup(["LLM CORE"]), {"rag", "bias"})
+
+
+class BM25IndexTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.documents = {
+            "embedding": {"term": "Embedding", "long_def": "Dense vectors used by retrieval systems."},
+            "rag": {"term": "Retrieval-Augmented Generation", "long_def": "Grounds answers in fetched documents."},
+            "reranking": {"term": "Reranking", "long_def": "Reorders retrieval candidates before generation."},
+        }
+        self.index = BM25Index(self.documents, {"term": 3.0, "long_def": 1.0})
+
+    def test_boosted_field_matches_rank_first(self) -> None:
+        hits = self.index.search("retrieval").hits
+        self.assertEqual(hits[0][0], "rag")
+        self.assertEqual({key for key, _ in hits}, {"rag", "embedding", "reranking"})
+        self.assertEqual([score for _, score in hits], sorted((score for _, score in hits), reverse=True))
+
+    def test_typos_fall_back_to_nearby_words(self) -> None:
+        results = self.index.search("retrieavl")
+        self.assertEqual(results.corrections, {"retrieavl": ["retrieval"]})
+        self.assertEqual(results.hits[0][0], "rag")
+        exact = dict(self.index.search("retrieval").hits)
+        self.assertAlmostEqual(dict(results.hits)["rag"], exact["rag"] * 0.5)
+
+    def test_short_unknown_tokens_are_not_fuzzed(self) -> None:
+        self.assertEqual(self.index.search("rag").hits, [])
+        self.assertEqual(self.index.search("zzzzzzzz").hits, [])
+
+    def test_replace_matches_a_fresh_build(self) -> None:
+        edited = {"rag": {"term": "RAG", "long_def": "Retrieval grounded generation."}}
+        updated = self.index.replace({"embedding", "rag"}, edited)
+        fresh = BM25Index({"reranking": self.documents["reranking"], **edited}, {"term": 3.0, "long_def": 1.0})
+        for query in ("retrieval", "generation", "dense", "retrievl"):
+            with self.subTest(query=query):
+                self.assertEqual(dict(updated.search(query).hits), dict(fresh.search(query).hits))
+                self.assertEqual(updated.search(query).corrections, fresh.search(query).corrections)
+        self.assertEqual(len(updated), 2)
+        self.assertEqual(self.index.search("dense").hits[0][0], "embedding")
+
+    def test_packed_index_matches_the_source(self) -> None:
+        # "dense" leaves the vocabulary, so its stale delete variants must not match.
+        source = self.index.replace({"embedding"}, {})
+        packed = BM25Index.from_packed(source.pack())
+        self.assertEqual(len(packed), 2)
+        for query in ("retrieval", "generation", "retrievl", "dense", "densse", "zzzz"):
+            with self.subTest(query=query):
+                self.assertEqual(packed.search(query), source.search(query))
+        self.assertEqual(packed.search("retrieval", limit=1), source.search("retrieval", limit=1))
+
+    def test_limit_keeps_best_hits(self) -> None:
+        self.assertEqual(self.index.search("retrieval", limit=1).hits, self.index.search("retrieval").hits[:1])
+
+    def test_edit_distance_counts_transpositions_once(self) -> None:
+        self.assertEqual(edit_distance("retrieavl", "retrieval", 2), 1)
+        self.assertEqual(edit_distance("embeddnig", "embedding", 2), 1)
+        self.assertEqual(edit_distance("vector", "matrix", 2), 3)
+
+
+class PrefixIndexTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = PrefixIndex(
+            [
+                ("Retrieval-Augmented Generation", "rag"),
+                ("RAG", "rag"),
+                ("Reranking", "reranking"),
+                ("Re-ranking", "reranking"),
+                ("Embedding", "embedding"),
+            ]
+        )
+
+    def test_complete_folds_case_and_punctuation(self) -> None:
+        self.assertEqual(self.index.complete("retrieval augm"), [("rag", "Retrieval-Augmented Generation")])
+        self.assertEqual(self.index.complete("re-r"), [("reranking", "Re-ranking")])
+
+    def test_complete_returns_each_key_once_up_to_limit(self) -> None:
+        self.assertEqual([key for key, _ in self.index.complete("r")], ["rag", "reranking"])
+        self.assertEqual(len(self.index.complete("r", limit=1)), 1)
+        self.assertEqual(self.index.complete("   "), [])
+
+    def test_replace_matches_a_fresh_build(self) -> None:
+        updated = self.index.replace({"rag", "vector"}, [("RAG", "rag"), ("Vector store", "vector")])
+        fresh = PrefixIndex(
+            [
+                ("RAG", "rag"),
+                ("Reranking", "reranking"),
+                ("Re-ranking", "reranking"),
+                ("Embedding", "embedding"),
+                ("Vector store", "vector"),
+            ]
+        )
+        self.assertEqual(updated._rows, fresh._rows)
+
+    def test_packed_index_matches_the_source(self) -> None:
+        packed = PrefixIndex.from_packed(self.index.pack())
+        self.assertEqual(packed._rows, self.index._rows)
+        self.assertEqual(packed.complete("re"), self.index.complete("re"))
+        self.assertEqual(self.index.complete("retr"), [("rag", "Retrieval-Augmented Generation")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import gzip
+import unittest
+
+from glossary_utils import compact_search_index, expand_search_index, shard_search_index
+from glossary_utils.search_assets import (
+    ClientIndexReader,
+    build_client_index,
+    expand_rows,
+    ordered_records,
+    precompressed_variants,
+    shard_key,
+)
+
+RECORDS = [
+    {
+        "term": "Retrieval-Augmented Generation",
+        "aliases": ["RAG"],
+        "categories": ["Retrieval & RAG", "LLM Core"],
+        "roles": ["engineering"],
+        "short_def": "Grounds answers in retrieved documents.",
+        "nist_rmf_tags": ["MAP"],
+        "status": "approved",
+        "last_reviewed": "2024-05-01",
+        "slug": "retrieval-augmented-generation",
+    },
+    {
+        "term": "guardrails",
+        "aliases": [],
+        "categories": ["Governance & Risk"],
+        "roles": ["policy", "engineering"],
+        "short_def": None,
+        "nist_rmf_tags": [],
+        "status": None,
+        "last_reviewed": None,
+        "slug": "guardrails",
+    },
+    {
+        "term": "3D attention",
+        "aliases": [],
+        "categories": [],
+        "roles": [],
+        "short_def": "",
+        "nist_rmf_tags": [],
+        "status": "draft",
+        "last_reviewed": "2024-01-01",
+        "slug": "3d-attention",
+    },
+]
+
+
+class SearchAssetsTestCase(unittest.TestCase):
+    def test_compact_round_trips_and_interns_repeated_strings(self) -> None:
+        compact = compact_search_index(RECORDS)
+        self.assertEqual(expand_search_index(compact), RECORDS)
+        self.assertEqual(compact["tables"]["roles"], ["engineering", "policy"])
+        self.assertEqual(compact["terms"][1][3], [1, 0])
+
+    def test_shards_partition_records_and_share_tables(self) -> None:
+        expected_keys = {
+            "letter": ["0-9", "g", "r"],
+            "category": ["governance-risk", "retrieval-rag", "uncategorized"],
+        }
+        for mode, keys in expected_keys.items():
+            manifest, shards = shard_search_index(RECORDS, mode)
+            self.assertEqual([shard["key"] for shard in manifest["shards"]], keys)
+            expanded = [record for rows in shards.values() for record in expand_rows(manifest, rows)]
+            self.assertCountEqual([record["slug"] for record in expanded], [record["slug"] for record in RECORDS])
+        self.assertEqual(shard_key(RECORDS[0], "category"), "retrieval-rag")
+
+    def test_non_string_values_are_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            compact_search_index([{"status": 3}])
+
+    def test_gzip_variant_is_deterministic(self) -> None:
+        data = b'{"terms":[]}' * 10
+        first, second = precompressed_variants(data), precompressed_variants(data)
+        self.assertEqual(first[".gz"], second[".gz"])
+        self.assertEqual(gzip.decompress(first[".gz"]), data)
+
+    def test_client_index_matches_token_prefixes(self) -> None:
+        index = build_client_index(RECORDS)
+        self.assertEqual(index["terms"], 3)
+        self.assertEqual(index["tokens"], sorted(index["tokens"]))
+        reader = ClientIndexReader(index)
+        self.assertEqual(reader.search("retr"), [0])
+        self.assertEqual(reader.search("RAG grounds"), [0])
+        self.assertEqual(reader.search("guard governance"), [1])
+        self.assertEqual(reader.search("3d"), [2])
+        # Without prefix hits (a missing word, a mid-word fragment) the page scans instead.
+        self.assertIsNone(reader.search("rag missing"))
+        self.assertIsNone(reader.search("trieval"))
+        self.assertIsNone(reader.search("&&"))
+
+    def test_client_index_doc_ids_follow_shard_order(self) -> None:
+        ordered = ordered_records(RECORDS, "letter")
+        manifest, shards = shard_search_index(RECORDS, "letter")
+        loaded = [record for rows in shards.values() for record in expand_rows(manifest, rows)]
+        self.assertEqual([record["slug"] for record in ordered], [record["slug"] for record in loaded])
+        reader = ClientIndexReader(build_client_index(ordered))
+        self.assertEqual([loaded[doc_id]["slug"] for doc_id in reader.search("guardrails")], ["guardrails"])
+
+
+if __name__ == "__main__":
+    unittest.main()
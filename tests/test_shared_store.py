@@ -0,0 +1,68 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from glossary_utils import SharedTermMap, SharedTermReader, publish_terms, try_acquire_publisher
+from glossary_utils.shared_store import fcntl
+
+
+TERMS = {
+    "rag": {"term": "RAG", "aliases": ["Retrieval-Augmented Generation"], "short_def": "Grounded généré text."},
+    "embedding": {"term": "Embedding", "aliases": [], "short_def": "Vector representation."},
+}
+
+
+class SharedStoreTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_mapping_round_trips_terms_in_order(self) -> None:
+        generation = publish_terms(self.directory, TERMS)
+        mapping = SharedTermMap.open(self.directory, generation)
+        self.assertEqual(list(mapping), ["rag", "embedding"])
+        self.assertEqual(dict(mapping), TERMS)
+        self.assertIn("rag", mapping)
+        self.assertIsNone(mapping.get("missing"))
+        self.assertEqual(json.loads(mapping.encoded.array()), list(TERMS.values()))
+        self.assertEqual(json.loads(mapping.encoded.join(["embedding"])), [TERMS["embedding"]])
+
+    def test_extra_sections_are_mapped_next_to_the_terms(self) -> None:
+        generation = publish_terms(self.directory, TERMS, sections={"index": b"\x00packed", "empty": b""})
+        mapping = SharedTermMap.open(self.directory, generation)
+        sections = {name: bytes(view) for name, view in mapping.sections.items()}
+        self.assertEqual(sections, {"index": b"\x00packed", "empty": b""})
+        self.assertEqual(dict(mapping), TERMS)
+
+    def test_reader_follows_new_generations(self) -> None:
+        reader = SharedTermReader(self.directory, lambda mapping: sorted(mapping), check_interval=0)
+        self.assertIsNone(reader.current())
+
+        publish_terms(self.directory, TERMS)
+        self.assertEqual(reader.current(), ["embedding", "rag"])
+        first = reader.generation
+
+        publish_terms(self.directory, {"guardrails": {"term": "Guardrails"}})
+        publish_terms(self.directory, {"guardrails": {"term": "Guardrails"}, "rag": TERMS["rag"]})
+        self.assertEqual(reader.current(), ["guardrails", "rag"])
+        self.assertEqual(reader.generation, first + 2)
+        # Only the current and previous generations are kept on disk.
+        self.assertEqual(len(list(self.directory.glob("terms-*.bin"))), 2)
+
+    @unittest.skipIf(fcntl is None, "publisher election needs fcntl")
+    def test_only_one_publisher_is_elected(self) -> None:
+        first = try_acquire_publisher(self.directory)
+        self.assertIsNotNone(first)
+        self.assertIsNone(try_acquire_publisher(self.directory))
+        first.close()
+        second = try_acquire_publisher(self.directory)
+        self.assertIsNotNone(second)
+        second.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
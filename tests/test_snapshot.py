@@ -0,0 +1,57 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from glossary_utils import load_snapshot, safe_load_path, write_snapshot
+
+
+class SnapshotTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        root = Path(self._tmp.name)
+        self.data_dir = root / "terms"
+        self.data_dir.mkdir()
+        self.snapshot_path = root / "build" / "terms.snapshot"
+        for name in ("alpha", "beta"):
+            (self.data_dir / f"{name}.yml").write_text(f"term: {name}\naliases: [{name.upper()}]\n", encoding="utf-8")
+        sources = {path: safe_load_path(path) for path in sorted(self.data_dir.glob("*.yml"))}
+        write_snapshot(self.snapshot_path, self.data_dir, sources)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_fresh_snapshot_round_trips(self) -> None:
+        loaded = load_snapshot(self.snapshot_path, self.data_dir)
+        self.assertIsNotNone(loaded)
+        stamps, entries = loaded
+        self.assertEqual(list(entries), [self.data_dir / "alpha.yml", self.data_dir / "beta.yml"])
+        self.assertEqual(entries[self.data_dir / "beta.yml"], {"term": "beta", "aliases": ["BETA"]})
+        self.assertEqual(set(stamps), set(entries))
+
+    def test_touched_but_identical_file_is_still_fresh(self) -> None:
+        path = self.data_dir / "alpha.yml"
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+        self.assertIsNotNone(load_snapshot(self.snapshot_path, self.data_dir))
+
+    def test_edited_added_or_removed_files_make_it_stale(self) -> None:
+        (self.data_dir / "alpha.yml").write_text("term: alpha\naliases: [ALFA]\n", encoding="utf-8")
+        self.assertIsNone(load_snapshot(self.snapshot_path, self.data_dir))
+
+        (self.data_dir / "alpha.yml").write_text("term: alpha\naliases: [ALPHA]\n", encoding="utf-8")
+        (self.data_dir / "gamma.yml").write_text("term: gamma\n", encoding="utf-8")
+        self.assertIsNone(load_snapshot(self.snapshot_path, self.data_dir))
+
+        (self.data_dir / "gamma.yml").unlink()
+        (self.data_dir / "beta.yml").unlink()
+        self.assertIsNone(load_snapshot(self.snapshot_path, self.data_dir))
+
+    def test_corrupt_or_missing_snapshot_is_ignored(self) -> None:
+        self.snapshot_path.write_bytes(self.snapshot_path.read_bytes()[:-10])
+        self.assertIsNone(load_snapshot(self.snapshot_path, self.data_dir))
+        self.assertIsNone(load_snapshot(self.snapshot_path.with_name("missing"), self.data_dir))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from glossary_utils import TermStore, safe_load_path, term_store
+
+
+class TermStoreTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.data_dir = Path(self._tmp.name)
+        self.loaded: list = []
+        for name in ("alpha", "beta", "gamma"):
+            self.write(name, f"term: {name}\n")
+        self.store = TermStore(self.data_dir, build=self.build, loader=self.load)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def write(self, name: str, content: str) -> None:
+        path = self.data_dir / f"{name}.yml"
+        path.write_text(content, encoding="utf-8")
+        # Bump the mtime explicitly so coarse filesystem clocks cannot hide an edit.
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def load(self, path: Path) -> dict:
+        self.loaded.append(path.stem)
+        return safe_load_path(path)
+
+    @staticmethod
+    def build(entries) -> list:
+        return [entry["term"] for entry in entries.values()]
+
+    def test_first_use_loads_every_file(self) -> None:
+        self.assertEqual(self.store.current(), ["alpha", "beta", "gamma"])
+        self.assertEqual(sorted(self.loaded), ["alpha", "beta", "gamma"])
+
+    def test_reloads_never_fork_worker_processes(self) -> None:
+        with mock.patch.object(term_store, "load_paths", wraps=term_store.load_paths) as load_paths:
+            self.store.refresh()
+        self.assertNotEqual(load_paths.call_args.kwargs["mp_context"].get_start_method(), "fork")
+
+    def test_refresh_reparses_only_changed_files(self) -> None:
+        first = self.store.snapshot()
+        self.loaded.clear()
+
+        self.write("beta", "term: beta two\n")
+        self.write("delta", "term: delta\n")
+        (self.data_dir / "gamma.yml").unlink()
+        result = self.store.refresh()
+
+        self.assertEqual(sorted(self.loaded), ["beta", "delta"])
+        self.assertEqual([path.stem for path in result.added], ["delta"])
+        self.assertEqual([path.stem for path in result.modified], ["beta"])
+        self.assertEqual([path.stem for path in result.removed], ["gamma"])
+        self.assertEqual(self.store.current(), ["alpha", "beta two", "delta"])
+        # Readers holding the earlier snapshot keep a consistent view.
+        self.assertEqual(first.view, ["alpha", "beta", "gamma"])
+        self.assertEqual(result.generation, first.generation + 1)
+
+    def test_unchanged_refresh_keeps_snapshot(self) -> None:
+        first = self.store.snapshot()
+        self.loaded.clear()
+        result = self.store.refresh()
+        self.assertFalse(result.changed)
+        self.assertEqual(self.loaded, [])
+        self.assertIs(self.store.snapshot(), first)
+
+    def test_forced_refresh_reparses_everything(self) -> None:
+        self.store.snapshot()
+        self.loaded.clear()
+        result = self.store.refresh(force=True)
+        self.assertEqual(sorted(self.loaded), ["alpha", "beta", "gamma"])
+        self.assertEqual(len(result.modified), 3)
+
+    def test_bootstrap_seeds_first_load_without_parsing(self) -> None:
+        stamps = self.store._scan()
+        entries = {path: {"term": f"{path.stem} (snapshot)"} for path in stamps}
+        store = TermStore(self.data_dir, build=self.build, loader=self.load, bootstrap=lambda: (stamps, entries))
+        self.assertEqual(store.current(), ["alpha (snapshot)", "beta (snapshot)", "gamma (snapshot)"])
+        self.assertEqual(self.loaded, [])
+
+        self.write("beta", "term: beta two\n")
+        store.refresh()
+        self.assertEqual(self.loaded, ["beta"])
+        self.assertEqual(store.current(), ["alpha (snapshot)", "beta two", "gamma (snapshot)"])
+
+    def test_stale_bootstrap_falls_back_to_parsing(self) -> None:
+        store = TermStore(self.data_dir, build=self.build, loader=self.load, bootstrap=lambda: None)
+        self.assertEqual(store.current(), ["alpha", "beta", "gamma"])
+        self.assertEqual(sorted(self.loaded), ["alpha", "beta", "gamma"])
+
+    def test_update_hook_patches_previous_view_on_reload(self) -> None:
+        calls = []
+
+        def update(previous, entries, changes):
+            calls.append((previous.view, [path.stem for path in changes.modified]))
+            return self.build(entries)
+
+        store = TermStore(self.data_dir, build=self.build, loader=self.load, update=update)
+        store.current()
+        self.write("beta", "term: beta2\n")
+        store.refresh()
+        self.assertEqual(calls, [(["alpha", "beta", "gamma"], ["beta"])])
+        self.assertEqual(store.current(), ["alpha", "beta2", "gamma"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,8 @@ import unittest
 from pathlib import Path
 
 from glossary_utils import safe_load, safe_load_path
+from glossary_utils import simple_yaml
+from glossary_utils.simple_yaml import SimpleYAMLParser
 
 
 class YamlParsingTestCase(unittest.TestCase):
@@ -25,6 +27,48 @@ class YamlParsingTestCase(unittest.TestCase):
                 dont_examples = payload["examples"]["dont"]
                 self.assertEqual(dont_examples, [expected])
 
+    def test_fallback_parser_handles_mappings_nested_in_sequences(self) -> None:
+        content = (
+            "term: example\n"
+            "long_def: >\n"
+            "  First line\n"
+            "  continues.\n"
+            "\n"
+            "  Second paragraph.\n"
+            "citations:\n"
+            "  - title: Paper\n"
+            "    url: https://example.com/a\n"
+            "    authors:\n"
+            "      - name: Ada\n"
+            "        orcid: 1\n"
+            "      - name: Grace\n"
+            "  - title: Book\n"
+            "aliases:\n"
+            "  - Example\n"
+        )
+        self.assertEqual(
+            SimpleYAMLParser.from_text(content).parse(),
+            {
+                "term": "example",
+                "long_def": "First line continues.\n\nSecond paragraph.",
+                "citations": [
+                    {
+                        "title": "Paper",
+                        "url": "https://example.com/a",
+                        "authors": [{"name": "Ada", "orcid": 1}, {"name": "Grace"}],
+                    },
+                    {"title": "Book"},
+                ],
+                "aliases": ["Example"],
+            },
+        )
+
+    @unittest.skipIf(simple_yaml.yaml is None, "PyYAML is not installed")
+    def test_prefers_libyaml_loader_when_available(self) -> None:
+        yaml = simple_yaml.yaml
+        expected = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+        self.assertIs(simple_yaml.SafeLoader, expected)
+
 
 if __name__ == "__main__":
     unittest.main()